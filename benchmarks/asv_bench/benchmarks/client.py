@@ -0,0 +1,179 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import maxframe.dataframe as md
+import maxframe.tensor as mt
+from maxframe.session import new_session
+from maxframe_client.tests.local_framedriver import (
+    LocalFrameDriver,
+    local_storage,
+    new_local_odps_entry,
+)
+
+_RESULT_COLUMNS = list("abcd")
+
+
+def _build_dataframe(n_operators: int, n_rows: int = 10):
+    """
+    Build a DataFrame with about `n_operators` operators in its graph. Branches
+    are kept shallow as deep graphs cannot be serialized.
+    """
+    df = md.DataFrame(mt.random.rand(n_rows, 4), columns=_RESULT_COLUMNS)
+    n_branches = max(n_operators - 3, 1)
+    return md.concat([df + i for i in range(n_branches)])
+
+
+class _LocalServiceMixin:
+    dag_delay = 0.0
+
+    def _setup_service(self):
+        self._stack = contextlib.ExitStack()
+        self._tempdir = self._stack.enter_context(tempfile.TemporaryDirectory())
+        self._driver = self._stack.enter_context(LocalFrameDriver(self.dag_delay))
+        self._stack.enter_context(local_storage(self._tempdir))
+        self._session = new_session(
+            self._driver.address, odps_entry=new_local_odps_entry(), default=False
+        )
+
+    def _teardown_service(self):
+        self._session.destroy()
+        self._stack.close()
+
+    def _stage(self, tileable):
+        n_rows = tileable.shape[0]
+        data = pd.DataFrame(np.random.rand(n_rows, 4), columns=_RESULT_COLUMNS)
+        return self._driver.stage_dataframe_result(tileable, data, self._tempdir)
+
+
+class ClientExecuteSuite(_LocalServiceMixin):
+    """
+    Benchmark client overhead of executing graphs, including graph
+    building, serialization, submission and polling.
+    """
+
+    params = [10, 100, 1000, 10000]
+    param_names = ["n_operators"]
+    timeout = 1200
+
+    def setup(self, n_operators: int):
+        self._setup_service()
+        self._staged_info = None
+
+    def teardown(self, n_operators: int):
+        self._teardown_service()
+
+    def _execute(self, n_operators: int):
+        df = _build_dataframe(n_operators)
+        if self._staged_info is None:
+            self._staged_info = self._stage(df)
+        else:
+            self._driver.stage_result(df.key, self._staged_info)
+        info = df.execute(session=self._session, wait=False)
+        info.result()
+        return info
+
+    def _get_stage_duration(self, n_operators: int, stage_name: str) -> float:
+        stages = self._execute(n_operators).profiling_result()["stages"]
+        return sum(s["duration"] for s in stages if s["name"] == stage_name)
+
+    def time_execute(self, n_operators: int):
+        self._execute(n_operators)
+
+    def track_build_graph(self, n_operators: int):
+        return self._get_stage_duration(n_operators, "build_graph")
+
+    track_build_graph.unit = "seconds"
+
+    def track_serialize(self, n_operators: int):
+        return self._get_stage_duration(n_operators, "serialize")
+
+    track_serialize.unit = "seconds"
+
+    def track_submit(self, n_operators: int):
+        return self._get_stage_duration(n_operators, "submit")
+
+    track_submit.unit = "seconds"
+
+    def track_wait(self, n_operators: int):
+        return self._get_stage_duration(n_operators, "wait")
+
+    track_wait.unit = "seconds"
+
+    def track_submitted_bytes(self, n_operators: int):
+        stages = self._execute(n_operators).profiling_result()["stages"]
+        return sum(s["bytes"] for s in stages if s["name"] == "serialize")
+
+    track_submitted_bytes.unit = "bytes"
+
+
+class ClientPollSuite(_LocalServiceMixin):
+    """
+    Benchmark extra latency of polling DAG status when DAGs take
+    some time to finish.
+    """
+
+    params = [0.1, 1.0, 5.0]
+    param_names = ["dag_delay"]
+    timeout = 600
+
+    def setup(self, dag_delay: float):
+        self.dag_delay = dag_delay
+        self._setup_service()
+
+    def teardown(self, dag_delay: float):
+        self._teardown_service()
+
+    def track_wait_overhead(self, dag_delay: float):
+        df = _build_dataframe(10)
+        self._driver.stage_result(df.key, self._stage(df))
+        start = time.perf_counter()
+        df.execute(session=self._session)
+        return time.perf_counter() - start - dag_delay
+
+    track_wait_overhead.unit = "seconds"
+
+
+class ClientFetchSuite(_LocalServiceMixin):
+    """
+    Benchmark throughput of fetching results from table storages.
+    """
+
+    params = [1000, 100000, 1000000]
+    param_names = ["n_rows"]
+    timeout = 600
+
+    def setup(self, n_rows: int):
+        self._setup_service()
+        self._df = _build_dataframe(1, n_rows)
+        self._stage(self._df)
+        self._df.execute(session=self._session)
+
+    def teardown(self, n_rows: int):
+        self._teardown_service()
+
+    def time_fetch(self, n_rows: int):
+        self._df.fetch(session=self._session)
+
+    def time_fetch_slice(self, n_rows: int):
+        self._df.iloc[n_rows // 4 : n_rows // 2].fetch(session=self._session)
+
+    def peakmem_fetch(self, n_rows: int):
+        self._df.fetch(session=self._session)
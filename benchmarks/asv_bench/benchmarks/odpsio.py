@@ -0,0 +1,61 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from maxframe.io.odpsio import arrow_to_pandas, pandas_to_arrow
+
+_N_COLUMNS = 10
+
+
+class ArrowToPandasSuite:
+    """
+    Benchmark converting fetched arrow tables into pandas objects. Tables
+    are consumed when `self_destruct` is True, thus every sample is taken
+    on a newly-built table. Columns are copied after conversion when
+    `writable` is True.
+    """
+
+    params = ([100000, 1000000, 4000000], [False, True], [False, True])
+    param_names = ["n_rows", "self_destruct", "writable"]
+    number = 1
+    repeat = 5
+    timeout = 600
+
+    def setup(self, n_rows: int, self_destruct: bool, writable: bool):
+        columns = [f"c{idx}" for idx in range(_N_COLUMNS)]
+        _, self._meta = pandas_to_arrow(
+            pd.DataFrame(np.random.rand(1, _N_COLUMNS), columns=columns)
+        )
+        arrays = [pa.array(np.arange(n_rows))] + [
+            pa.array(np.random.rand(n_rows)) for _ in columns
+        ]
+        self._table = pa.Table.from_arrays(
+            arrays, names=["_idx_0"] + [c.lower() for c in columns]
+        )
+
+    def teardown(self, n_rows: int, self_destruct: bool, writable: bool):
+        self._table = None
+
+    def time_arrow_to_pandas(self, n_rows: int, self_destruct: bool, writable: bool):
+        arrow_to_pandas(
+            self._table, self._meta, self_destruct=self_destruct, writable=writable
+        )
+
+    def peakmem_arrow_to_pandas(self, n_rows: int, self_destruct: bool, writable: bool):
+        arrow_to_pandas(
+            self._table, self._meta, self_destruct=self_destruct, writable=writable
+        )
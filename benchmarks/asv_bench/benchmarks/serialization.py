@@ -0,0 +1,60 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+
+from maxframe.serialization import deserialize, serialize
+from maxframe.serialization.pandas import PANDAS_ARROW_SERIALIZER_NAME
+
+
+def _build_mixed_dataframe(n_rows: int) -> pd.DataFrame:
+    rs = np.random.RandomState(0)
+    return pd.DataFrame(
+        {
+            "int_col": rs.randint(0, 1000, size=n_rows),
+            "float_col": rs.rand(n_rows),
+            "bool_col": rs.rand(n_rows) > 0.5,
+            "str_col": np.array([f"s{idx}" for idx in range(n_rows)], dtype=object),
+            "cat_col": pd.Categorical(rs.choice(list("abcd"), size=n_rows)),
+            "dt_col": pd.date_range("2020-01-01", periods=n_rows, freq="s"),
+        }
+    )
+
+
+class PandasSerializationSuite:
+    """
+    Benchmark serializing mixed DataFrames embedded in DAGs with default
+    pandas serializers and with arrow IPC serializer.
+    """
+
+    params = ([100000, 1000000], ["default", PANDAS_ARROW_SERIALIZER_NAME])
+    param_names = ["n_rows", "serializer"]
+    timeout = 600
+
+    def setup(self, n_rows: int, serializer: str):
+        self._df = _build_mixed_dataframe(n_rows)
+        self._context = {} if serializer == "default" else {"serializer": serializer}
+        self._serialized = serialize(self._df, dict(self._context))
+
+    def teardown(self, n_rows: int, serializer: str):
+        self._df = self._serialized = None
+
+    def time_serialize(self, n_rows: int, serializer: str):
+        serialize(self._df, dict(self._context))
+
+    def time_deserialize(self, n_rows: int, serializer: str):
+        deserialize(*self._serialized)
+
+    def peakmem_deserialize(self, n_rows: int, serializer: str):
+        deserialize(*self._serialized)
@@ -41,6 +41,7 @@ from .validators import (
     is_non_negative_integer,
     is_null,
     is_numeric,
+    is_positive_integer,
     is_string,
     is_valid_cache_path,
 )
@@ -53,9 +54,17 @@ _DEFAULT_MAX_IDLE_SECONDS = 3600
 _DEFAULT_SPE_OPERATION_TIMEOUT_SECONDS = 120
 _DEFAULT_SPE_FAILURE_RETRY_TIMES = 5
 _DEFAULT_UPLOAD_BATCH_SIZE = 4096
+_DEFAULT_UPLOAD_CONCURRENCY = 4
+_DEFAULT_FETCH_CONCURRENCY = 4
+_DEFAULT_FETCH_TILEABLE_CONCURRENCY = 4
+_DEFAULT_FETCH_MEMORY_BUDGET = 4 * 1024**3
+_DEFAULT_FETCH_CACHE_SIZE = 1024**3
+_DEFAULT_TENSOR_CHUNK_BYTES = 64 * 1024**2
+_DEFAULT_ODPS_META_CACHE_TTL = 600
 _DEFAULT_TEMP_LIFECYCLE = 1
 _DEFAULT_TASK_START_TIMEOUT = 60
 _DEFAULT_TASK_RESTART_TIMEOUT = 300
+_DEFAULT_DAG_WAIT_TIMEOUT = 10
 _DEFAULT_LOGVIEW_HOURS = 24 * 30
 
 
@@ -346,6 +355,18 @@ default_options.register_option(
 default_options.register_option(
     "client.task_restart_timeout", _DEFAULT_TASK_RESTART_TIMEOUT, validator=is_integer
 )
+default_options.register_option(
+    "client.dag_wait_timeout", _DEFAULT_DAG_WAIT_TIMEOUT, validator=is_numeric
+)
+default_options.register_option(
+    "client.dag_compression",
+    None,
+    validator=is_null | is_in(["gzip", "lz4", "zstd"]),
+)
+default_options.register_option(
+    "client.dag_volume_threshold", None, validator=is_null | is_non_negative_integer
+)
+default_options.register_option("client.log_profiling", False, validator=is_bool)
 default_options.register_option("sql.enable_mcqa", True, validator=is_bool, remote=True)
 default_options.register_option(
     "sql.generate_comments", True, validator=is_bool, remote=True
@@ -398,6 +419,64 @@ default_options.register_option(
     _DEFAULT_UPLOAD_BATCH_SIZE,
     validator=is_integer,
 )
+default_options.register_option(
+    "session.upload_concurrency",
+    _DEFAULT_UPLOAD_CONCURRENCY,
+    validator=is_positive_integer,
+)
+default_options.register_option("session.enable_upload_cache", True, validator=is_bool)
+default_options.register_option(
+    "session.fetch_concurrency",
+    _DEFAULT_FETCH_CONCURRENCY,
+    validator=is_positive_integer,
+)
+default_options.register_option(
+    "session.fetch_tileable_concurrency",
+    _DEFAULT_FETCH_TILEABLE_CONCURRENCY,
+    validator=is_positive_integer,
+)
+default_options.register_option(
+    "session.fetch_memory_budget",
+    _DEFAULT_FETCH_MEMORY_BUDGET,
+    validator=is_null | is_positive_integer,
+)
+# tensors are stored in legacy pickled layout unless specified, as
+#  readers of older versions cannot read chunked raw buffers
+default_options.register_option(
+    "session.tensor_chunked_layout", False, validator=is_bool
+)
+default_options.register_option(
+    "session.tensor_chunk_bytes",
+    _DEFAULT_TENSOR_CHUNK_BYTES,
+    validator=is_positive_integer,
+)
+default_options.register_option(
+    "session.tensor_compression",
+    None,
+    validator=is_null | is_in(["gzip", "lz4", "zstd"]),
+)
+# fetched results share read-only memory with arrow tables unless specified
+#  or pandas copy-on-write is enabled
+default_options.register_option(
+    "session.writable_fetch_results", False, validator=is_bool
+)
+default_options.register_option("session.enable_fetch_cache", False, validator=is_bool)
+default_options.register_option(
+    "session.fetch_cache_dir", None, validator=is_null | is_string
+)
+default_options.register_option(
+    "session.fetch_cache_size",
+    _DEFAULT_FETCH_CACHE_SIZE,
+    validator=is_positive_integer,
+)
+default_options.register_option(
+    "session.odps_meta_cache_ttl",
+    _DEFAULT_ODPS_META_CACHE_TTL,
+    validator=is_null | is_numeric,
+)
+default_options.register_option(
+    "session.enable_delta_submission", False, validator=is_bool
+)
 default_options.register_option(
     "session.table_lifecycle", None, validator=is_null | is_integer, remote=True
 )
@@ -17,6 +17,8 @@ import atexit
 import concurrent.futures
 import queue
 import threading
+import time
+from collections import defaultdict
 from typing import List
 from weakref import WeakKeyDictionary, ref
 
@@ -26,9 +28,11 @@ from ..mode import enter_mode
 
 
 class DecrefRunner:
-    def __init__(self):
+    def __init__(self, batch_interval: float = 0.05):
         self._decref_thread = None
         self._queue = queue.Queue()
+        # keys put within the interval are sent in one decref call
+        self._batch_interval = batch_interval
 
     def start(self):
         self._decref_thread = threading.Thread(
@@ -37,30 +41,68 @@ class DecrefRunner:
         self._decref_thread.daemon = True
         self._decref_thread.start()
 
-    def _thread_body(self):
-        from ...session import SyncSession
-
-        while True:
-            key, session_ref, fut = self._queue.get()
-            if key is None:
+    def _collect_batch(self) -> list:
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self._batch_interval
+        # items without keys are stop or flush requests which end the batch
+        while items[-1][0] is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
                 break
-
-            session = session_ref()
-            if session is None or session.closed:
-                fut.set_result(None)
-                continue
             try:
+                items.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return items
+
+    @staticmethod
+    def _decref_session(
+        session, keys: List[str], futs: List[concurrent.futures.Future]
+    ):
+        from ...session import SyncSession
+
+        try:
+            if not session.closed:
                 s = SyncSession.from_isolated_session(session)
-                s.decref(key)
-                fut.set_result(None)
-            except (RuntimeError, ConnectionError, KeyError):
-                fut.set_result(None)
-            except (
-                Exception
-            ) as ex:  # pragma: no cover  # noqa: E722  # nosec  # pylint: disable=bare-except
+                s.decref(*keys)
+        except (RuntimeError, ConnectionError, KeyError):
+            pass
+        except (
+            Exception
+        ) as ex:  # pragma: no cover  # noqa: E722  # nosec  # pylint: disable=bare-except
+            for fut in futs:
                 fut.set_exception(ex)
-            finally:
-                del session
+            return
+        for fut in futs:
+            fut.set_result(None)
+
+    def _thread_body(self):
+        while True:
+            items = self._collect_batch()
+            stopped = any(key is None and fut is None for key, _, fut in items)
+            flush_futs = [fut for key, _, fut in items if key is None and fut]
+
+            # group keys by sessions to send them in one call
+            session_id_to_items = defaultdict(list)
+            for key, session_ref, fut in items:
+                if key is not None:
+                    session = session_ref()
+                    if session is None:
+                        fut.set_result(None)
+                    else:
+                        session_id_to_items[id(session)].append((session, key, fut))
+            session = None
+
+            while session_id_to_items:
+                _, session_items = session_id_to_items.popitem()
+                sessions, keys, futs = zip(*session_items)
+                self._decref_session(sessions[0], list(keys), list(futs))
+                del sessions, session_items
+
+            for fut in flush_futs:
+                fut.set_result(None)
+            if stopped:
+                break
 
     def stop(self):
         if self._decref_thread:  # pragma: no branch
@@ -76,11 +118,31 @@ class DecrefRunner:
         self._queue.put_nowait((key, session_ref, fut))
         return fut
 
+    def flush(self) -> concurrent.futures.Future:
+        """
+        Send decref requests put before immediately. The returned future
+        is resolved when these requests are sent.
+        """
+        fut = concurrent.futures.Future()
+        if self._decref_thread is None:
+            fut.set_result(None)
+        else:
+            self._queue.put_nowait((None, None, fut))
+        return fut
+
 
 _decref_runner = DecrefRunner()
 atexit.register(_decref_runner.stop)
 
 
+def flush_decref() -> concurrent.futures.Future:
+    """
+    Send pending decref requests immediately. The returned future is
+    resolved when these requests are sent.
+    """
+    return _decref_runner.flush()
+
+
 class _TileableSession:
     def __init__(self, tileable: TileableType, session: SessionType):
         self._sess_id = id(session)
@@ -88,22 +150,14 @@ class _TileableSession:
 
         def cb(_, sess=ref(session)):
             try:
-                cur_thread_ident = threading.current_thread().ident
-                decref_in_isolation = get_isolation().thread_ident == cur_thread_ident
+                get_isolation()
             except KeyError:
                 # isolation destroyed, no need to decref
                 return
 
-            fut = _decref_runner.put(key, sess)
-            if not decref_in_isolation:
-                # if decref in isolation, means that this tileable
-                # is not required for main thread, thus we do not need
-                # to wait for decref, otherwise, wait a bit
-                try:
-                    fut.result(0.5)
-                except concurrent.futures.TimeoutError:
-                    # ignore timeout
-                    pass
+            # decref requests are sent in batches and will be flushed
+            # when sessions are closed, thus we do not need to wait here
+            _decref_runner.put(key, sess)
 
         self.tileable = ref(tileable, cb)
 
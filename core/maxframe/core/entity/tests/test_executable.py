@@ -0,0 +1,61 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import weakref
+
+import mock
+
+from ....session import SyncSession
+from ..executable import DecrefRunner
+
+
+class MockSession:
+    def __init__(self):
+        self.closed = False
+        self.decref_calls = []
+
+
+class MockSyncSession:
+    def __init__(self, session: MockSession):
+        self._session = session
+
+    def decref(self, *tileable_keys):
+        self._session.decref_calls.append(list(tileable_keys))
+
+
+def test_decref_runner_batches():
+    runner = DecrefRunner(batch_interval=1)
+    sessions = [MockSession(), MockSession()]
+    closed_session = MockSession()
+    closed_session.closed = True
+
+    with mock.patch.object(SyncSession, "from_isolated_session", new=MockSyncSession):
+        try:
+            futs = [
+                runner.put(f"key{i}", weakref.ref(sessions[i % 2])) for i in range(10)
+            ]
+            futs.append(runner.put("closed_key", weakref.ref(closed_session)))
+            runner.flush().result(timeout=1)
+            assert all(fut.done() for fut in futs)
+        finally:
+            runner.stop()
+
+    assert sessions[0].decref_calls == [[f"key{i}" for i in range(0, 10, 2)]]
+    assert sessions[1].decref_calls == [[f"key{i}" for i in range(1, 10, 2)]]
+    assert closed_session.decref_calls == []
+
+
+def test_decref_runner_flush_without_start():
+    runner = DecrefRunner()
+    assert runner.flush().done()
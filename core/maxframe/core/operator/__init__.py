@@ -21,7 +21,13 @@ from .base import (
     VirtualOperator,
 )
 from .core import TileableOperatorMixin, estimate_size, execute
-from .fetch import Fetch, FetchMixin, FetchShuffle, ShuffleFetchType
+from .fetch import (
+    Fetch,
+    FetchMixin,
+    FetchShuffle,
+    ShuffleFetchType,
+    SubmittedOperatorRef,
+)
 from .objects import MergeDictOperator, ObjectFetch, ObjectOperator, ObjectOperatorMixin
 from .shuffle import MapReduceOperator, ShuffleProxy
 from .utils import add_fetch_builder, build_fetch
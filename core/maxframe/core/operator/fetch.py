@@ -32,6 +32,20 @@ class Fetch(Operator):
     source_key = StringField("source_key", default=None)
 
 
+class SubmittedOperatorRef(Operator):
+    """
+    Reference to an operator submitted to the service in the same session
+    before. The service replaces it with the submitted operator of the same key,
+    thus definitions of operators need not to be sent again.
+    """
+
+    _op_type_ = opcodes.SUBMITTED_OP_REF
+
+    @property
+    def output_limit(self) -> int:
+        return max(len(self._outputs or ()), 1)
+
+
 class FetchMixin(TileableOperatorMixin):
     def check_inputs(self, inputs):
         # no inputs
@@ -35,6 +35,7 @@ from ..core import (
     register_output_types,
 )
 from ..core.entity.utils import refresh_tileable_shape
+from ..io.filewriter import check_file_format
 from ..protocol import DataFrameTableMeta
 from ..serialization.serializables import (
     AnyField,
@@ -52,7 +53,7 @@ from ..serialization.serializables import (
     SliceField,
     StringField,
 )
-from ..session import get_default_session
+from ..session import fetch_to_file, get_default_session, iter_fetch
 from ..utils import (
     calc_nsplits,
     ceildiv,
@@ -510,51 +511,104 @@ class _ToPandasMixin(_ExecuteAndFetchMixin):
 class _BatchedFetcher:
     __slots__ = ()
 
-    def _iter(self, batch_size=None, session=None, **kw):
-        from .indexing.iloc import iloc
+    def _attach_session(self, session):
+        # results might change after execution, thus drop memoized corner data
+        self._corner_data = None
+        super()._attach_session(session)
+
+    def _detach_session(self, session):
+        self._corner_data = None
+        super()._detach_session(session)
+
+    def _iter(self, batch_size=None, session=None, batch_bytes=None, **kw):
+        session = session if session is not None else get_default_session()
+        self._check_session(session, "fetch")
+        # batches are read from a single reader with the next batch prefetched
+        yield from iter_fetch(
+            self, session=session, batch_size=batch_size, batch_bytes=batch_bytes, **kw
+        )
 
-        if batch_size is not None:
-            size = self.shape[0]
-            n_batch = ceildiv(size, batch_size)
+    def _iter_estimated(self, session=None, **kw):
+        from .indexing.iloc import iloc
 
-            if n_batch > 1:
-                for i in range(n_batch):
-                    batch_data = iloc(self)[batch_size * i : batch_size * (i + 1)]
-                    yield batch_data._fetch(session=session, **kw)
-            else:
-                yield self._fetch(session=session, **kw)
+        # use first batch to estimate batch_size.
+        default_batch_bytes = 50 * 1024**2
+        first_batch = 1000
+        size = self.shape[0]
+
+        if size >= first_batch:
+            batch_data = iloc(self)[:first_batch]
+            first_batch_data = batch_data._fetch(session=session, **kw)
+            yield first_batch_data
+            data_size = estimate_pandas_size(first_batch_data)
+            batch_size = int(default_batch_bytes / data_size * first_batch)
+            n_batch = ceildiv(size - 1000, batch_size)
+            for i in range(n_batch):
+                batch_data = iloc(self)[
+                    first_batch + batch_size * i : first_batch + batch_size * (i + 1)
+                ]
+                yield batch_data._fetch(session=session, **kw)
         else:
-            # if batch_size is not specified, use first batch to estimate
-            # batch_size.
-            default_batch_bytes = 50 * 1024**2
-            first_batch = 1000
-            size = self.shape[0]
-
-            if size >= first_batch:
-                batch_data = iloc(self)[:first_batch]
-                first_batch_data = batch_data._fetch(session=session, **kw)
-                yield first_batch_data
-                data_size = estimate_pandas_size(first_batch_data)
-                batch_size = int(default_batch_bytes / data_size * first_batch)
-                n_batch = ceildiv(size - 1000, batch_size)
-                for i in range(n_batch):
-                    batch_data = iloc(self)[
-                        first_batch
-                        + batch_size * i : first_batch
-                        + batch_size * (i + 1)
-                    ]
-                    yield batch_data._fetch(session=session, **kw)
-            else:
-                yield self._fetch(session=session, **kw)
+            yield self._fetch(session=session, **kw)
 
-    def iterbatch(self, batch_size=None, session=None, **kw):
+    def iterbatch(self, batch_size=None, session=None, batch_bytes=None, **kw):
         # stop triggering execution under build mode
         if is_build_mode():
             raise ValueError("Cannot fetch data under build mode")
 
         # trigger execution
         self.execute(session=session, **kw)
-        return self._iter(batch_size=batch_size, session=session)
+        return self._iter(
+            batch_size=batch_size, session=session, batch_bytes=batch_bytes
+        )
+
+    def fetch_to_file(
+        self,
+        path,
+        format="parquet",
+        partition_cols=None,
+        row_group_size=None,
+        index=True,
+        session=None,
+        **kw,
+    ):
+        """
+        Fetch executed data into a local file. Data are streamed into the
+        file batch by batch without building pandas objects when possible.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, or path of the directory when `partition_cols`
+            is specified.
+        format : {'parquet', 'arrow', 'csv'}, default 'parquet'
+            Format of the file. 'arrow' stands for Arrow IPC file format.
+        partition_cols : list of str, optional
+            Columns to partition data with in hive style, i.e., data are
+            written under directories like `col=value`.
+        row_group_size : int, optional
+            Number of rows in every parquet row group or arrow record batch.
+        index : bool, default True
+            Whether to write index as columns. Names of these columns are
+            the same as ``DataFrame.reset_index``.
+        session : Session, optional
+            Session to fetch data from.
+        """
+        check_file_format(format)
+        if is_build_mode():
+            raise ValueError("Cannot fetch data under build mode")
+        session = session if session is not None else get_default_session()
+        self._check_session(session, "fetch")
+        fetch_to_file(
+            self,
+            path,
+            session=session,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+            **kw,
+        )
 
     def fetch(self, session=None, **kw):
         from .indexing.iloc import DataFrameIlocGetItem, SeriesIlocGetItem
@@ -565,7 +619,10 @@ class _BatchedFetcher:
             # already iloc, do not trigger batch fetch
             return self._fetch(session=session, **kw)
         else:
-            batches = list(self._iter(batch_size=batch_size, session=session, **kw))
+            if batch_size is None:
+                batches = list(self._iter_estimated(session=session, **kw))
+            else:
+                batches = list(self._iter(batch_size=batch_size, session=session, **kw))
             return pd.concat(batches) if len(batches) > 1 else batches[0]
 
     def fetch_infos(self, fields=None, session=None, **kw):
@@ -908,7 +965,7 @@ class MultiIndex(Index):
 
 
 class BaseSeriesData(HasShapeTileableData, _ToPandasMixin):
-    __slots__ = "_cache", "_accessors"
+    __slots__ = "_cache", "_accessors", "_corner_data"
 
     # optional field
     _dtype = DataTypeField("dtype")
@@ -1454,7 +1511,7 @@ class Series(HasShapeTileable, _ToPandasMixin):
 
 
 class BaseDataFrameData(HasShapeTileableData, _ToPandasMixin):
-    __slots__ = "_accessors", "_dtypes_value", "_dtypes_dict"
+    __slots__ = "_accessors", "_dtypes_value", "_dtypes_dict", "_corner_data"
 
     # optional fields
     _dtypes = SeriesField("dtypes")
@@ -928,6 +928,7 @@ def fetch_corner_data(df_or_series, session=None) -> pd.DataFrame:
     :param df_or_series: DataFrame or Series
     :return: corner DataFrame
     """
+    from ..session import can_fetch_corner, fetch_corner
     from .indexing.iloc import iloc
 
     max_rows = pd.get_option("display.max_rows")
@@ -948,14 +949,36 @@ def fetch_corner_data(df_or_series, session=None) -> pd.DataFrame:
         # thus we fetch min_rows + 2 lines
         index_size = min_rows // 2 + 1
 
+    # corner data is memoized on the tileable thus repeated reprs are free.
+    #  ids of sessions are kept instead of sessions to avoid keeping them alive
+    session_id = getattr(session, "session_id", None)
+    memo = getattr(df_or_series, "_corner_data", None)
+    if (
+        memo is not None
+        and session_id is not None
+        and memo[0] == session_id
+        and memo[1] == index_size
+    ):
+        return memo[2]
+
     if index_size is None:
-        return df_or_series._fetch(session=session)
+        corner_data = df_or_series._fetch(session=session)
+    elif can_fetch_corner(df_or_series, session=session):
+        corner_data = fetch_corner(
+            df_or_series, index_size, index_size, session=session
+        )
     else:
         head = iloc(df_or_series)[:index_size]
         tail = iloc(df_or_series)[-index_size:]
         head_data, tail_data = ExecutableTuple([head, tail]).fetch(session=session)
         xdf = cudf if head.op.is_gpu() else pd
-        return xdf.concat([head_data, tail_data], axis="index")
+        corner_data = xdf.concat([head_data, tail_data], axis="index")
+
+    try:
+        df_or_series._corner_data = (session_id, index_size, corner_data)
+    except AttributeError:  # pragma: no cover
+        pass
+    return corner_data
 
 
 class ReprSeries(pd.Series):
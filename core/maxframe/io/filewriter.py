@@ -0,0 +1,165 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+
+from ..typing_ import ArrowTableType
+
+_FILE_FORMATS = ("parquet", "arrow", "csv")
+_DATASET_FORMATS = {"parquet": "parquet", "arrow": "ipc", "csv": "csv"}
+
+
+def check_file_format(format: str) -> None:
+    if format not in _FILE_FORMATS:
+        raise ValueError(
+            f"Unsupported file format {format!r}, "
+            f"should be one of {', '.join(_FILE_FORMATS)}"
+        )
+
+
+def _rechunk_tables(
+    tables: Iterable[ArrowTableType], chunk_rows: int
+) -> Iterator[ArrowTableType]:
+    pending = []
+    pending_rows = 0
+    for table in tables:
+        pending.append(table)
+        pending_rows += table.num_rows
+        if pending_rows < chunk_rows:
+            continue
+        merged = pa.concat_tables(pending)
+        offset = 0
+        while pending_rows - offset >= chunk_rows:
+            # writers split row groups at chunk boundaries
+            yield merged.slice(offset, chunk_rows).combine_chunks()
+            offset += chunk_rows
+        pending = [merged.slice(offset)]
+        pending_rows -= offset
+    if pending_rows:
+        yield pa.concat_tables(pending).combine_chunks()
+
+
+def _unify_schemas(
+    tables: Iterable[ArrowTableType], schema: pa.Schema
+) -> Iterator[ArrowTableType]:
+    for table in tables:
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        yield table if table.schema.equals(schema) else table.cast(schema)
+
+
+def _write_single_file(
+    tables: Iterator[ArrowTableType],
+    path: str,
+    format: str,
+    schema: pa.Schema,
+    row_group_size: Optional[int],
+) -> None:
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(path, schema) as writer:
+            for table in tables:
+                writer.write_table(table, row_group_size=row_group_size)
+    elif format == "arrow":
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for table in tables:
+                    writer.write_table(table, max_chunksize=row_group_size)
+    else:
+        import pyarrow.csv as pa_csv
+
+        with pa_csv.CSVWriter(path, schema) as writer:
+            for table in tables:
+                writer.write_table(table)
+
+
+def _write_partitioned(
+    tables: Iterator[ArrowTableType],
+    path: str,
+    format: str,
+    schema: pa.Schema,
+    partition_cols: List[str],
+    row_group_size: Optional[int],
+) -> None:
+    import pyarrow.dataset as ds
+
+    missing_cols = [col for col in partition_cols if col not in schema.names]
+    if missing_cols:
+        raise ValueError(f"Partition columns {missing_cols!r} not found in data")
+
+    kw = dict()
+    if row_group_size:
+        kw["max_rows_per_group"] = kw["min_rows_per_group"] = row_group_size
+    batches = (batch for table in tables for batch in table.to_batches())
+    ds.write_dataset(
+        batches,
+        path,
+        schema=schema,
+        format=_DATASET_FORMATS[format],
+        partitioning=partition_cols,
+        partitioning_flavor="hive",
+        existing_data_behavior="overwrite_or_ignore",
+        **kw,
+    )
+
+
+def write_arrow_tables(
+    tables: Iterable[ArrowTableType],
+    path: str,
+    format: str = "parquet",
+    partition_cols: Optional[List[str]] = None,
+    row_group_size: Optional[int] = None,
+) -> None:
+    """
+    Write a stream of arrow tables sharing the same schema into a local file
+    without concatenating them in memory.
+
+    Parameters
+    ----------
+    tables : Iterable[pa.Table]
+        Arrow tables to write. Schema of the first table is used.
+    path : str
+        Path of the file, or path of the directory when `partition_cols`
+        is specified.
+    format : str
+        Format of the file, can be 'parquet', 'arrow' or 'csv'.
+    partition_cols : list of str, optional
+        Columns to partition data with in hive style, i.e., data with the
+        same values of these columns are written under `col=value` paths.
+    row_group_size : int, optional
+        Number of rows in every parquet row group or arrow record batch.
+    """
+    check_file_format(format)
+    table_iter = iter(tables)
+    first_table = next(table_iter, None)
+    if first_table is None:
+        raise ValueError("No data to write")
+    schema = first_table.schema
+
+    def iter_tables():
+        yield from _unify_schemas([first_table], schema)
+        yield from _unify_schemas(table_iter, schema)
+
+    tables = iter_tables()
+    if row_group_size:
+        tables = _rechunk_tables(tables, row_group_size)
+    if partition_cols:
+        _write_partitioned(
+            tables, path, format, schema, list(partition_cols), row_group_size
+        )
+    else:
+        _write_single_file(tables, path, format, schema, row_group_size)
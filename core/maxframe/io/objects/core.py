@@ -12,17 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import struct
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Iterator, Type, Union
 
 import msgpack
+import numpy as np
 
 from ...core import Entity, EntityData
 from ...core.entity import ObjectData, TileableData
 from ...lib import wrapped_pickle as pickle
 from ...typing_ import SlicesType, TileableType
 from ...utils import TypeDispatcher
-from ..odpsio.volumeio import ODPSVolumeReader, ODPSVolumeWriter
+from ..odpsio.volumeio import ODPSVolumeReader, ODPSVolumeWriter, VolumeFileStream
 
 _MetaType = Dict[str, Any]
 
@@ -72,6 +75,44 @@ class AbstractObjectIOHandler(metaclass=ABCMeta):
             meta[k] = pickle.loads(meta[k])
         return meta
 
+    @staticmethod
+    def _dump_with_buffers(value: Any) -> Iterator[Any]:
+        """
+        Pickle the value with out-of-band buffers. Generated data consists of
+        header length, header with sizes of pickled data and buffers, pickled
+        data and raw buffers.
+        """
+        bufs = []
+        pickled = pickle.dumps(value, buffer_callback=bufs.append)
+        header_data = msgpack.dumps([len(pickled)] + [len(buf.raw()) for buf in bufs])
+        yield struct.pack("<I", len(header_data))
+        yield header_data
+        yield pickled
+        for buf in bufs:
+            yield buf
+
+    @staticmethod
+    def _load_with_buffers(stream: VolumeFileStream) -> Any:
+        """
+        Load value generated by `_dump_with_buffers` from a stream, with
+        buffers read into preallocated memory without copying.
+        """
+        header_len_data = bytearray(4)
+        stream.readinto_exactly(header_len_data)
+        (header_len,) = struct.unpack("<I", header_len_data)
+        header_data = bytearray(header_len)
+        stream.readinto_exactly(header_data)
+        sizes = msgpack.loads(header_data)
+
+        pickled = bytearray(sizes[0])
+        stream.readinto_exactly(pickled)
+        bufs = []
+        for size in sizes[1:]:
+            buf = np.empty(size, dtype=np.uint8)
+            stream.readinto_exactly(buf)
+            bufs.append(memoryview(buf))
+        return pickle.loads(pickled, buffers=bufs)
+
     def read_object_meta(
         self, reader: ODPSVolumeReader, tileable: TileableType
     ) -> Dict[str, Any]:
@@ -132,7 +173,8 @@ class ObjectIOHandler(AbstractObjectIOHandler):
         meta: Dict[str, Any],
         slices: SlicesType = None,
     ) -> Any:
-        return pickle.loads(reader.read_file("data"))
+        with reader.open_file("data") as stream:
+            return pickle.load(io.BufferedReader(stream))
 
     def _write_object_body(
         self, writer: ODPSVolumeWriter, tileable: TileableType, value: Any
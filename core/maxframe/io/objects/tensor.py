@@ -12,34 +12,203 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
-from io import BytesIO
-from typing import Any, Dict
+import concurrent.futures
+from numbers import Integral
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import msgpack
 import numpy as np
 
-from ...lib import wrapped_pickle as pickle
+from ...config import options
+from ...lib.compression import compress_bytes, decompress_bytes
 from ...tensor.core import TensorData
 from ...typing_ import SlicesType, TileableType
 from ..odpsio import ODPSVolumeReader, ODPSVolumeWriter
 from .core import AbstractObjectIOHandler, register_object_io_handler
 
+_LEGACY_BODY_FILE_NAME = "0,0.dat"
+_RAW_CHUNK_LAYOUT = "raw"
+
+
+def _run_concurrently(func: Callable, args_list: List[Any], concurrency: int) -> list:
+    concurrency = min(concurrency, len(args_list))
+    if concurrency <= 1:
+        return [func(args) for args in args_list]
+    with concurrent.futures.ThreadPoolExecutor(
+        concurrency, thread_name_prefix="TensorIO"
+    ) as pool:
+        return list(pool.map(func, args_list))
+
+
+def _normalize_axis_index(
+    index: Any, size: int
+) -> Tuple[Any, Optional[Tuple[int, int]]]:
+    """
+    Get index on an axis relative to the first selected position, and the
+    range of selected positions. None range means nothing is selected.
+    Stops of slices with negative steps can be negative, thus need to be
+    offset before use.
+    """
+    if index is None:
+        index = slice(None)
+    if isinstance(index, Integral):
+        pos = index + size if index < 0 else index
+        if not 0 <= pos < size:
+            raise IndexError(f"index {index} is out of bounds for size {size}")
+        return 0, (pos, pos + 1)
+    if not isinstance(index, slice):
+        # fancy indexes are applied after all data are read
+        return index, (0, size) if size else None
+
+    positions = range(*index.indices(size))
+    if not positions:
+        return slice(0, 0), None
+    min_pos = min(positions[0], positions[-1])
+    max_pos = max(positions[0], positions[-1])
+    start = positions[0] - min_pos
+    stop = positions[-1] - min_pos + (1 if positions.step > 0 else -1)
+    return slice(start, stop, positions.step), (
+        min_pos,
+        max_pos + 1,
+    )
+
+
+def _get_array_header(value: np.ndarray) -> Dict[str, Any]:
+    try:
+        descr = np.lib.format.dtype_to_descr(value.dtype)
+        dtype_new_order = None
+    except ValueError:
+        # views of structured arrays with reordered fields
+        fields = value.dtype.fields
+        new_fields = sorted(fields, key=lambda k: fields[k][1])
+        descr = np.lib.format.dtype_to_descr(value.dtype[new_fields])
+        dtype_new_order = list(fields)
+    return {
+        "descr": descr,
+        "dtype_new_order": dtype_new_order,
+        "shape": list(value.shape),
+        "strides": list(value.strides),
+        "order": "F" if value.ndim > 1 and value.flags.f_contiguous else "C",
+    }
+
+
+def _get_header_dtype(header: Dict[str, Any]) -> np.dtype:
+    dtype = np.lib.format.descr_to_dtype(header["descr"])
+    if header["dtype_new_order"]:
+        dtype = dtype[header["dtype_new_order"]]
+    return dtype
+
 
 @register_object_io_handler(TensorData)
 class TensorIOHandler(AbstractObjectIOHandler):
+    """
+    IO handler of tensors. When `session.tensor_chunked_layout` is enabled,
+    arrays with fixed-size dtypes are stored without pickling. They are split
+    into chunks of about `session.tensor_chunk_bytes` bytes along the first
+    axis, or the last axis for F-ordered arrays, and every chunk is stored as
+    a raw buffer in a separate file, optionally compressed with
+    `session.tensor_compression`. Only chunks touched by slices are
+    downloaded. Other arrays are pickled into a single file. Both layouts
+    can be read regardless of the option.
+    """
+
+    @staticmethod
+    def _prepare_chunks(value: Any) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Get value with contiguous memory and meta of its chunks, None meta
+        if the value shall be stored in legacy layout.
+        """
+        if (
+            not options.session.tensor_chunked_layout
+            or not isinstance(value, np.ndarray)
+            or value.ndim == 0
+            or value.dtype.hasobject
+        ):
+            return value, None
+        if not value.flags.c_contiguous and not value.flags.f_contiguous:
+            value = np.ascontiguousarray(value)
+        header = _get_array_header(value)
+        axis = 0 if header["order"] == "C" else value.ndim - 1
+
+        size = value.shape[axis]
+        slice_nbytes = value.itemsize * (value.size // size if size else 0)
+        chunk_size = max(1, options.session.tensor_chunk_bytes // max(slice_nbytes, 1))
+        splits = tuple(
+            min(chunk_size, size - start) for start in range(0, size, chunk_size)
+        ) or (0,)
+        nsplits = [(dim_size,) for dim_size in value.shape]
+        nsplits[axis] = splits
+        chunk_meta = {
+            "chunk_layout": _RAW_CHUNK_LAYOUT,
+            "array_header": header,
+            "chunk_axis": axis,
+            "nsplits": tuple(nsplits),
+            # byte offsets of chunks in raw data of the whole array
+            "chunk_offsets": [0]
+            + np.cumsum([split * slice_nbytes for split in splits]).tolist(),
+        }
+        if options.session.tensor_compression:
+            chunk_meta["compression"] = options.session.tensor_compression
+        return value, chunk_meta
+
+    @staticmethod
+    def _get_chunk_file_name(chunk_idx: int, ndim: int, axis: int = 0) -> str:
+        idx = ["0"] * ndim
+        idx[axis] = str(chunk_idx)
+        return ",".join(idx) + ".dat"
+
     def write_object_meta(
         self,
         writer: ODPSVolumeWriter,
         tileable: TileableType,
         extra_meta: Dict[str, Any] = None,
     ):
-        # fixme upload in real slices when tensors are supported in DPE
         extra_meta = extra_meta or dict()
-        extra_meta["nsplits"] = ((np.nan,),)
+        extra_meta.setdefault("nsplits", ((np.nan,),))
 
         super().write_object_meta(writer, tileable, extra_meta=extra_meta)
 
+    def write_object(
+        self, writer: ODPSVolumeWriter, tileable: TileableType, value: Any
+    ):
+        value, chunk_meta = self._prepare_chunks(value)
+        self.write_object_meta(writer, tileable, extra_meta=chunk_meta)
+        self._write_object_body(writer, tileable, value, chunk_meta=chunk_meta)
+
+    def _read_legacy_body(
+        self, reader: ODPSVolumeReader, slices: SlicesType = None
+    ) -> Any:
+        with reader.open_file(_LEGACY_BODY_FILE_NAME) as stream:
+            value = self._load_with_buffers(stream)
+        return value[tuple(slices)] if slices else value
+
+    def _read_chunks(
+        self,
+        reader: ODPSVolumeReader,
+        file_names: List[str],
+        buffers: List[memoryview],
+        compression: Optional[str],
+    ) -> None:
+        if not compression:
+            # chunks are downloaded into the result array directly
+            reader.read_files_into(dict(zip(file_names, buffers)))
+            return
+
+        def read_chunk(args: Tuple[str, memoryview]) -> None:
+            file_name, buffer = args
+            data = decompress_bytes(reader.read_file(file_name), compression)
+            if len(data) != len(buffer):
+                raise IOError(
+                    f"Size of chunk {file_name} is {len(data)}, "
+                    f"{len(buffer)} expected"
+                )
+            buffer[:] = data
+
+        _run_concurrently(
+            read_chunk,
+            list(zip(file_names, buffers)),
+            options.session.fetch_concurrency,
+        )
+
     def _read_object_body(
         self,
         reader: ODPSVolumeReader,
@@ -47,30 +216,92 @@ class TensorIOHandler(AbstractObjectIOHandler):
         meta: Dict[str, Any],
         slices: SlicesType = None,
     ) -> Any:
-        # fixme read data with slices when tensors are supported in DPE
-        body = reader.read_file("0,0.dat")
-        bio = BytesIO(body)
-        (header_len,) = struct.unpack("<I", bio.read(4))
-        header_data = msgpack.loads(bio.read(header_len))
+        if meta.get("chunk_layout") != _RAW_CHUNK_LAYOUT:
+            return self._read_legacy_body(reader, slices)
+
+        header = meta["array_header"]
+        shape, dtype = tuple(header["shape"]), _get_header_dtype(header)
+        axis, offsets = meta["chunk_axis"], meta["chunk_offsets"]
+        splits = meta["nsplits"][axis]
+
+        index = list(slices or [])
+        index.extend([slice(None)] * (len(shape) - len(index)))
+        axis_index, axis_range = _normalize_axis_index(index[axis], shape[axis])
+        index[axis] = axis_index
+        if axis_range is None:
+            empty_shape = list(shape)
+            empty_shape[axis] = 0
+            return np.empty(empty_shape, dtype=dtype)[tuple(index)]
+
+        # find chunks overlapping with selected range
+        chunk_starts = np.cumsum((0,) + tuple(splits)).tolist()
+        first_chunk = int(np.searchsorted(chunk_starts, axis_range[0], "right")) - 1
+        last_chunk = int(np.searchsorted(chunk_starts, axis_range[1], "left")) - 1
+
+        base_pos = chunk_starts[first_chunk]
+        result_shape = list(shape)
+        result_shape[axis] = chunk_starts[last_chunk + 1] - base_pos
+        result = np.empty(result_shape, dtype=dtype, order=header["order"])
+        result_buf = memoryview(
+            result.reshape(-1, order=header["order"]).view(np.uint8)
+        )
 
-        pickled = bio.read(header_data[0])
-        bufs = [bio.read(size) for size in header_data[1:]]
-        return pickle.loads(pickled, buffers=bufs)
+        base_offset = offsets[first_chunk]
+        file_names, buffers = [], []
+        for chunk_idx in range(first_chunk, last_chunk + 1):
+            file_names.append(self._get_chunk_file_name(chunk_idx, len(shape), axis))
+            start = offsets[chunk_idx] - base_offset
+            stop = offsets[chunk_idx + 1] - base_offset
+            buffers.append(result_buf[start:stop])
+        self._read_chunks(reader, file_names, buffers, meta.get("compression"))
+
+        pos_offset = axis_range[0] - base_pos
+        if isinstance(axis_index, slice):
+            stop = axis_index.stop + pos_offset
+            # negative stops mean slicing towards the first position
+            index[axis] = slice(
+                axis_index.start + pos_offset,
+                stop if stop >= 0 else None,
+                axis_index.step,
+            )
+        elif isinstance(axis_index, Integral):
+            index[axis] = axis_index + pos_offset
+        return result[tuple(index)]
+
+    def _write_legacy_body(self, writer: ODPSVolumeWriter, value: Any):
+        writer.write_file(_LEGACY_BODY_FILE_NAME, self._dump_with_buffers(value))
 
     def _write_object_body(
-        self, writer: ODPSVolumeWriter, tileable: TileableType, value: Any
+        self,
+        writer: ODPSVolumeWriter,
+        tileable: TileableType,
+        value: Any,
+        chunk_meta: Optional[Dict[str, Any]] = None,
     ):
-        # fixme upload in real slices when tensors are supported in DPE
-        def data_gen():
-            bufs = []
-            pickled = pickle.dumps(value, buffer_callback=bufs.append)
-            header_data = msgpack.dumps(
-                [len(pickled)] + [len(buf.raw()) for buf in bufs]
+        if chunk_meta is None:
+            value, chunk_meta = self._prepare_chunks(value)
+        if chunk_meta is None:
+            self._write_legacy_body(writer, value)
+            return
+
+        # values are made contiguous when preparing chunks
+        order = chunk_meta["array_header"]["order"]
+        axis, compression = chunk_meta["chunk_axis"], chunk_meta.get("compression")
+        n_chunks = len(chunk_meta["nsplits"][axis])
+        raw_data = value.reshape(-1, order=order).view(np.uint8)
+        offsets = chunk_meta["chunk_offsets"]
+
+        def write_chunk(chunk_idx: int) -> None:
+            # chunks are contiguous in raw data, thus not copied
+            data = memoryview(raw_data[offsets[chunk_idx] : offsets[chunk_idx + 1]])
+            if compression:
+                data = compress_bytes(data, compression)
+            writer.write_file(
+                self._get_chunk_file_name(chunk_idx, value.ndim, axis), data
             )
-            yield struct.pack("<I", len(header_data))
-            yield header_data
-            yield pickled
-            for buf in bufs:
-                yield buf
 
-        writer.write_file("0,0.dat", data_gen())
+        _run_concurrently(
+            write_chunk,
+            list(range(n_chunks)),
+            options.session.upload_concurrency,
+        )
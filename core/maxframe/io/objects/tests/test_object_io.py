@@ -12,15 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import io
+
+import mock
 import numpy as np
 import pytest
 from odps import ODPS
 
+from ....config import option_context
 from ....core import OutputType
 from ....core.operator import ObjectOperatorMixin, Operator
 from ....tensor.datasource import ArrayDataSource
 from ....tests.utils import tn
 from ...odpsio import ODPSVolumeReader, ODPSVolumeWriter
+from ...odpsio.volumeio import VolumeFileStream
 from ..core import get_object_io_handler
 
 
@@ -122,3 +128,177 @@ def test_tensor_object_io(create_volume):
     handler = get_object_io_handler(obj)()
     handler.write_object(writer, obj, data)
     np.testing.assert_equal(data, handler.read_object(reader, obj))
+
+
+class _MemoryVolume(ODPSVolumeReader):
+    def __init__(self):
+        self.files = dict()
+        self.read_names = []
+
+    def list_files(self):
+        return sorted(self.files)
+
+    def read_file(self, file_name: str) -> bytes:
+        self.read_names.append(file_name)
+        return self.files[file_name]
+
+    @contextlib.contextmanager
+    def open_file(self, file_name: str, offset: int = 0, length=None):
+        self.read_names.append(file_name)
+        yield VolumeFileStream(io.BytesIO(self.files[file_name][offset:]), length)
+
+    def write_file(self, file_name: str, data):
+        if not isinstance(data, (bytes, memoryview)):
+            data = b"".join(bytes(buf) for buf in data)
+        self.files[file_name] = bytes(data)
+
+
+def test_chunked_tensor_object_io():
+    data = np.random.rand(100, 3)
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    handler = get_object_io_handler(obj)()
+
+    volume = _MemoryVolume()
+    with option_context(
+        {"session.tensor_chunked_layout": True, "session.tensor_chunk_bytes": 240}
+    ):
+        handler.write_object(volume, obj, data)
+    chunk_names = sorted(k for k in volume.files if k != ".meta")
+    assert chunk_names == sorted(f"{i},0.dat" for i in range(10))
+    meta = handler.read_object_meta(volume, obj)
+    assert meta["nsplits"] == ((10,) * 10, (3,))
+
+    slices_list = [
+        None,
+        [slice(25, 38)],
+        [slice(-5, None)],
+        [slice(90, 5, -7), slice(1, None)],
+        [slice(55, 12, -1)],
+        [slice(None, None, -2)],
+        [slice(-1, 0, -3)],
+        [slice(35, None, -4)],
+        [42, 2],
+        [-1],
+        [slice(50, 50)],
+        [np.array([3, 97, 41])],
+    ]
+    for slices in slices_list:
+        result = handler.read_object(volume, obj, slices)
+        np.testing.assert_equal(result, data[tuple(slices)] if slices else data)
+
+    # only chunks touched by slices are downloaded
+    volume.read_names = []
+    handler.read_object(volume, obj, [slice(25, 38)])
+    assert sorted(volume.read_names) == [".meta", "2,0.dat", "3,0.dat"]
+    volume.read_names = []
+    handler.read_object(volume, obj, [42, 2])
+    assert sorted(volume.read_names) == [".meta", "4,0.dat"]
+
+    with pytest.raises(IndexError):
+        handler.read_object(volume, obj, [100])
+
+    # slices with negative steps spanning multiple chunks
+    data = np.random.rand(10, 3)
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    volume = _MemoryVolume()
+    with option_context(
+        {"session.tensor_chunked_layout": True, "session.tensor_chunk_bytes": 48}
+    ):
+        handler.write_object(volume, obj, data)
+    for index in [slice(5, 1, -1), slice(None, None, -2), slice(-1, 0, -3)]:
+        result = handler.read_object(volume, obj, [index])
+        np.testing.assert_equal(result, data[index])
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lz4", "zstd"])
+def test_raw_tensor_object_io(compression):
+    data = np.asfortranarray(np.random.rand(4, 5, 30))
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    handler = get_object_io_handler(obj)()
+
+    volume = _MemoryVolume()
+    with option_context(
+        {
+            "session.tensor_chunked_layout": True,
+            "session.tensor_chunk_bytes": 320,
+            "session.tensor_compression": compression,
+        }
+    ):
+        handler.write_object(volume, obj, data)
+        # F-ordered arrays are chunked along the last axis
+        assert "0,0,14.dat" in volume.files
+        meta = handler.read_object_meta(volume, obj)
+        assert meta["nsplits"] == ((4,), (5,), (2,) * 15)
+
+        result = handler.read_object(volume, obj)
+        assert result.flags.f_contiguous
+        np.testing.assert_equal(result, data)
+        slices = [slice(1, 3), 2, slice(7, 12)]
+        np.testing.assert_equal(
+            handler.read_object(volume, obj, slices), data[1:3, 2, 7:12]
+        )
+        np.testing.assert_equal(handler.read_object(volume, obj, [2]), data[2])
+
+    data = np.zeros(20, dtype=[("a", "i4"), ("b", "f8")])
+    data["a"] = np.arange(20)
+    data = data[["b", "a"]]
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    with option_context(
+        {
+            "session.tensor_chunked_layout": True,
+            "session.tensor_compression": compression,
+        }
+    ):
+        handler.write_object(volume, obj, data)
+    np.testing.assert_equal(handler.read_object(volume, obj, [slice(5, 9)]), data[5:9])
+
+
+def test_raw_tensor_object_io_non_contiguous():
+    data = np.random.rand(20, 10)[:, ::2]
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    handler = get_object_io_handler(obj)()
+
+    volume = _MemoryVolume()
+    with option_context({"session.tensor_chunked_layout": True}), mock.patch.object(
+        np, "ascontiguousarray", wraps=np.ascontiguousarray
+    ) as ascontiguousarray:
+        handler.write_object(volume, obj, data)
+        # non-contiguous arrays are copied only once
+        assert ascontiguousarray.call_count == 1
+    assert "compression" not in handler.read_object_meta(volume, obj)
+    np.testing.assert_equal(handler.read_object(volume, obj), data)
+
+    # compression only applies to chunked layout
+    volume = _MemoryVolume()
+    with option_context({"session.tensor_compression": "zstd"}):
+        handler.write_object(volume, obj, data)
+    assert sorted(volume.files) == [".meta", "0,0.dat"]
+    np.testing.assert_equal(handler.read_object(volume, obj), data)
+
+
+def test_legacy_tensor_object_io():
+    data = np.array(["a", 1, None], dtype=object)
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    handler = get_object_io_handler(obj)()
+
+    volume = _MemoryVolume()
+    handler.write_object(volume, obj, data)
+    assert sorted(volume.files) == [".meta", "0,0.dat"]
+    np.testing.assert_equal(handler.read_object(volume, obj), data)
+    np.testing.assert_equal(handler.read_object(volume, obj, [slice(1, 3)]), data[1:])
+
+    # legacy layout is used by default
+    data = np.random.rand(10, 3)
+    obj = ArrayDataSource(data, dtype=data.dtype)(data.shape)
+    volume = _MemoryVolume()
+    with option_context({"session.tensor_chunk_bytes": 48}):
+        handler.write_object(volume, obj, data)
+    assert sorted(volume.files) == [".meta", "0,0.dat"]
+    assert "chunk_layout" not in handler.read_object_meta(volume, obj)
+    result = handler.read_object(volume, obj, [slice(2, 5)])
+    np.testing.assert_equal(result, data[2:5])
+
+    obj = TestObjectOp()()
+    handler = get_object_io_handler(obj)()
+    handler.write_object(volume, obj, {"a": data})
+    np.testing.assert_equal(handler.read_object(volume, obj)["a"], data)
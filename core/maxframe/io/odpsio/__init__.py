@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .arrow import arrow_to_pandas, pandas_to_arrow
+from .arrow import (
+    arrow_to_export_table,
+    arrow_to_pandas,
+    pandas_to_arrow,
+    pandas_to_export_table,
+)
 from .schema import (
     arrow_schema_to_odps_schema,
     build_dataframe_table_meta,
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -35,18 +35,74 @@ def _rebuild_dataframe(
 ) -> Union[pd.DataFrame, pd.Series]:
     indexed = df.set_index(list(table_meta.table_index_column_names))
     indexed.index.set_names(table_meta.pd_index_level_names, inplace=True)
+    indexed.columns = _build_column_index(table_meta)
+    if table_meta.type == OutputType.series:
+        return indexed.iloc[:, 0]
+    return indexed
+
+
+def _build_index(
+    arrays: List[pd.Series], table_meta: DataFrameTableMeta
+) -> Optional[pd.Index]:
+    if not arrays:
+        return None
+    if len(arrays) > 1:
+        idx = pd.MultiIndex.from_arrays(arrays)
+        idx.names = table_meta.pd_index_level_names
+    else:
+        # names of source series should not be kept if meta names are None
+        idx = pd.Index(arrays[0], copy=False)
+        idx.name = table_meta.pd_index_level_names[0]
+    return idx
+
+
+def _build_column_index(table_meta: DataFrameTableMeta) -> pd.Index:
     if len(table_meta.pd_column_level_names) == 1:
-        cols = pd.Index(
+        return pd.Index(
             table_meta.pd_column_names, name=table_meta.pd_column_level_names[0]
         )
-    else:
-        cols = pd.MultiIndex.from_tuples(table_meta.pd_column_names).set_names(
-            table_meta.pd_column_level_names
-        )
-    indexed.columns = cols
+    return pd.MultiIndex.from_tuples(table_meta.pd_column_names).set_names(
+        table_meta.pd_column_level_names
+    )
+
+
+def _is_copy_on_write_enabled() -> bool:
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # pragma: no cover
+        return False
+
+
+def _make_columns_writable(df: pd.DataFrame) -> None:
+    # numpy arrays sharing memory with arrow are read-only. Copy them column
+    # by column thus arrow buffers are released as soon as they are copied.
+    if _is_copy_on_write_enabled():
+        return
+    for col in df.columns:
+        values = df[col].values
+        if isinstance(values, np.ndarray) and not values.flags.writeable:
+            df[col] = values.copy()
+
+
+def _rebuild_dataframe_inplace(
+    df: pd.DataFrame, table_meta: DataFrameTableMeta, writable: bool = False
+) -> Union[pd.DataFrame, pd.Series]:
+    # columns are stored in separate blocks, thus popping index columns
+    # and replacing axes do not copy data
+    index = _build_index(
+        [df.pop(col) for col in table_meta.table_index_column_names], table_meta
+    )
+    if writable:
+        _make_columns_writable(df)
     if table_meta.type == OutputType.series:
-        return indexed.iloc[:, 0]
-    return indexed
+        result = df.pop(df.columns[0])
+        result.name = table_meta.pd_column_names[0]
+    else:
+        result = df
+        result.columns = _build_column_index(table_meta)
+    if index is not None:
+        result.index = index
+    return result
 
 
 def _rebuild_index(df: pd.DataFrame, table_meta: DataFrameTableMeta) -> pd.Index:
@@ -61,10 +117,27 @@ def _rebuild_index(df: pd.DataFrame, table_meta: DataFrameTableMeta) -> pd.Index
 
 
 def arrow_to_pandas(
-    arrow_table: ArrowTableType, table_meta: DataFrameTableMeta
+    arrow_table: ArrowTableType,
+    table_meta: DataFrameTableMeta,
+    self_destruct: bool = False,
+    writable: bool = False,
 ) -> PandasObjectTypes:
-    df = arrow_table_to_pandas_dataframe(arrow_table, table_meta)
+    """
+    Convert arrow table into pandas object described by `table_meta`.
+
+    When `self_destruct` is True, arrow memory is released during conversion
+    and index and columns are attached without copying data, which reduces
+    peak memory when converting large tables. The arrow table cannot be used
+    after conversion in this mode. Numpy arrays sharing memory with arrow are
+    read-only unless pandas copy-on-write is enabled or `writable` is True,
+    where these arrays are copied column by column.
+    """
+    df = arrow_table_to_pandas_dataframe(
+        arrow_table, table_meta, self_destruct=self_destruct
+    )
     if table_meta.type in (OutputType.dataframe, OutputType.series):
+        if self_destruct:
+            return _rebuild_dataframe_inplace(df, table_meta, writable=writable)
         return _rebuild_dataframe(df, table_meta)
     elif table_meta.type == OutputType.index:
         return _rebuild_index(df, table_meta)
@@ -74,6 +147,57 @@ def arrow_to_pandas(
         raise ValueError(f"Does not support meta type {table_meta.type!r}")
 
 
+def _get_export_column_name(name: Any, default: str) -> str:
+    if name is None:
+        return default
+    if isinstance(name, tuple):
+        return "_".join(str(n) for n in name)
+    return str(name)
+
+
+def arrow_to_export_table(
+    arrow_table: ArrowTableType, table_meta: DataFrameTableMeta, index: bool = True
+) -> ArrowTableType:
+    """
+    Rename columns of arrow table described by `table_meta` with names of
+    the pandas object, thus it can be written into files directly. Index
+    levels are kept as leading columns named like `DataFrame.reset_index`
+    if `index` is True. Data columns not in the table are skipped.
+    """
+    if table_meta.type not in (OutputType.dataframe, OutputType.series):
+        raise ValueError(f"Does not support exporting meta type {table_meta.type!r}")
+
+    table_col_names = set(arrow_table.schema.names)
+    names, columns = [], []
+    if index:
+        n_levels = len(table_meta.table_index_column_names)
+        for level, (col, name) in enumerate(
+            zip(table_meta.table_index_column_names, table_meta.pd_index_level_names)
+        ):
+            default = "index" if n_levels == 1 else f"level_{level}"
+            names.append(_get_export_column_name(name, default))
+            columns.append(arrow_table.column(col))
+    for idx, (col, name) in enumerate(
+        zip(table_meta.table_column_names, table_meta.pd_column_names)
+    ):
+        if col in table_col_names:
+            names.append(_get_export_column_name(name, str(idx)))
+            columns.append(arrow_table.column(col))
+
+    if len(set(names)) < len(names):
+        dup_names = sorted({n for n in names if names.count(n) > 1})
+        raise ValueError(f"Duplicated column names {dup_names!r} when exporting")
+    return pa.Table.from_arrays(columns, names=names)
+
+
+def pandas_to_export_table(
+    data: PandasObjectTypes, index: bool = True
+) -> ArrowTableType:
+    """Convert pandas object into arrow table with names as `arrow_to_export_table`"""
+    arrow_table, table_meta = pandas_to_arrow(data)
+    return arrow_to_export_table(arrow_table, table_meta, index=index)
+
+
 def pandas_to_arrow(
     df: Any, nthreads=1, ignore_index=False, ms_cols=None
 ) -> Tuple[ArrowTableType, DataFrameTableMeta]:
@@ -0,0 +1,161 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from odps import ODPS
+from odps.models import Table
+from odps.tunnel import TableDownloadSession
+
+from ...config import options
+
+_DOWNLOAD_SESSION_CACHE_SIZE = 100
+
+
+class ODPSMetaCache:
+    """
+    Cache of ODPS table metadata, including table objects with their schemas,
+    partition lists and tunnel download sessions with their record counts.
+    Items expire after `session.odps_meta_cache_ttl` seconds. Ids of expired
+    download sessions are kept to be reloaded and reused if still valid.
+    """
+
+    def __init__(self, odps_entry: ODPS):
+        # cache is kept with the entry, thus referencing the entry weakly
+        self._odps_ref = weakref.ref(odps_entry)
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Tuple[Table, float]] = dict()
+        self._partitions: Dict[str, Tuple[List[str], float]] = dict()
+        self._download_sessions: OrderedDict[
+            Tuple[str, Optional[str]], Tuple[TableDownloadSession, float]
+        ] = OrderedDict()
+
+    @staticmethod
+    def _is_fresh(cache_time: float) -> bool:
+        ttl = options.session.odps_meta_cache_ttl
+        return bool(ttl) and time.time() - cache_time < ttl
+
+    def _get_or_load(
+        self, cache: Dict[str, Tuple[Any, float]], key: str, loader: Callable
+    ) -> Any:
+        with self._lock:
+            cached = cache.get(key)
+        if cached is not None and self._is_fresh(cached[1]):
+            return cached[0]
+        value = loader()
+        with self._lock:
+            cache[key] = (value, time.time())
+        return value
+
+    def get_table(self, full_table_name: str) -> Table:
+        # table objects load and keep their metadata once accessed
+        return self._get_or_load(
+            self._tables,
+            full_table_name,
+            lambda: self._odps_ref().get_table(full_table_name),
+        )
+
+    def get_partitions(self, full_table_name: str) -> List[str]:
+        table = self.get_table(full_table_name)
+        return self._get_or_load(
+            self._partitions,
+            full_table_name,
+            lambda: [str(pt) for pt in table.partitions],
+        )
+
+    def get_download_session(
+        self, full_table_name: str, partition: Optional[str]
+    ) -> Tuple[Optional[TableDownloadSession], bool]:
+        """
+        Get cached download session and whether it can be used directly
+        without reloading.
+        """
+        with self._lock:
+            cached = self._download_sessions.get((full_table_name, partition))
+        if cached is None:
+            return None, False
+        return cached[0], self._is_fresh(cached[1])
+
+    def put_download_session(
+        self,
+        full_table_name: str,
+        partition: Optional[str],
+        session: TableDownloadSession,
+    ) -> None:
+        key = (full_table_name, partition)
+        with self._lock:
+            self._download_sessions.pop(key, None)
+            while len(self._download_sessions) >= _DOWNLOAD_SESSION_CACHE_SIZE:
+                self._download_sessions.popitem(False)
+            self._download_sessions[key] = (session, time.time())
+
+    def get_record_count(
+        self, full_table_name: str, partitions: Iterable[Optional[str]]
+    ) -> Optional[int]:
+        """
+        Get total record count of partitions from fresh download sessions,
+        None if any of them is not cached.
+        """
+        total = 0
+        for part in partitions:
+            session, fresh = self.get_download_session(full_table_name, part)
+            if session is None or not fresh:
+                return None
+            total += session.count
+        return total
+
+    def invalidate(self, full_table_names: Optional[Iterable[str]] = None) -> None:
+        """Removes metadata of specified tables or all tables"""
+        with self._lock:
+            if full_table_names is None:
+                self._tables.clear()
+                self._partitions.clear()
+                self._download_sessions.clear()
+                return
+            name_set = set(full_table_names)
+            for name in name_set:
+                self._tables.pop(name, None)
+                self._partitions.pop(name, None)
+            for key in [k for k in self._download_sessions if k[0] in name_set]:
+                del self._download_sessions[key]
+
+
+_meta_caches_lock = threading.Lock()
+_meta_caches: "weakref.WeakKeyDictionary[ODPS, ODPSMetaCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_meta_cache(odps_entry: ODPS) -> ODPSMetaCache:
+    """Get metadata cache bound to the ODPS entry"""
+    with _meta_caches_lock:
+        try:
+            return _meta_caches[odps_entry]
+        except KeyError:
+            cache = _meta_caches[odps_entry] = ODPSMetaCache(odps_entry)
+            return cache
+
+
+def invalidate_meta_cache(
+    odps_entry: ODPS, full_table_names: Optional[Iterable[str]] = None
+) -> None:
+    """Removes cached metadata of tables of the ODPS entry if exists"""
+    with _meta_caches_lock:
+        cache = _meta_caches.get(odps_entry)
+    if cache is not None:
+        cache.invalidate(full_table_names)
@@ -200,13 +200,20 @@ def odps_schema_to_pandas_dtypes(
 
 
 def arrow_table_to_pandas_dataframe(
-    table: pa.Table, meta: DataFrameTableMeta = None
+    table: pa.Table, meta: DataFrameTableMeta = None, self_destruct: bool = False
 ) -> pd.DataFrame:
+    """
+    Convert arrow table into pandas DataFrame. When `self_destruct` is True,
+    every column is converted into a separate block and arrow buffers are
+    released during conversion, thus the table cannot be used afterward.
+    """
+    to_pandas_kw = dict(split_blocks=True, self_destruct=True) if self_destruct else {}
     df = table.to_pandas(
         types_mapper=lambda x: (
             ArrowDtype(x) if is_based_for_pandas_dtype(x) else None
         ),
         ignore_metadata=True,
+        **to_pandas_kw,
     )
     if not meta:
         return df
@@ -230,7 +237,11 @@ def arrow_table_to_pandas_dataframe(
             else:
                 converted_column_dtypes[target_col] = target_dtype
 
-    if converted_column_dtypes:
+    if converted_column_dtypes and self_destruct:
+        # replace converted columns only to avoid copying other blocks
+        for target_col, target_dtype in converted_column_dtypes.items():
+            df[target_col] = df[target_col].astype(target_dtype)
+    elif converted_column_dtypes:
         df = df.astype(converted_column_dtypes)
 
     return df
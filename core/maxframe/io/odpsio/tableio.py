@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
+import functools
 import os
+import queue
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import pyarrow as pa
 from odps import ODPS
@@ -26,7 +31,12 @@ from odps.apis.storage_api import (
     TableBatchScanResponse,
     TableBatchWriteResponse,
 )
-from odps.tunnel import TableDownloadSession, TableDownloadStatus, TableTunnel
+from odps.tunnel import (
+    TableDownloadSession,
+    TableDownloadStatus,
+    TableTunnel,
+    TableUploadSession,
+)
 from odps.types import OdpsSchema, PartitionSpec, timestamp_ntz
 from odps.utils import call_with_retry
 
@@ -38,12 +48,18 @@ except ImportError:
 from ...config import options
 from ...env import ODPS_STORAGE_API_ENDPOINT
 from ...utils import is_empty, sync_pyodps_options
+from .metacache import get_meta_cache
 from .schema import odps_schema_to_arrow_schema
 
 PartitionsType = Union[List[str], str, None]
+RowRangesType = List[Tuple[int, int]]
 
 _DEFAULT_ROW_BATCH_SIZE = 4096
-_DOWNLOAD_ID_CACHE_SIZE = 100
+# batches buffered for every source when reading concurrently
+_DEFAULT_PREFETCH_BATCHES = 4
+_PREFETCH_PUT_INTERVAL = 0.1
+# marks end of a source in prefetch queues
+_SOURCE_END = object()
 
 
 class ODPSTableIO(ABC):
@@ -58,6 +74,13 @@ class ODPSTableIO(ABC):
     def __init__(self, odps: ODPS):
         self._odps = odps
 
+    def _get_table(self, full_table_name: str):
+        return get_meta_cache(self._odps).get_table(full_table_name)
+
+    def _invalidate_table(self, full_table_name: str) -> None:
+        # data written, thus partitions and record counts are changed
+        get_meta_cache(self._odps).invalidate([full_table_name])
+
     @classmethod
     def _get_reader_schema(
         cls,
@@ -92,7 +115,19 @@ class ODPSTableIO(ABC):
         stop: Optional[int] = None,
         reverse_range: bool = False,
         row_batch_size: int = _DEFAULT_ROW_BATCH_SIZE,
+        concurrency: int = 1,
+        ordered: bool = True,
+        ranges: Optional[RowRangesType] = None,
     ):
+        """
+        Open a reader of the table. Data can be read with at most `concurrency`
+        threads, and batches might be returned out of order for better
+        throughput if `ordered` is False.
+
+        If `ranges` is specified as a list of non-negative (start, stop) pairs,
+        rows in all these ranges are read one after another within a single
+        read session, and `start`, `stop` and `reverse_range` are ignored.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -104,6 +139,135 @@ class ODPSTableIO(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    def open_multi_block_writer(
+        self,
+        full_table_name: str,
+        partition: Optional[str] = None,
+        overwrite: bool = True,
+    ):
+        """
+        Open a writer whose blocks can be written concurrently by different
+        threads with `open_block`. All blocks are committed in the order of
+        block ids once the context exits.
+        """
+        raise NotImplementedError
+
+
+class ConcurrentBatchReader:
+    """
+    Read batches from multiple sources with a thread pool. Every source is
+    a callable returning an iterator of batches, and at most
+    `prefetch_batches` batches are buffered for every source being read.
+    Batches are returned in order of sources if `ordered` is True, otherwise
+    in the order they are read. Sources are read one by one in the calling
+    thread if `concurrency` is not greater than 1.
+    """
+
+    def __init__(
+        self,
+        sources: Iterator[Callable[[], Iterator[pa.RecordBatch]]],
+        concurrency: int,
+        ordered: bool = True,
+        prefetch_batches: int = _DEFAULT_PREFETCH_BATCHES,
+        thread_name_prefix: str = "ConcurrentBatchRead",
+    ):
+        self._sources = iter(sources)
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._prefetch_batches = prefetch_batches
+        self._thread_name_prefix = thread_name_prefix
+
+        self._pool = None
+        self._stopped = threading.Event()
+        # queues of sources being read in source order if ordered,
+        #  otherwise a queue shared by all sources
+        self._source_queues = deque()
+        self._n_reading_sources = 0
+        # iterator of the source being read when reading serially
+        self._cur_batches = None
+
+    def _put_item(self, source_queue: queue.Queue, item) -> None:
+        while not self._stopped.is_set():
+            try:
+                source_queue.put(item, timeout=_PREFETCH_PUT_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    def _read_source(self, source: Callable, source_queue: queue.Queue) -> None:
+        try:
+            if self._stopped.is_set():
+                return
+            for batch in source():
+                if self._stopped.is_set():
+                    break
+                self._put_item(source_queue, batch)
+        except BaseException as ex:  # pylint: disable=broad-except
+            self._put_item(source_queue, ex)
+        finally:
+            self._put_item(source_queue, _SOURCE_END)
+
+    def _submit_next_source(self) -> None:
+        source = next(self._sources, None)
+        if source is None:
+            return
+        if self._ordered:
+            source_queue = queue.Queue(self._prefetch_batches)
+            self._source_queues.append(source_queue)
+        else:
+            source_queue = self._source_queues[0]
+        self._n_reading_sources += 1
+        self._pool.submit(
+            contextvars.copy_context().run, self._read_source, source, source_queue
+        )
+
+    def _read_serially(self) -> Optional[pa.RecordBatch]:
+        while not self._stopped.is_set():
+            if self._cur_batches is None:
+                source = next(self._sources, None)
+                if source is None:
+                    return None
+                self._cur_batches = iter(source())
+            batch = next(self._cur_batches, None)
+            if batch is not None:
+                return batch
+            self._cur_batches = None
+        return None
+
+    def read(self) -> Optional[pa.RecordBatch]:
+        if self._concurrency <= 1:
+            return self._read_serially()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                self._concurrency, thread_name_prefix=self._thread_name_prefix
+            )
+            if not self._ordered:
+                self._source_queues.append(
+                    queue.Queue(self._prefetch_batches * self._concurrency)
+                )
+            for _ in range(self._concurrency):
+                self._submit_next_source()
+
+        while self._n_reading_sources > 0:
+            item = self._source_queues[0].get()
+            if item is _SOURCE_END:
+                self._n_reading_sources -= 1
+                if self._ordered:
+                    self._source_queues.popleft()
+                self._submit_next_source()
+            elif isinstance(item, BaseException):
+                self.close()
+                raise item
+            else:
+                return item
+        return None
+
+    def close(self):
+        self._stopped.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
 
 class TunnelMultiPartitionReader:
     def __init__(
@@ -116,9 +280,14 @@ class TunnelMultiPartitionReader:
         start: Optional[int] = None,
         count: Optional[int] = None,
         partition_to_download_ids: Dict[str, str] = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        ranges: Optional[RowRangesType] = None,
     ):
         self._odps_entry = odps_entry
-        self._table = odps_entry.get_table(table_name)
+        self._table_name = table_name
+        self._meta_cache = get_meta_cache(odps_entry)
+        self._table = self._meta_cache.get_table(table_name)
         self._columns = columns
 
         odps_schema = ODPSTableIO._get_reader_schema(
@@ -129,6 +298,7 @@ class TunnelMultiPartitionReader:
         self._start = start or 0
         self._count = count
         self._row_left = count
+        self._ranges = ranges
 
         self._cur_reader = None
         self._reader_iter = None
@@ -139,7 +309,7 @@ class TunnelMultiPartitionReader:
             if not self._table.table_schema.partitions:
                 self._partitions = [None]
             else:
-                self._partitions = [str(pt) for pt in self._table.partitions]
+                self._partitions = self._meta_cache.get_partitions(table_name)
         elif isinstance(partitions, str):
             self._partitions = [partitions]
         else:
@@ -148,8 +318,14 @@ class TunnelMultiPartitionReader:
         self._partition_cols = partition_columns
         self._partition_to_download_ids = partition_to_download_ids or dict()
 
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._concurrent_reader = None
+
     @property
     def count(self) -> Optional[int]:
+        if self._ranges is not None:
+            return sum(stop - start for start, stop in self._ranges)
         if len(self._partitions) > 1:
             return None
         return self._count
@@ -169,12 +345,19 @@ class TunnelMultiPartitionReader:
 
             part_str = self._partitions[self._cur_partition_id]
             req_columns = self._schema.names
+            down_id = self._partition_to_download_ids.get(part_str)
+            if down_id is None:
+                # reuse download sessions created recently
+                down_session, fresh = self._meta_cache.get_download_session(
+                    self._table_name, part_str
+                )
+                down_id = down_session.id if fresh else None
             with sync_pyodps_options():
                 self._cur_reader = self._table.open_reader(
                     part_str,
                     columns=req_columns,
                     arrow=True,
-                    download_id=self._partition_to_download_ids.get(part_str),
+                    download_id=down_id,
                     append_partitions=True,
                 )
             if self._cur_reader.count + self._reader_start_pos > self._start:
@@ -191,7 +374,71 @@ class TunnelMultiPartitionReader:
         else:
             self._cur_reader = None
 
+    def _iter_partition_batches(
+        self, part_str: Optional[str], download_id: str, start: int, count: int
+    ) -> Iterator[pa.RecordBatch]:
+        with sync_pyodps_options():
+            reader = self._table.open_reader(
+                part_str,
+                columns=self._schema.names,
+                arrow=True,
+                download_id=download_id,
+                append_partitions=True,
+            )
+            yield from reader.read(start, count)
+
+    def _iter_partition_sources(self) -> Iterator[Callable]:
+        # download sessions of all partitions are created in advance to get
+        #  their sizes, thus ranges to read in every partition can be computed
+        with sync_pyodps_options():
+            part_to_sessions = TunnelTableIO.create_download_sessions(
+                self._odps_entry,
+                self._table_name,
+                self._partitions,
+                concurrency=self._concurrency,
+            )
+
+        if self._ranges is not None:
+            ranges = self._ranges
+        else:
+            stop = self._start + self._count if self._count is not None else None
+            ranges = [(self._start, stop)]
+
+        for start, stop in ranges:
+            part_start_pos = 0
+            for part_str in self._partitions:
+                session = part_to_sessions[part_str]
+                part_stop_pos = part_start_pos + session.count
+                read_start = max(start, part_start_pos)
+                read_stop = part_stop_pos if stop is None else min(stop, part_stop_pos)
+                if read_start < read_stop:
+                    yield functools.partial(
+                        self._iter_partition_batches,
+                        part_str,
+                        session.id,
+                        read_start - part_start_pos,
+                        read_stop - read_start,
+                    )
+                if stop is not None and part_stop_pos >= stop:
+                    break
+                part_start_pos = part_stop_pos
+
+    def _read_concurrently(self) -> Optional[pa.RecordBatch]:
+        if self._concurrent_reader is None:
+            self._concurrent_reader = ConcurrentBatchReader(
+                self._iter_partition_sources(),
+                self._concurrency,
+                ordered=self._ordered,
+                thread_name_prefix="TunnelTableRead",
+            )
+        return self._concurrent_reader.read()
+
     def read(self):
+        if self._ranges is not None or (
+            self._concurrency > 1 and len(self._partitions) > 1
+        ):
+            return self._read_concurrently()
+
         with sync_pyodps_options():
             if self._cur_reader is None:
                 self._open_next_reader()
@@ -219,33 +466,60 @@ class TunnelMultiPartitionReader:
             return self._schema.empty_table()
         return pa.Table.from_batches(batches)
 
+    def close(self):
+        if self._concurrent_reader is not None:
+            self._concurrent_reader.close()
 
-class TunnelTableIO(ODPSTableIO):
-    _down_session_ids = OrderedDict()
 
+class TunnelMultiBlockWriter:
+    def __init__(self, upload_session: TableUploadSession):
+        self._upload_session = upload_session
+        self._block_ids = []
+        self._lock = threading.Lock()
+
+    @property
+    def block_ids(self) -> List[int]:
+        return sorted(self._block_ids)
+
+    @contextmanager
+    def open_block(self, block_id: int):
+        with sync_pyodps_options():
+            with self._upload_session.open_arrow_writer(block_id) as writer:
+                yield writer
+        with self._lock:
+            self._block_ids.append(block_id)
+
+
+class TunnelTableIO(ODPSTableIO):
     @classmethod
     def create_download_sessions(
         cls,
         odps_entry: ODPS,
         full_table_name: str,
         partitions: List[Optional[str]] = None,
+        concurrency: int = 1,
     ) -> Dict[Optional[str], TableDownloadSession]:
-        table = odps_entry.get_table(full_table_name)
+        meta_cache = get_meta_cache(odps_entry)
+        table = meta_cache.get_table(full_table_name)
         tunnel = TableTunnel(odps_entry, quota_name=options.tunnel_quota_name)
         parts = (
             [partitions]
             if partitions is None or isinstance(partitions, str)
             else partitions
         )
-        part_to_session = dict()
-        for part in parts:
-            part_key = (full_table_name, part)
-            down_session = None
 
-            if part_key in cls._down_session_ids:
-                down_id = cls._down_session_ids[part_key]
+        def create_session(part: Optional[str]) -> TableDownloadSession:
+            down_session, fresh = meta_cache.get_download_session(full_table_name, part)
+            if down_session is not None and fresh:
+                return down_session
+
+            if down_session is not None:
+                # reuse the download session if it is still valid
                 down_session = tunnel.create_download_session(
-                    table, async_mode=True, partition_spec=part, download_id=down_id
+                    table,
+                    async_mode=True,
+                    partition_spec=part,
+                    download_id=down_session.id,
                 )
                 if down_session.status != TableDownloadStatus.Normal:
                     down_session = None
@@ -254,10 +528,24 @@ class TunnelTableIO(ODPSTableIO):
                 down_session = tunnel.create_download_session(
                     table, async_mode=True, partition_spec=part
                 )
+            return down_session
+
+        concurrency = min(concurrency, len(parts))
+        if concurrency <= 1:
+            down_sessions = [create_session(part) for part in parts]
+        else:
+            with ThreadPoolExecutor(
+                concurrency, thread_name_prefix="CreateDownloadSession"
+            ) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, create_session, part)
+                    for part in parts
+                ]
+                down_sessions = [fut.result() for fut in futures]
 
-            while len(cls._down_session_ids) >= _DOWNLOAD_ID_CACHE_SIZE:
-                cls._down_session_ids.popitem(False)
-            cls._down_session_ids[part_key] = down_session.id
+        part_to_session = dict()
+        for part, down_session in zip(parts, down_sessions):
+            meta_cache.put_download_session(full_table_name, part, down_session)
             part_to_session[part] = down_session
         return part_to_session
 
@@ -272,16 +560,22 @@ class TunnelTableIO(ODPSTableIO):
         stop: Optional[int] = None,
         reverse_range: bool = False,
         row_batch_size: int = _DEFAULT_ROW_BATCH_SIZE,
+        concurrency: int = 1,
+        ordered: bool = True,
+        ranges: Optional[RowRangesType] = None,
     ):
         with sync_pyodps_options():
-            table = self._odps.get_table(full_table_name)
+            table = self._get_table(full_table_name)
 
         if partition_columns is True:
             partition_columns = [c.name for c in table.table_schema.partitions]
 
         total_records = None
         part_to_down_id = None
-        if (
+        if ranges is not None:
+            start = stop = None
+            reverse_range = False
+        elif (
             (start is not None and start < 0)
             or (stop is not None and stop < 0)
             or (reverse_range and start is None)
@@ -313,7 +607,7 @@ class TunnelTableIO(ODPSTableIO):
             else:
                 count = stop - start if stop is not None and start is not None else None
 
-        yield TunnelMultiPartitionReader(
+        reader = TunnelMultiPartitionReader(
             self._odps,
             full_table_name,
             partitions=partitions,
@@ -322,7 +616,14 @@ class TunnelTableIO(ODPSTableIO):
             start=start,
             count=count,
             partition_to_download_ids=part_to_down_id,
+            concurrency=concurrency,
+            ordered=ordered,
+            ranges=ranges,
         )
+        try:
+            yield reader
+        finally:
+            reader.close()
 
     @contextmanager
     def open_writer(
@@ -331,7 +632,7 @@ class TunnelTableIO(ODPSTableIO):
         partition: Optional[str] = None,
         overwrite: bool = True,
     ):
-        table = self._odps.get_table(full_table_name)
+        table = self._get_table(full_table_name)
         with sync_pyodps_options():
             with table.open_writer(
                 partition=partition,
@@ -340,6 +641,27 @@ class TunnelTableIO(ODPSTableIO):
                 overwrite=overwrite,
             ) as writer:
                 yield writer
+        self._invalidate_table(full_table_name)
+
+    @contextmanager
+    def open_multi_block_writer(
+        self,
+        full_table_name: str,
+        partition: Optional[str] = None,
+        overwrite: bool = True,
+    ):
+        table = self._get_table(full_table_name)
+        tunnel = TableTunnel(self._odps, quota_name=options.tunnel_quota_name)
+        session_kw = {"create_partition": True} if partition is not None else {}
+        with sync_pyodps_options():
+            upload_session = tunnel.create_upload_session(
+                table, partition_spec=partition, overwrite=overwrite, **session_kw
+            )
+        writer = TunnelMultiBlockWriter(upload_session)
+        yield writer
+        with sync_pyodps_options():
+            upload_session.commit(writer.block_ids)
+        self._invalidate_table(full_table_name)
 
 
 class HaloTableArrowReader:
@@ -351,52 +673,65 @@ class HaloTableArrowReader:
         start: Optional[int] = None,
         count: Optional[int] = None,
         row_batch_size: Optional[int] = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        prefetch_batches: int = _DEFAULT_PREFETCH_BATCHES,
+        ranges: Optional[RowRangesType] = None,
     ):
         self._client = client
         self._scan_info = scan_info
 
-        self._cur_split_id = -1
-        self._cur_reader = None
-
         self._odps_schema = odps_schema
         self._arrow_schema = odps_schema_to_arrow_schema(odps_schema)
 
-        self._start = start
-        self._count = count
-        self._cursor = 0
+        if ranges is None and start is not None:
+            ranges = [(start, start + count)]
+        self._ranges = ranges
+        self._count = (
+            count if ranges is None else sum(stop - start for start, stop in ranges)
+        )
         self._row_batch_size = row_batch_size
 
+        self._batch_reader = ConcurrentBatchReader(
+            (
+                functools.partial(self._iter_split_batches, req)
+                for req in self._iter_read_requests()
+            ),
+            concurrency,
+            ordered=ordered,
+            prefetch_batches=prefetch_batches,
+            thread_name_prefix="HaloTableRead",
+        )
+
     @property
     def count(self) -> int:
         return self._count
 
-    def _open_next_reader(self):
+    def _iter_read_requests(self):
         from odps.apis.storage_api import ReadRowsRequest
 
-        if 0 <= self._scan_info.split_count <= self._cur_split_id + 1:
+        split_id = 0
+        if self._ranges is None:
             # scan by split
-            self._cur_reader = None
-            return
-        elif self._count is not None and self._cursor >= self._count:
-            # scan by range
-            self._cur_reader = None
+            while not 0 <= self._scan_info.split_count <= split_id:
+                yield ReadRowsRequest(
+                    session_id=self._scan_info.session_id, split_index=split_id
+                )
+                split_id += 1
             return
 
-        read_rows_kw = {}
-        if self._start is not None:
-            read_rows_kw["row_index"] = self._start + self._cursor
-            read_rows_kw["row_count"] = min(
-                self._row_batch_size, self._count - self._cursor
-            )
-            self._cursor = min(self._count, self._cursor + self._row_batch_size)
-
-        req = ReadRowsRequest(
-            session_id=self._scan_info.session_id,
-            split_index=self._cur_split_id + 1,
-            **read_rows_kw,
-        )
-        self._cur_reader = call_with_retry(self._client.read_rows_arrow, req)
-        self._cur_split_id += 1
+        # scan by ranges
+        for range_start, range_stop in self._ranges:
+            for row_index in range(range_start, range_stop, self._row_batch_size):
+                if 0 <= self._scan_info.split_count <= split_id:
+                    return
+                yield ReadRowsRequest(
+                    session_id=self._scan_info.session_id,
+                    split_index=split_id,
+                    row_index=row_index,
+                    row_count=min(self._row_batch_size, range_stop - row_index),
+                )
+                split_id += 1
 
     def _convert_timezone(self, batch: pa.RecordBatch) -> pa.RecordBatch:
         timezone = options.local_timezone
@@ -426,17 +761,16 @@ class HaloTableArrowReader:
 
         return pa.RecordBatch.from_arrays(cols, names=batch.schema.names)
 
+    def _iter_split_batches(self, req) -> Iterator[pa.RecordBatch]:
+        reader = call_with_retry(self._client.read_rows_arrow, req)
+        while True:
+            batch = reader.read()
+            if batch is None:
+                break
+            yield self._convert_timezone(batch)
+
     def read(self):
-        if self._cur_reader is None:
-            self._open_next_reader()
-            if self._cur_reader is None:
-                return None
-        while self._cur_reader is not None:
-            batch = self._cur_reader.read()
-            if batch is not None:
-                return self._convert_timezone(batch)
-            self._open_next_reader()
-        return None
+        return self._batch_reader.read()
 
     def read_all(self) -> pa.Table:
         batches = []
@@ -449,6 +783,9 @@ class HaloTableArrowReader:
             return self._arrow_schema.empty_table()
         return pa.Table.from_batches(batches)
 
+    def close(self):
+        self._batch_reader.close()
+
 
 class HaloTableArrowWriter:
     def __init__(
@@ -456,11 +793,13 @@ class HaloTableArrowWriter:
         client: StorageApiArrowClient,
         write_info: TableBatchWriteResponse,
         odps_schema: OdpsSchema,
+        block_number: int = 0,
     ):
         self._client = client
         self._write_info = write_info
         self._odps_schema = odps_schema
         self._arrow_schema = odps_schema_to_arrow_schema(odps_schema)
+        self._block_number = block_number
 
         self._writer = None
 
@@ -469,7 +808,9 @@ class HaloTableArrowWriter:
 
         self._writer = call_with_retry(
             self._client.write_rows_arrow,
-            WriteRowsRequest(self._write_info.session_id),
+            WriteRowsRequest(
+                self._write_info.session_id, block_number=self._block_number
+            ),
         )
 
     @classmethod
@@ -526,6 +867,38 @@ class HaloTableArrowWriter:
         return commit_msg
 
 
+class HaloTableMultiBlockWriter:
+    def __init__(
+        self,
+        client: StorageApiArrowClient,
+        write_info: TableBatchWriteResponse,
+        odps_schema: OdpsSchema,
+    ):
+        self._client = client
+        self._write_info = write_info
+        self._odps_schema = odps_schema
+        self._block_to_commit_msg = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def commit_messages(self) -> List[str]:
+        return [
+            self._block_to_commit_msg[block_id]
+            for block_id in sorted(self._block_to_commit_msg)
+        ]
+
+    @contextmanager
+    def open_block(self, block_id: int):
+        writer = HaloTableArrowWriter(
+            self._client, self._write_info, self._odps_schema, block_number=block_id
+        )
+        writer.open()
+        yield writer
+        commit_msg = writer.close()
+        with self._lock:
+            self._block_to_commit_msg[block_id] = commit_msg
+
+
 class HaloTableIO(ODPSTableIO):
     _storage_api_endpoint = os.getenv(ODPS_STORAGE_API_ENDPOINT)
 
@@ -551,6 +924,9 @@ class HaloTableIO(ODPSTableIO):
         stop: Optional[int] = None,
         reverse_range: bool = False,
         row_batch_size: int = _DEFAULT_ROW_BATCH_SIZE,
+        concurrency: int = 1,
+        ordered: bool = True,
+        ranges: Optional[RowRangesType] = None,
     ):
         from odps.apis.storage_api import (
             SessionRequest,
@@ -559,7 +935,7 @@ class HaloTableIO(ODPSTableIO):
             TableBatchScanRequest,
         )
 
-        table = self._odps.get_table(full_table_name)
+        table = self._get_table(full_table_name)
         client = StorageApiArrowClient(
             self._odps,
             table,
@@ -568,7 +944,10 @@ class HaloTableIO(ODPSTableIO):
         )
 
         split_option = SplitOptions.SplitMode.SIZE
-        if start is not None or stop is not None:
+        if ranges is not None:
+            start = stop = None
+            split_option = SplitOptions.SplitMode.ROW_OFFSET
+        elif start is not None or stop is not None:
             split_option = SplitOptions.SplitMode.ROW_OFFSET
 
         scan_kw = {
@@ -616,29 +995,31 @@ class HaloTableIO(ODPSTableIO):
         reader_schema = self._get_reader_schema(
             table.table_schema, columns, partition_columns
         )
-        yield HaloTableArrowReader(
+        reader = HaloTableArrowReader(
             client,
             resp,
             odps_schema=reader_schema,
             start=start,
             count=count,
             row_batch_size=row_batch_size,
+            concurrency=concurrency,
+            ordered=ordered,
+            ranges=ranges,
         )
+        try:
+            yield reader
+        finally:
+            reader.close()
 
-    @contextmanager
-    def open_writer(
+    def _create_write_session(
         self,
         full_table_name: str,
         partition: Optional[str] = None,
         overwrite: bool = True,
     ):
-        from odps.apis.storage_api import (
-            SessionRequest,
-            SessionStatus,
-            TableBatchWriteRequest,
-        )
+        from odps.apis.storage_api import TableBatchWriteRequest
 
-        table = self._odps.get_table(full_table_name)
+        table = self._get_table(full_table_name)
         client = StorageApiArrowClient(
             self._odps,
             table,
@@ -650,21 +1031,57 @@ class HaloTableIO(ODPSTableIO):
         part_str = part_strs[0] if part_strs else None
         req = TableBatchWriteRequest(partition_spec=part_str, overwrite=overwrite)
         resp = call_with_retry(client.create_write_session, req)
+        return table, client, resp
 
-        session_id = resp.session_id
-        writer = HaloTableArrowWriter(client, resp, table.table_schema)
-        writer.open()
-
-        yield writer
+    @staticmethod
+    def _commit_write_session(
+        client: StorageApiArrowClient, session_id: str, commit_msgs: List[str]
+    ):
+        from odps.apis.storage_api import SessionRequest, SessionStatus
 
-        commit_msg = writer.close()
         resp = call_with_retry(
             client.commit_write_session,
             SessionRequest(session_id=session_id),
-            [commit_msg],
+            commit_msgs,
         )
         while resp.session_status == SessionStatus.COMMITTING:
             resp = call_with_retry(
                 client.get_write_session, SessionRequest(session_id=session_id)
             )
         assert resp.session_status == SessionStatus.COMMITTED
+
+    @contextmanager
+    def open_writer(
+        self,
+        full_table_name: str,
+        partition: Optional[str] = None,
+        overwrite: bool = True,
+    ):
+        table, client, resp = self._create_write_session(
+            full_table_name, partition, overwrite
+        )
+        writer = HaloTableArrowWriter(client, resp, table.table_schema)
+        writer.open()
+
+        yield writer
+
+        commit_msg = writer.close()
+        self._commit_write_session(client, resp.session_id, [commit_msg])
+        self._invalidate_table(full_table_name)
+
+    @contextmanager
+    def open_multi_block_writer(
+        self,
+        full_table_name: str,
+        partition: Optional[str] = None,
+        overwrite: bool = True,
+    ):
+        table, client, resp = self._create_write_session(
+            full_table_name, partition, overwrite
+        )
+        writer = HaloTableMultiBlockWriter(client, resp, table.table_schema)
+
+        yield writer
+
+        self._commit_write_session(client, resp.session_id, writer.commit_messages)
+        self._invalidate_table(full_table_name)
@@ -19,7 +19,7 @@ import pytest
 
 from maxframe.lib.dtypes_extension import dict_
 
-from ..arrow import arrow_to_pandas, pandas_to_arrow
+from ..arrow import arrow_to_export_table, arrow_to_pandas, pandas_to_arrow
 
 
 def test_dataframe_convert():
@@ -131,3 +131,88 @@ def test_datetime_with_tz_convert():
     assert arrow_data.column_names == ["_idx_0", "a"]
     pd_result = arrow_to_pandas(arrow_data, meta)
     pd.testing.assert_frame_equal(pd_data, pd_result)
+
+
+@pytest.mark.parametrize(
+    "pd_data",
+    [
+        pd.DataFrame(np.random.rand(100, 5), columns=list("ABCDE")),
+        pd.DataFrame(
+            np.random.rand(100, 2),
+            index=pd.MultiIndex.from_arrays(
+                [np.arange(100), np.random.choice(list("ABC"), 100)],
+                names=["i1", "i2"],
+            ),
+            columns=pd.MultiIndex.from_tuples([("A", "A"), ("A", "B")]),
+        ),
+        pd.DataFrame(
+            {
+                "a": pd.to_datetime(pd.Series([1609459200, 1609545600]), unit="s"),
+                "b": ["x", "y"],
+            },
+            index=pd.Index([3, 4], name="idx"),
+        ),
+        pd.Series(np.random.rand(100), name="series_name"),
+        pd.Index(np.random.rand(100), name="idx_name"),
+    ],
+)
+def test_self_destruct_convert(pd_data):
+    arrow_data, meta = pandas_to_arrow(pd_data)
+    pd_res = arrow_to_pandas(arrow_data, meta, self_destruct=True)
+    if isinstance(pd_data, pd.DataFrame):
+        pd.testing.assert_frame_equal(pd_data, pd_res)
+        # columns are not consolidated after conversion
+        assert pd_res._mgr.nblocks == pd_res.shape[1]
+    elif isinstance(pd_data, pd.Series):
+        pd.testing.assert_series_equal(pd_data, pd_res)
+    else:
+        pd.testing.assert_index_equal(pd_data, pd_res)
+
+
+def test_self_destruct_convert_writable():
+    pd_data = pd.DataFrame(np.random.rand(100, 3), columns=list("ABC"))
+    arrow_data, meta = pandas_to_arrow(pd_data)
+    pd_res = arrow_to_pandas(arrow_data, meta, self_destruct=True)
+    if not pd.options.mode.copy_on_write:
+        # arrays share memory with arrow buffers without copies
+        assert not pd_res["A"].values.flags.writeable
+
+    arrow_data, meta = pandas_to_arrow(pd_data)
+    pd_res = arrow_to_pandas(arrow_data, meta, self_destruct=True, writable=True)
+    pd_res.iloc[0, 0] = 1.0
+    pd_res["B"] += 1.0
+    pd.testing.assert_series_equal(pd_res["B"], pd_data["B"] + 1.0)
+
+    arrow_data, meta = pandas_to_arrow(pd_data["A"])
+    pd_res = arrow_to_pandas(arrow_data, meta, self_destruct=True, writable=True)
+    pd_res.iloc[0] = 1.0
+    assert pd_res.iloc[0] == 1.0
+
+
+def test_export_table_convert():
+    pd_data = pd.DataFrame(np.random.rand(10, 2), columns=["A", ("b", 1)])
+    pd_data.index = pd.MultiIndex.from_arrays(
+        [np.arange(10), np.arange(10) * 2], names=["k", None]
+    )
+    arrow_data, meta = pandas_to_arrow(pd_data)
+    exported = arrow_to_export_table(arrow_data, meta)
+    assert exported.column_names == ["k", "level_1", "A", "b_1"]
+    pd.testing.assert_frame_equal(
+        exported.to_pandas(),
+        pd_data.reset_index().set_axis(exported.column_names, axis=1),
+    )
+
+    exported = arrow_to_export_table(arrow_data.drop(["_idx_0"]), meta, index=False)
+    assert exported.column_names == ["A", "b_1"]
+
+    pd_series = pd.Series(np.random.rand(10))
+    arrow_data, meta = pandas_to_arrow(pd_series)
+    exported = arrow_to_export_table(arrow_data, meta)
+    pd.testing.assert_frame_equal(
+        exported.to_pandas(), pd_series.reset_index().rename(columns=str)
+    )
+
+    pd_data = pd.DataFrame(np.random.rand(10, 2), columns=["index", "b"])
+    arrow_data, meta = pandas_to_arrow(pd_data)
+    with pytest.raises(ValueError):
+        arrow_to_export_table(arrow_data, meta)
@@ -0,0 +1,83 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import time
+
+import mock
+
+from ....config import option_context
+from ..metacache import get_meta_cache, invalidate_meta_cache
+from ..tableio import TunnelTableIO
+
+
+class MockODPSEntry:
+    def __init__(self):
+        self.get_table = mock.Mock(
+            side_effect=lambda name: mock.Mock(partitions=["pt=1", "pt=2"])
+        )
+
+
+def test_meta_cache():
+    odps_entry = MockODPSEntry()
+    cache = get_meta_cache(odps_entry)
+    assert get_meta_cache(odps_entry) is cache
+
+    table = cache.get_table("table1")
+    assert cache.get_table("table1") is table
+    assert cache.get_partitions("table1") == ["pt=1", "pt=2"]
+    assert odps_entry.get_table.call_count == 1
+
+    assert cache.get_record_count("table1", ["pt=1"]) is None
+    cache.put_download_session("table1", "pt=1", mock.Mock(id="id1", count=10))
+    cache.put_download_session("table1", "pt=2", mock.Mock(id="id2", count=5))
+    assert cache.get_record_count("table1", ["pt=1", "pt=2"]) == 15
+
+    with option_context({"session.odps_meta_cache_ttl": 0.1}):
+        time.sleep(0.2)
+        # expired sessions are kept to be reloaded
+        session, fresh = cache.get_download_session("table1", "pt=1")
+        assert session.id == "id1" and not fresh
+        assert cache.get_record_count("table1", ["pt=1"]) is None
+        assert cache.get_table("table1") is not table
+        assert odps_entry.get_table.call_count == 2
+
+    invalidate_meta_cache(odps_entry, ["table1"])
+    assert cache.get_download_session("table1", "pt=1") == (None, False)
+    cache.get_table("table1")
+    assert odps_entry.get_table.call_count == 3
+
+    # caches are released with entries
+    del cache, odps_entry
+    gc.collect()
+    invalidate_meta_cache(MockODPSEntry())
+
+
+def test_create_download_sessions_with_cache():
+    odps_entry = MockODPSEntry()
+    sessions = [mock.Mock(id=f"id{i}", count=10) for i in range(2)]
+    with mock.patch("maxframe.io.odpsio.tableio.TableTunnel") as tunnel_cls:
+        tunnel_cls.return_value.create_download_session.side_effect = sessions
+        part_to_sessions = TunnelTableIO.create_download_sessions(
+            odps_entry, "table1", ["pt=1", "pt=2"]
+        )
+        assert [s.id for s in part_to_sessions.values()] == ["id0", "id1"]
+        assert get_meta_cache(odps_entry).get_record_count("table1", ["pt=1"]) == 10
+
+        # fresh sessions are reused directly
+        part_to_sessions = TunnelTableIO.create_download_sessions(
+            odps_entry, "table1", ["pt=1", "pt=2"]
+        )
+        assert [s.id for s in part_to_sessions.values()] == ["id0", "id1"]
+        assert tunnel_cls.return_value.create_download_session.call_count == 2
@@ -13,17 +13,26 @@
 # limitations under the License.
 
 import datetime
+import time
 
+import mock
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pytest
 from odps import ODPS
+from odps import types as odps_types
+from odps.types import Column, OdpsSchema, Partition
 
 from ....config import options
 from ....tests.utils import flaky, tn
 from ....utils import config_odps_default_options
-from ..tableio import ODPSTableIO
+from ..tableio import (
+    HaloTableArrowReader,
+    ODPSTableIO,
+    TunnelMultiPartitionReader,
+    TunnelTableIO,
+)
 
 
 @pytest.fixture
@@ -126,10 +135,177 @@ def test_table_io_with_range_reader(switch_table_io):
                 reader.read_all().to_pandas(),
                 pd_data.iloc[-51:-1].reset_index(drop=True),
             )
+
+        with table_io.open_reader(
+            no_part_table_name, start=5, stop=95, row_batch_size=10, concurrency=3
+        ) as reader:
+            pd.testing.assert_frame_equal(
+                reader.read_all().to_pandas(),
+                pd_data.iloc[5:95].reset_index(drop=True),
+            )
     finally:
         tb.drop()
 
 
+class MockSplitReader:
+    def __init__(self, batches, fail=False):
+        self._batches = list(batches)
+        self._fail = fail
+
+    def read(self):
+        if not self._batches:
+            if self._fail:
+                raise ValueError("Mock read failure")
+            return None
+        # delay earlier splits to shuffle finish orders
+        time.sleep(0.01 * len(self._batches))
+        return self._batches.pop(0)
+
+
+class MockStorageApiClient:
+    def __init__(self, split_batches, failed_split=None):
+        self._split_batches = split_batches
+        self._failed_split = failed_split
+
+    def read_rows_arrow(self, req):
+        return MockSplitReader(
+            self._split_batches[req.split_index],
+            fail=req.split_index == self._failed_split,
+        )
+
+
+@pytest.mark.parametrize("concurrency, ordered", [(1, True), (3, True), (3, False)])
+def test_halo_reader_concurrently(concurrency, ordered):
+    odps_schema = OdpsSchema([Column("a", odps_types.bigint)])
+    split_batches = [
+        [pa.RecordBatch.from_arrays([pa.array([i * 10 + j])], ["a"]) for j in range(3)]
+        for i in range(8)
+    ]
+    scan_info = mock.Mock(session_id="mock_session", split_count=len(split_batches))
+
+    reader = HaloTableArrowReader(
+        MockStorageApiClient(split_batches),
+        scan_info,
+        odps_schema,
+        concurrency=concurrency,
+        ordered=ordered,
+        prefetch_batches=1,
+    )
+    result = reader.read_all().to_pandas()["a"].tolist()
+    reader.close()
+
+    expected = [i * 10 + j for i in range(8) for j in range(3)]
+    if ordered:
+        assert result == expected
+    else:
+        assert sorted(result) == expected
+
+    reader = HaloTableArrowReader(
+        MockStorageApiClient(split_batches, failed_split=4),
+        scan_info,
+        odps_schema,
+        concurrency=concurrency,
+        ordered=ordered,
+    )
+    with pytest.raises(ValueError):
+        reader.read_all()
+
+
+def test_halo_reader_ranges():
+    odps_schema = OdpsSchema([Column("a", odps_types.bigint)])
+    requests = []
+
+    def read_rows_arrow(req):
+        requests.append((req.row_index, req.row_count))
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(range(req.row_index, req.row_index + req.row_count))], ["a"]
+        )
+        return MockSplitReader([batch])
+
+    client = mock.Mock(read_rows_arrow=read_rows_arrow)
+    scan_info = mock.Mock(session_id="mock_session", split_count=-1)
+    reader = HaloTableArrowReader(
+        client,
+        scan_info,
+        odps_schema,
+        row_batch_size=4,
+        ranges=[(0, 6), (94, 100)],
+    )
+    assert reader.count == 12
+    result = reader.read_all()["a"].to_pylist()
+    assert result == list(range(6)) + list(range(94, 100))
+    assert requests == [(0, 4), (4, 2), (94, 4), (98, 2)]
+
+
+class MockTunnelPartitionReader:
+    def __init__(self, data: pa.Table):
+        self._data = data
+
+    def read(self, start, count):
+        time.sleep(0.01 * (10 - self._data["a"][0].as_py() // 100))
+        data = self._data.slice(start, count)
+        for batch in data.to_batches(max_chunksize=3):
+            yield batch
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_tunnel_reader_concurrently(ordered):
+    schema = OdpsSchema(
+        [Column("a", odps_types.bigint)], [Partition("pt", odps_types.string)]
+    )
+    partitions = [f"pt={i}" for i in range(10)]
+    part_data = {
+        pt: pa.table({"a": pa.array(range(i * 100, i * 100 + i + 5))})
+        for i, pt in enumerate(partitions)
+    }
+    table = mock.Mock(table_schema=schema)
+    table.open_reader.side_effect = lambda pt, **_: MockTunnelPartitionReader(
+        part_data[pt]
+    )
+    odps_entry = mock.Mock()
+    odps_entry.get_table.return_value = table
+
+    def create_download_sessions(odps_entry, table_name, parts, concurrency=1):
+        return {
+            pt: mock.Mock(id=f"down_{pt}", count=part_data[pt].num_rows) for pt in parts
+        }
+
+    all_data = pa.concat_tables(part_data.values())["a"].to_pylist()
+    with mock.patch.object(
+        TunnelTableIO, "create_download_sessions", side_effect=create_download_sessions
+    ):
+        for start, count in [(None, None), (3, 20), (12, 50), (60, 1000)]:
+            reader = TunnelMultiPartitionReader(
+                odps_entry,
+                "mock_table",
+                partitions,
+                start=start,
+                count=count,
+                concurrency=4,
+                ordered=ordered,
+            )
+            result = reader.read_all()["a"].to_pylist()
+            reader.close()
+
+            start = start or 0
+            expected = all_data[start : start + count if count else None]
+            if ordered:
+                assert result == expected
+            else:
+                assert sorted(result) == expected
+
+        # multiple ranges are read with a single reader
+        ranges = [(2, 8), (40, 45), (70, 72)]
+        reader = TunnelMultiPartitionReader(
+            odps_entry, "mock_table", partitions, ranges=ranges, ordered=ordered
+        )
+        assert reader.count == 13
+        result = reader.read_all()["a"].to_pylist()
+        reader.close()
+        expected = [v for start, stop in ranges for v in all_data[start:stop]]
+        assert result == expected if ordered else sorted(result) == expected
+
+
 @flaky(max_runs=3)
 @pytest.mark.parametrize("switch_table_io", [False, True], indirect=True)
 def test_table_io_with_parts(switch_table_io):
@@ -161,3 +337,33 @@ def test_table_io_with_parts(switch_table_io):
             pd.testing.assert_frame_equal(reader.read_all().to_pandas(), expected_data)
     finally:
         tb.drop()
+
+
+@flaky(max_runs=3)
+@pytest.mark.parametrize("switch_table_io", [False, True], indirect=True)
+def test_table_io_with_multi_block_writer(switch_table_io):
+    config_odps_default_options()
+
+    o = ODPS.from_environments()
+    table_io = ODPSTableIO(o)
+
+    table_name = tn("test_multi_block_write_" + str(switch_table_io).lower())
+    o.delete_table(table_name, if_exists=True)
+    tb = o.create_table(
+        table_name, ",".join(f"{c} double" for c in "abcde"), lifecycle=1
+    )
+
+    try:
+        pd_data = pd.DataFrame(np.random.rand(100, 5), columns=list("abcde"))
+        with table_io.open_multi_block_writer(table_name) as writer:
+            # write blocks in reversed order to check if orders are kept
+            for block_id in reversed(range(4)):
+                with writer.open_block(block_id) as block_writer:
+                    block_data = pd_data.iloc[block_id * 25 : (block_id + 1) * 25]
+                    block_writer.write(
+                        pa.Table.from_pandas(block_data, preserve_index=False)
+                    )
+        with table_io.open_reader(table_name) as reader:
+            pd.testing.assert_frame_equal(reader.read_all().to_pandas(), pd_data)
+    finally:
+        tb.drop()
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import io
+
+import mock
 import pytest
+import requests
 from odps import ODPS
+from odps import options as odps_options
 
 from ....tests.utils import tn
-from ..volumeio import ODPSVolumeReader, ODPSVolumeWriter
+from ..volumeio import ODPSVolumeReader, ODPSVolumeWriter, VolumeFileStream
 
 
 @pytest.fixture
@@ -110,3 +116,101 @@ def test_read_write_volume(create_volume):
     assert reader.read_file("file2") == b"content2"
 
     assert ["file1", "file2"] == sorted(reader.list_files())
+
+    with reader.open_file("file1", offset=2, length=3) as stream:
+        assert stream.read() == b"nte"
+    buf = bytearray(4)
+    reader.read_file_into("file2", buf, offset=4)
+    assert bytes(buf) == b"ent2"
+    assert reader.read_files() == {"file1": b"content1", "file2": b"content2"}
+
+
+def test_volume_file_stream():
+    stream = VolumeFileStream(io.BytesIO(b"0123456789"), length=6)
+    # skipped bytes are not counted in the length
+    stream.skip(2)
+    buf = bytearray(4)
+    stream.readinto_exactly(buf)
+    assert bytes(buf) == b"2345"
+    assert stream.read() == b"67"
+    assert stream.read() == b""
+
+    stream = VolumeFileStream(io.BytesIO(b"0123"))
+    with pytest.raises(IOError):
+        stream.readinto_exactly(bytearray(5))
+
+
+def _make_ranged_odps_entry():
+    odps_entry = mock.MagicMock()
+    odps_entry.get_volume.return_value.get_sign_url.return_value = (
+        "https://bucket-internal.oss.example.com/dir/file1?sign=1"
+    )
+    odps_entry.rest._proxy = {"https": "http://proxy.example.com"}
+    session = odps_entry.rest.session
+    session.merge_environment_settings.side_effect = (
+        lambda url, proxies, stream, verify, cert: {
+            "proxies": proxies,
+            "stream": stream,
+            "verify": verify,
+            "cert": cert,
+        }
+    )
+    return odps_entry
+
+
+def test_ranged_volume_reader():
+    odps_entry = _make_ranged_odps_entry()
+    session = odps_entry.rest.session
+    resp = mock.MagicMock(status_code=206, raw=io.BytesIO(b"nte"))
+    # failed connections are retried
+    session.get.side_effect = [requests.ConnectionError, resp]
+
+    reader = ODPSVolumeReader(odps_entry, "vol_name", "dir", replace_internal_host=True)
+    with reader.open_file("file1", offset=2, length=3) as stream:
+        assert stream.read() == b"nte"
+    assert session.get.call_count == 2
+    resp.close.assert_called_once()
+
+    args, kwargs = session.get.call_args
+    assert args[0] == "https://bucket.oss.example.com/dir/file1?sign=1"
+    assert kwargs["headers"] == {"Range": "bytes=2-4"}
+    assert kwargs["proxies"] == {"https": "http://proxy.example.com"}
+    assert kwargs["verify"] == odps_options.verify_ssl
+    assert kwargs["timeout"] == (
+        odps_options.connect_timeout,
+        odps_options.read_timeout,
+    )
+
+    # ranges not accepted by server
+    session.get.side_effect = None
+    session.get.return_value = mock.MagicMock(
+        status_code=200, raw=io.BytesIO(b"content1")
+    )
+    buf = bytearray(3)
+    reader.read_file_into("file1", buf, offset=2)
+    assert bytes(buf) == b"nte"
+
+
+class _NonRangedVolume:
+    name = "vol_name"
+
+    def __init__(self, files):
+        self.files = files
+
+    @contextlib.contextmanager
+    def open_reader(self, path, **_):
+        yield io.BytesIO(self.files[path])
+
+
+def test_non_ranged_volume_reader():
+    odps_entry = mock.MagicMock()
+    odps_entry.get_volume.return_value = _NonRangedVolume({"dir/file1": b"content1"})
+
+    reader = ODPSVolumeReader(odps_entry, "vol_name", "dir")
+    with reader.open_file("file1", offset=2, length=3) as stream:
+        assert stream.read() == b"nte"
+    with reader.open_file("file1", offset=4) as stream:
+        assert stream.read() == b"ent1"
+    buf = bytearray(4)
+    reader.read_file_into("file1", buf, offset=4)
+    assert bytes(buf) == b"ent1"
@@ -12,16 +12,81 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import contextlib
 import inspect
-from typing import Iterator, List, Optional, Union
+import io
+from typing import Any, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlparse
 
 from odps import ODPS
 from odps import __version__ as pyodps_version
+from odps import options as odps_options
+from odps.utils import call_with_retry
 
+from ...config import options
 from ...lib.version import Version
 
 _has_replace_internal_host = Version(pyodps_version) >= Version("0.12.0")
 
+_SKIP_BUFFER_SIZE = 1024**2
+
+
+class VolumeFileStream(io.RawIOBase):
+    """
+    Readable stream of data in a volume file, limited to `length` bytes
+    if specified. Bytes skipped with `skip` are not counted in the limit.
+    """
+
+    def __init__(self, raw: Any, length: Optional[int] = None):
+        super().__init__()
+        self._raw = raw
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def _read_raw_into(self, view: memoryview) -> int:
+        if hasattr(self._raw, "readinto"):
+            return self._raw.readinto(view) or 0
+        data = self._raw.read(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        if self._remaining is not None:
+            view = view[: self._remaining]
+        if not len(view):
+            return 0
+        size = self._read_raw_into(view)
+        if self._remaining is not None:
+            self._remaining -= size
+        return size
+
+    def readinto_exactly(self, buffer) -> None:
+        """Fills the whole buffer, raises IOError if data is not sufficient"""
+        view = memoryview(buffer).cast("B")
+        pos = 0
+        while pos < len(view):
+            size = self.readinto(view[pos:])
+            if not size:
+                raise IOError(
+                    f"Unexpected end of file, {len(view) - pos} bytes missing"
+                )
+            pos += size
+
+    def skip(self, size: int) -> None:
+        """Skip bytes in the underlying file before data within the limit"""
+        skip_buf = bytearray(min(size, _SKIP_BUFFER_SIZE))
+        while size > 0:
+            read_size = self._read_raw_into(
+                memoryview(skip_buf)[: min(size, len(skip_buf))]
+            )
+            if not read_size:
+                break
+            size -= read_size
+
 
 class ODPSVolumeReader:
     def __init__(
@@ -58,6 +123,128 @@ class ODPSVolumeReader:
         ) as reader:
             return reader.read()
 
+    def _open_ranged_reader(
+        self, file_name: str, offset: int, length: Optional[int]
+    ) -> Any:
+        # requests is always installed with pyodps
+        import requests
+
+        sign_url = self._volume.get_sign_url(self._volume_dir + "/" + file_name, "get")
+        if self._replace_internal_host:
+            netloc = urlparse(sign_url).netloc
+            if "-internal." in netloc:
+                sign_url = sign_url.replace(netloc, netloc.replace("-internal.", "."))
+        stop = "" if length is None else str(offset + length - 1)
+
+        # http sessions and network settings of pyodps, like proxies
+        #  and ssl verification, are reused
+        rest = self._odps_entry.rest
+        proxies = dict(getattr(rest, "_proxy", None) or {})
+        settings = rest.session.merge_environment_settings(
+            sign_url, proxies, True, odps_options.verify_ssl, None
+        )
+
+        def get_range():
+            resp = rest.session.get(
+                sign_url,
+                headers={"Range": f"bytes={offset}-{stop}"},
+                timeout=(odps_options.connect_timeout, odps_options.read_timeout),
+                **settings,
+            )
+            try:
+                resp.raise_for_status()
+            except BaseException:
+                resp.close()
+                raise
+            return resp
+
+        return call_with_retry(
+            get_range, exc_type=(requests.ConnectionError, requests.Timeout)
+        )
+
+    @contextlib.contextmanager
+    def open_file(
+        self, file_name: str, offset: int = 0, length: Optional[int] = None
+    ) -> Iterator[VolumeFileStream]:
+        """
+        Open a file in the volume as a stream, reading `length` bytes from
+        `offset` if specified. Data out of the range is not downloaded when
+        the volume supports signed urls.
+        """
+        if (offset or length is not None) and hasattr(self._volume, "get_sign_url"):
+            with contextlib.closing(
+                self._open_ranged_reader(file_name, offset, length)
+            ) as resp:
+                stream = VolumeFileStream(resp.raw, length)
+                if resp.status_code != 206:
+                    # range not accepted by server
+                    stream.skip(offset)
+                yield stream
+            return
+
+        kw = {}
+        if _has_replace_internal_host and self._replace_internal_host:
+            kw = {"replace_internal_host": self._replace_internal_host}
+        with self._volume.open_reader(
+            self._volume_dir + "/" + file_name, **kw
+        ) as reader:
+            stream = VolumeFileStream(reader, length)
+            stream.skip(offset)
+            yield stream
+
+    def read_file_into(self, file_name: str, buffer: Any, offset: int = 0) -> None:
+        """
+        Read data in the file from `offset` into a writable buffer till
+        the buffer is full.
+        """
+        size = memoryview(buffer).nbytes
+        with self.open_file(file_name, offset, size) as stream:
+            stream.readinto_exactly(buffer)
+
+    def read_files_into(
+        self, buffers: Dict[str, Any], concurrency: Optional[int] = None
+    ) -> None:
+        """
+        Download files into writable buffers keyed by file names in parallel.
+        """
+        concurrency = min(
+            concurrency or options.session.fetch_concurrency, len(buffers)
+        )
+        if concurrency <= 1:
+            for file_name, buffer in buffers.items():
+                self.read_file_into(file_name, buffer)
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            concurrency, thread_name_prefix="VolumeRead"
+        ) as pool:
+            futures = [
+                pool.submit(self.read_file_into, file_name, buffer)
+                for file_name, buffer in buffers.items()
+            ]
+            for fut in futures:
+                fut.result()
+
+    def read_files(
+        self,
+        file_names: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> Dict[str, bytes]:
+        """
+        Download files in parallel. All files in the directory are
+        downloaded if `file_names` is not specified.
+        """
+        if file_names is None:
+            file_names = self.list_files()
+        concurrency = min(
+            concurrency or options.session.fetch_concurrency, len(file_names)
+        )
+        if concurrency <= 1:
+            return {name: self.read_file(name) for name in file_names}
+        with concurrent.futures.ThreadPoolExecutor(
+            concurrency, thread_name_prefix="VolumeRead"
+        ) as pool:
+            return dict(zip(file_names, pool.map(self.read_file, file_names)))
+
 
 class ODPSVolumeWriter:
     def __init__(
@@ -0,0 +1,93 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from ..filewriter import write_arrow_tables
+
+
+def _gen_tables(n_tables=5, n_rows=30):
+    for idx in range(n_tables):
+        rs = np.random.RandomState(idx)
+        yield pa.table(
+            {
+                "a": np.arange(idx * n_rows, (idx + 1) * n_rows),
+                "b": rs.rand(n_rows),
+                "c": [f"k{i % 3}" for i in range(n_rows)],
+            }
+        )
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow", "csv"])
+def test_write_arrow_tables(tmp_path, format):
+    expected = pa.concat_tables(list(_gen_tables()))
+    path = str(tmp_path / f"data.{format}")
+    write_arrow_tables(iter(expected.to_batches()), path, format=format)
+
+    if format == "parquet":
+        result = pq.read_table(path)
+    elif format == "arrow":
+        with pa.memory_map(path) as source:
+            result = pa.ipc.open_file(source).read_all()
+    else:
+        result = pa_csv.read_csv(path)
+    pd.testing.assert_frame_equal(result.to_pandas(), expected.to_pandas())
+
+
+def test_write_row_groups(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    write_arrow_tables(_gen_tables(), path, row_group_size=40)
+    meta = pq.ParquetFile(path).metadata
+    assert [meta.row_group(i).num_rows for i in range(meta.num_row_groups)] == [
+        40,
+        40,
+        40,
+        30,
+    ]
+
+    path = str(tmp_path / "data.arrow")
+    write_arrow_tables(_gen_tables(), path, format="arrow", row_group_size=40)
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        sizes = [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)]
+    assert sizes == [40, 40, 40, 30]
+
+
+def test_write_partitioned(tmp_path):
+    expected = pa.concat_tables(list(_gen_tables())).to_pandas()
+    path = str(tmp_path / "data")
+    write_arrow_tables(_gen_tables(), path, partition_cols=["c"])
+
+    assert sorted(os.listdir(path)) == ["c=k0", "c=k1", "c=k2"]
+    result = pq.read_table(path).to_pandas()
+    result["c"] = result["c"].astype(str)
+    result = result.sort_values("a").reset_index(drop=True)
+    pd.testing.assert_frame_equal(result[["a", "b", "c"]], expected)
+
+    with pytest.raises(ValueError):
+        write_arrow_tables(_gen_tables(), path, partition_cols=["d"])
+
+
+def test_write_errors(tmp_path):
+    with pytest.raises(ValueError):
+        write_arrow_tables(_gen_tables(), str(tmp_path / "data.json"), format="json")
+    with pytest.raises(ValueError):
+        write_arrow_tables([], str(tmp_path / "data.parquet"))
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from gzip import GzipFile
+import gzip
 from typing import BinaryIO
 
 try:
@@ -21,11 +21,25 @@ try:
 except ImportError:  # pragma: no cover
     lz4 = None
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
 
-_compressions = {"gzip": lambda f: GzipFile(fileobj=f)}
+
+_compressions = {"gzip": lambda f: gzip.GzipFile(fileobj=f)}
+_bytes_compressors = {"gzip": gzip.compress}
+_bytes_decompressors = {"gzip": gzip.decompress}
 
 if lz4:
     _compressions["lz4"] = lz4.frame.open
+    _bytes_compressors["lz4"] = lz4.frame.compress
+    _bytes_decompressors["lz4"] = lz4.frame.decompress
+
+if zstandard:
+    # compressor objects are not thread-safe, thus created on every call
+    _bytes_compressors["zstd"] = lambda b: zstandard.ZstdCompressor().compress(b)
+    _bytes_decompressors["zstd"] = lambda b: zstandard.ZstdDecompressor().decompress(b)
 
 
 def compress(file: BinaryIO, compress_type: str) -> BinaryIO:
@@ -53,3 +67,51 @@ def compress(file: BinaryIO, compress_type: str) -> BinaryIO:
         )
 
     return compress_(file)
+
+
+def _get_bytes_codec(codecs: dict, compress_type: str):
+    try:
+        return codecs[compress_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown or unavailable compress type: {compress_type}, "
+            f'available include: {", ".join(codecs)}'
+        ) from None
+
+
+def compress_bytes(data: bytes, compress_type: str) -> bytes:
+    """
+    Compress bytes with specified compression type.
+
+    Parameters
+    ----------
+    data: bytes
+        data to compress.
+    compress_type: str
+       compression type, can be gzip, lz4 or zstd.
+
+    Returns
+    -------
+    compressed: bytes
+        compressed data.
+    """
+    return _get_bytes_codec(_bytes_compressors, compress_type)(data)
+
+
+def decompress_bytes(data: bytes, compress_type: str) -> bytes:
+    """
+    Decompress bytes compressed by `compress_bytes`.
+
+    Parameters
+    ----------
+    data: bytes
+        data to decompress.
+    compress_type: str
+       compression type, can be gzip, lz4 or zstd.
+
+    Returns
+    -------
+    decompressed: bytes
+        decompressed data.
+    """
+    return _get_bytes_codec(_bytes_decompressors, compress_type)(data)
@@ -606,6 +606,7 @@ COLLECT_MODEL_RESULT = 100004
 MODEL_DATA_SOURCE = 100005
 
 # fetches
+SUBMITTED_OP_REF = 999997
 FETCH_SHUFFLE = 999998
 FETCH = 999999
 
@@ -64,21 +64,24 @@ class ArrowArraySerializer(Serializer):
 
 
 class ArrowBatchSerializer(Serializer):
+    @staticmethod
+    def _write_batches(obj: PA_RECORD_TYPES, sink) -> None:
+        with pa.RecordBatchStreamWriter(sink, obj.schema) as writer:
+            if isinstance(obj, pa.Table):
+                writer.write_table(obj)
+            else:
+                writer.write_batch(obj)
+
     @buffered
     def serial(self, obj: PA_RECORD_TYPES, context: Dict):
-        sink = pa.BufferOutputStream()
-        writer = pa.RecordBatchStreamWriter(sink, obj.schema)
-        if isinstance(obj, pa.Table):
-            batch_type = "T"
-            writer.write_table(obj)
-        else:
-            batch_type = "B"
-            writer.write_batch(obj)
-        writer.close()
-
-        buf = sink.getvalue()
-        buffers = [buf]
-        return [batch_type], buffers, True
+        batch_type = "T" if isinstance(obj, pa.Table) else "B"
+        # compute size first to write into a preallocated buffer
+        # instead of a growing one
+        mock_sink = pa.MockOutputStream()
+        self._write_batches(obj, mock_sink)
+        buf = pa.allocate_buffer(mock_sink.size())
+        self._write_batches(obj, pa.FixedSizeBufferWriter(buf))
+        return [batch_type], [buf], True
 
     def deserial(self, serialized: List, context: Dict, subs: List):
         reader = pa.RecordBatchStreamReader(pa.BufferReader(subs[0]))
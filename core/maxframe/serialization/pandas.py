@@ -16,6 +16,7 @@ import datetime
 import enum
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 from pandas.api.extensions import ExtensionArray
 from pandas.arrays import IntervalArray
@@ -23,6 +24,11 @@ from pandas.arrays import IntervalArray
 from ..utils import no_default
 from .core import Serializer, buffered
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
 
 class DataFrameSerializer(Serializer):
     @buffered
@@ -149,6 +155,130 @@ class ArraySerializer(Serializer):
             return pd.array(data, dtype)
 
 
+PANDAS_ARROW_SERIALIZER_NAME = "arrow"
+
+_TYPE_CHAR_ARROW_DATAFRAME = "D"
+_TYPE_CHAR_ARROW_SERIES = "S"
+_TYPE_CHAR_ARROW_INDEX = "I"
+_TYPE_CHAR_FALLBACK = "F"
+
+# filled when default pandas serializers are registered
+_arrow_fallback_serializers: Dict[str, Serializer] = dict()
+
+
+def _is_arrow_compatible_dtype(dtype) -> bool:
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _is_arrow_compatible_dtype(dtype.categories.dtype)
+    if isinstance(dtype, (pd.DatetimeTZDtype, pd.StringDtype)):
+        return True
+    # complex and non-string objects cannot be restored from arrow
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufmMO"
+
+
+def _is_arrow_compatible_values(values) -> bool:
+    if not _is_arrow_compatible_dtype(values.dtype):
+        return False
+    if values.dtype != np.dtype("O"):
+        return True
+    # object arrays are accepted only if they hold strings, with None
+    # as missing values which arrow restores into
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred not in ("string", "empty"):
+        return False
+    values = np.asarray(values)
+    return all(v is None for v in values[pd.isna(values)])
+
+
+def _arrow_to_pandas_values(column: "pa.ChunkedArray", dtype) -> pd.Series:
+    series = column.to_pandas(split_blocks=True)
+    if series.dtype != dtype:
+        series = series.astype(dtype)
+    return series
+
+
+class ArrowPandasSerializer(Serializer):
+    """
+    Serializer encoding columns of pandas objects as a single arrow IPC
+    buffer, whose columns are converted into pandas without copying when
+    possible. Objects with dtypes arrow cannot restore exactly are serialized
+    with default pandas serializers.
+
+    The serializer is used when `PANDAS_ARROW_SERIALIZER_NAME` is specified
+    as the serializer in the context, i.e.,
+    `serialize(obj, {"serializer": PANDAS_ARROW_SERIALIZER_NAME})`.
+    """
+
+    def _serial_fallback(self, type_char: str, obj: Any, context: Dict):
+        serializer = _arrow_fallback_serializers[type_char]
+        # skip deduplication which is already done in `serial`
+        header, subs, final = type(serializer).serial.__wrapped__(
+            serializer, obj, context
+        )
+        return [_TYPE_CHAR_FALLBACK, type_char] + header, subs, final
+
+    @buffered
+    def serial(self, obj: Any, context: Dict):
+        if isinstance(obj, pd.DataFrame):
+            if obj.shape[1] == 0 or not all(
+                _is_arrow_compatible_values(col.values) for _, col in obj.items()
+            ):
+                return self._serial_fallback(_TYPE_CHAR_ARROW_DATAFRAME, obj, context)
+            table = pa.Table.from_arrays(
+                [pa.array(col, from_pandas=True) for _, col in obj.items()],
+                names=[str(idx) for idx in range(obj.shape[1])],
+            )
+            header = [_TYPE_CHAR_ARROW_DATAFRAME]
+            subs = [obj.dtypes, obj.columns, obj.index, table]
+        elif isinstance(obj, pd.Series):
+            if not _is_arrow_compatible_values(obj.values):
+                return self._serial_fallback(_TYPE_CHAR_ARROW_SERIES, obj, context)
+            table = pa.Table.from_arrays([pa.array(obj, from_pandas=True)], names=["0"])
+            header = [_TYPE_CHAR_ARROW_SERIES]
+            subs = [obj.dtype, obj.name, obj.index, table]
+        else:
+            if isinstance(
+                obj, (pd.MultiIndex, pd.RangeIndex, pd.CategoricalIndex)
+            ) or not _is_arrow_compatible_values(obj.values):
+                return self._serial_fallback(_TYPE_CHAR_ARROW_INDEX, obj, context)
+            table = pa.Table.from_arrays([pa.array(obj, from_pandas=True)], names=["0"])
+            header = [_TYPE_CHAR_ARROW_INDEX]
+            subs = [obj.dtype, obj.name, table]
+        return header, subs, False
+
+    def deserial(self, serialized: List, context: Dict, subs: List[Any]):
+        if serialized[0] == _TYPE_CHAR_FALLBACK:
+            serializer = _arrow_fallback_serializers[serialized[1]]
+            return serializer.deserial(serialized[2:], context, subs)
+        elif serialized[0] == _TYPE_CHAR_ARROW_DATAFRAME:
+            dtypes, columns, index, table = subs
+            df = table.to_pandas(split_blocks=True)
+            df.columns = columns
+            df.index = index
+            mismatched = {
+                col: dtype
+                for col, dtype, df_dtype in zip(columns, dtypes, df.dtypes)
+                if dtype != df_dtype
+            }
+            if mismatched and not columns.has_duplicates:
+                df = df.astype(mismatched)
+            elif mismatched:
+                df = df.astype(dtypes)
+            return df
+        elif serialized[0] == _TYPE_CHAR_ARROW_SERIES:
+            dtype, name, index, table = subs
+            series = _arrow_to_pandas_values(table.column(0), dtype)
+            series.index = index
+            series.name = name
+            return series
+        else:
+            dtype, name, table = subs
+            return pd.Index(
+                _arrow_to_pandas_values(table.column(0), dtype).array,
+                dtype=dtype,
+                name=name,
+            )
+
+
 class PdTimestampSerializer(Serializer):
     def serial(self, obj: pd.Timestamp, context: Dict):
         if obj.tz:
@@ -235,3 +365,15 @@ ArraySerializer.register(ExtensionArray)
 PdTimestampSerializer.register(pd.Timestamp)
 PdTimedeltaSerializer.register(pd.Timedelta)
 NoDefaultSerializer.register(type(no_default))
+
+if pa is not None:  # pragma: no branch
+    _arrow_fallback_serializers.update(
+        {
+            _TYPE_CHAR_ARROW_DATAFRAME: DataFrameSerializer(),
+            _TYPE_CHAR_ARROW_SERIES: SeriesSerializer(),
+            _TYPE_CHAR_ARROW_INDEX: IndexSerializer(),
+        }
+    )
+    ArrowPandasSerializer.register(pd.DataFrame, name=PANDAS_ARROW_SERIALIZER_NAME)
+    ArrowPandasSerializer.register(pd.Series, name=PANDAS_ARROW_SERIALIZER_NAME)
+    ArrowPandasSerializer.register(pd.Index, name=PANDAS_ARROW_SERIALIZER_NAME)
@@ -52,6 +52,7 @@ from .. import (
     serialize_with_spawn,
 )
 from ..core import DtypeSerializer, ListSerializer, Placeholder
+from ..pandas import PANDAS_ARROW_SERIALIZER_NAME
 
 cupy = lazy_import("cupy")
 cudf = lazy_import("cudf")
@@ -246,6 +247,54 @@ def test_arrow():
         np.testing.assert_equal(val, deserialized)
 
 
+@pytest.mark.skipif(pa is None, reason="need pyarrow to run the cases")
+@switch_unpickle
+def test_pandas_arrow_serializer():
+    context = {"serializer": PANDAS_ARROW_SERIALIZER_NAME}
+    val = pd.DataFrame(
+        {
+            "float_col": np.random.rand(1000),
+            "str_col": np.random.choice(list("abcd"), size=(1000,)),
+            "none_str_col": np.random.choice(["a", "b", None], size=(1000,)),
+            "int_col": np.random.randint(0, 100, size=(1000,)),
+            "str_array_col": pd.array(np.random.choice(list("abcd"), size=(1000,))),
+            "cat_col": pd.Categorical(np.random.choice(list("abcd"), size=(1000,))),
+            "dt_col": pd.date_range("2020-01-01", periods=1000, tz="UTC"),
+        },
+        index=pd.Index([f"i{idx}" for idx in range(1000)], name="idx"),
+    )
+    header, buffers = serialize(val, context)
+    # columns are encoded into a single arrow buffer
+    assert len(buffers) < len(serialize(val)[1])
+    pd.testing.assert_frame_equal(val, deserialize(header, buffers))
+
+    val.columns = [0, 1, 2, 3, 0, ("a", "b"), 6]
+    pd.testing.assert_frame_equal(val, deserialize(*serialize(val, context)))
+
+    val = pd.Series(np.random.choice(list("abcd"), size=(1000,)), name="nm")
+    pd.testing.assert_series_equal(val, deserialize(*serialize(val, context)))
+
+    val = pd.Index(np.random.rand(1000), name=("a", 1))
+    pd.testing.assert_index_equal(val, deserialize(*serialize(val, context)))
+
+    # dtypes arrow cannot restore exactly are serialized by default serializers
+    for val in [
+        pd.DataFrame({"a": [1, "x", None], "b": [1 + 2j, 3, 4]}),
+        pd.DataFrame(index=[1, 2]),
+        pd.Series(["a", np.nan]),
+        pd.Series(pd.array([1, None], dtype="Int64")),
+        pd.RangeIndex(10, name="r"),
+        pd.MultiIndex.from_arrays([(1, 5, 4), list("BAD")], names=["C1", "C2"]),
+    ]:
+        deserialized = deserialize(*serialize(val, context))
+        if isinstance(val, pd.DataFrame):
+            pd.testing.assert_frame_equal(val, deserialized)
+        elif isinstance(val, pd.Series):
+            pd.testing.assert_series_equal(val, deserialized)
+        else:
+            pd.testing.assert_index_equal(val, deserialized)
+
+
 @pytest.mark.parametrize(
     "np_val",
     [np.random.rand(100, 100), np.random.rand(100, 100).T],
@@ -14,22 +14,37 @@
 
 import asyncio
 import concurrent.futures
+import contextlib
 import logging
 import random
 import string
 import threading
+import time
 import warnings
 from abc import ABC, ABCMeta, abstractmethod
 from concurrent.futures import Future as SyncFuture
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, Coroutine, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import urlparse
 from weakref import ref
 
 from odps import ODPS
 
 from maxframe.core import TileableType
+from maxframe.core.entity.executable import flush_decref
 from maxframe.lib.aio import Isolation, get_isolation, new_isolation, stop_isolation
 from maxframe.typing_ import ClientType
 from maxframe.utils import classproperty, implements, relay_future
@@ -38,6 +53,9 @@ from .config import options
 
 logger = logging.getLogger(__name__)
 
+# seconds to wait for pending decref requests when destroying sessions
+_DECREF_FLUSH_TIMEOUT = 5
+
 
 @dataclass
 class Progress:
@@ -48,6 +66,50 @@ class Progress:
 class Profiling:
     result: dict = None
 
+    def add_stage(
+        self, name: str, start_time: float, duration: float, **attrs
+    ) -> Dict[str, Any]:
+        """
+        Add a record of an execution stage into profiling result.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        start_time : float
+            Timestamp when the stage starts.
+        duration : float
+            Seconds spent in the stage.
+        attrs
+            Other attributes of the stage, for instance, sizes in bytes.
+
+        Returns
+        -------
+        record : dict
+            Record of the stage.
+        """
+        record = {"name": name, "start_time": start_time, "duration": duration}
+        record.update(attrs)
+        if self.result is None:
+            self.result = {"stages": []}
+        self.result["stages"].append(record)
+        return record
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **attrs):
+        """
+        Record time spent in the block as an execution stage. Attributes
+        can be added into the yielded dict inside the block.
+        """
+        attrs = dict(attrs)
+        start_time = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            duration = time.perf_counter() - start_counter
+            self.add_stage(name, start_time, duration, **attrs)
+
 
 class ExecutionInfo:
     def __init__(
@@ -132,6 +194,36 @@ maxframe.new_session()
 """
 
 
+def _split_fetched(data: Any, batch_size: Optional[int]) -> Iterator[Any]:
+    """Split fetched data into batches with `batch_size` rows"""
+    if not batch_size or not hasattr(data, "iloc") or len(data) <= batch_size:
+        yield data
+        return
+    for start in range(0, len(data), batch_size):
+        yield data.iloc[start : start + batch_size]
+
+
+def _write_fetched_to_file(
+    data: Any,
+    path: str,
+    format: str = "parquet",
+    partition_cols: Optional[List[str]] = None,
+    row_group_size: Optional[int] = None,
+    index: bool = True,
+) -> None:
+    """Write fetched pandas data into a local file"""
+    from .io.filewriter import write_arrow_tables
+    from .io.odpsio import pandas_to_export_table
+
+    write_arrow_tables(
+        [pandas_to_export_table(data, index=index)],
+        path,
+        format=format,
+        partition_cols=partition_cols,
+        row_group_size=row_group_size,
+    )
+
+
 class AbstractSession(ABC):
     name = None
     _default = None
@@ -208,7 +300,8 @@ class AbstractAsyncSession(AbstractSession, metaclass=ABCMeta):
         """
         Destroy a session.
         """
-        self.reset_default()
+        if AbstractSession._default is self:
+            self.reset_default()
         self._closed = True
 
     @abstractmethod
@@ -238,6 +331,111 @@ class AbstractAsyncSession(AbstractSession, metaclass=ABCMeta):
         data
         """
 
+    async def can_fetch_corner(self, tileable: TileableType) -> bool:
+        """
+        Check if first and last rows of a tileable can be fetched with
+        `fetch_corner`.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+
+        Returns
+        -------
+        supported : bool
+        """
+        return False
+
+    async def fetch_corner(
+        self, tileable: TileableType, head_rows: int, tail_rows: int, **kwargs
+    ) -> Any:
+        """
+        Fetch first and last rows of a tileable as a single object.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        head_rows : int
+            Number of first rows to fetch.
+        tail_rows : int
+            Number of last rows to fetch.
+
+        Returns
+        -------
+        data
+        """
+        raise NotImplementedError
+
+    async def fetch_to_file(
+        self,
+        tileable: TileableType,
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        Fetch data of a tileable into a local file without keeping all
+        data in memory.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        path : str
+            Path of the file, or path of the directory when `partition_cols`
+            is specified.
+        format : str
+            Format of the file, can be 'parquet', 'arrow' or 'csv'.
+        partition_cols : list of str, optional
+            Columns to partition data with in hive style.
+        row_group_size : int, optional
+            Number of rows in every parquet row group or arrow record batch.
+        index : bool
+            Whether to write index as columns.
+        """
+        data = (await self.fetch(tileable, **kwargs))[0]
+        _write_fetched_to_file(
+            data,
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+        )
+
+    async def iter_fetch(
+        self,
+        tileable: TileableType,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Fetch data of a tileable as batches.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        batch_size : int, optional
+            Number of rows in every batch.
+        batch_bytes : int, optional
+            Approximate size of every batch in bytes when `batch_size`
+            is not specified.
+
+        Returns
+        -------
+        batches
+        """
+        data = (await self.fetch(tileable, **kwargs))[0]
+        for batch in _split_fetched(data, batch_size):
+            yield batch
+
     @abstractmethod
     async def decref(self, *tileables_keys):
         """
@@ -457,6 +655,110 @@ class AbstractSyncSession(AbstractSession, metaclass=ABCMeta):
         fetched_data : list
         """
 
+    def can_fetch_corner(self, tileable: TileableType) -> bool:
+        """
+        Check if first and last rows of a tileable can be fetched with
+        `fetch_corner`.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+
+        Returns
+        -------
+        supported : bool
+        """
+        return False
+
+    def fetch_corner(
+        self, tileable: TileableType, head_rows: int, tail_rows: int, **kwargs
+    ) -> Any:
+        """
+        Fetch first and last rows of a tileable as a single object.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        head_rows : int
+            Number of first rows to fetch.
+        tail_rows : int
+            Number of last rows to fetch.
+
+        Returns
+        -------
+        data
+        """
+        raise NotImplementedError
+
+    def fetch_to_file(
+        self,
+        tileable: TileableType,
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        Fetch data of a tileable into a local file without keeping all
+        data in memory.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        path : str
+            Path of the file, or path of the directory when `partition_cols`
+            is specified.
+        format : str
+            Format of the file, can be 'parquet', 'arrow' or 'csv'.
+        partition_cols : list of str, optional
+            Columns to partition data with in hive style.
+        row_group_size : int, optional
+            Number of rows in every parquet row group or arrow record batch.
+        index : bool
+            Whether to write index as columns.
+        """
+        data = self.fetch(tileable, **kwargs)[0]
+        _write_fetched_to_file(
+            data,
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+        )
+
+    def iter_fetch(
+        self,
+        tileable: TileableType,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Fetch data of a tileable as batches.
+
+        Parameters
+        ----------
+        tileable
+            Tileable.
+        batch_size : int, optional
+            Number of rows in every batch.
+        batch_bytes : int, optional
+            Approximate size of every batch in bytes when `batch_size`
+            is not specified.
+
+        Returns
+        -------
+        batches
+        """
+        data = self.fetch(tileable, **kwargs)[0]
+        yield from _split_fetched(data, batch_size)
+
     @abstractmethod
     def fetch_infos(self, *tileables, fields, **kwargs) -> list:
         """
@@ -681,9 +983,14 @@ class AsyncSession(AbstractAsyncSession):
 
     @implements(AbstractAsyncSession.destroy)
     async def destroy(self):
+        # send decref requests pending in batches before destroying
+        await asyncio.wait(
+            [asyncio.wrap_future(flush_decref())], timeout=_DECREF_FLUSH_TIMEOUT
+        )
         coro = self._isolated_session.destroy()
         await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
-        self.reset_default()
+        if AbstractSession._default is self._isolated_session:
+            self.reset_default()
 
     @implements(AbstractAsyncSession.execute)
     @_delegate_to_isolated_session
@@ -697,6 +1004,70 @@ class AsyncSession(AbstractAsyncSession):
             asyncio.run_coroutine_threadsafe(coro, self._loop)
         )
 
+    @implements(AbstractAsyncSession.can_fetch_corner)
+    async def can_fetch_corner(self, tileable: TileableType) -> bool:
+        coro = self._isolated_session.can_fetch_corner(tileable)
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        )
+
+    @implements(AbstractAsyncSession.fetch_corner)
+    async def fetch_corner(
+        self, tileable: TileableType, head_rows: int, tail_rows: int, **kwargs
+    ) -> Any:
+        coro = self._isolated_session.fetch_corner(
+            tileable, head_rows, tail_rows, **kwargs
+        )
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        )
+
+    @implements(AbstractAsyncSession.fetch_to_file)
+    async def fetch_to_file(
+        self,
+        tileable: TileableType,
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+        **kwargs,
+    ) -> None:
+        coro = self._isolated_session.fetch_to_file(
+            tileable,
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+            **kwargs,
+        )
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    @implements(AbstractAsyncSession.iter_fetch)
+    async def iter_fetch(
+        self,
+        tileable: TileableType,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        batch_iter = self._isolated_session.iter_fetch(
+            tileable, batch_size, batch_bytes, **kwargs
+        )
+        try:
+            while True:
+                fut = asyncio.run_coroutine_threadsafe(
+                    _next_batch(batch_iter), self._loop
+                )
+                has_batch, batch = await asyncio.wrap_future(fut)
+                if not has_batch:
+                    break
+                yield batch
+        finally:
+            fut = asyncio.run_coroutine_threadsafe(batch_iter.aclose(), self._loop)
+            await asyncio.wrap_future(fut)
+
     @implements(AbstractAsyncSession._get_ref_counts)
     @_delegate_to_isolated_session
     async def _get_ref_counts(self) -> Dict[str, int]:
@@ -934,6 +1305,65 @@ class SyncSession(AbstractSyncSession):
         coro = _fetch(*tileables, session=self._isolated_session, **kwargs)
         return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
+    @implements(AbstractSyncSession.can_fetch_corner)
+    def can_fetch_corner(self, tileable: TileableType) -> bool:
+        coro = self._isolated_session.can_fetch_corner(tileable)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @implements(AbstractSyncSession.fetch_corner)
+    def fetch_corner(
+        self, tileable: TileableType, head_rows: int, tail_rows: int, **kwargs
+    ) -> Any:
+        coro = self._isolated_session.fetch_corner(
+            tileable, head_rows, tail_rows, **kwargs
+        )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @implements(AbstractSyncSession.fetch_to_file)
+    def fetch_to_file(
+        self,
+        tileable: TileableType,
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+        **kwargs,
+    ) -> None:
+        coro = self._isolated_session.fetch_to_file(
+            tileable,
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+            **kwargs,
+        )
+        asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @implements(AbstractSyncSession.iter_fetch)
+    def iter_fetch(
+        self,
+        tileable: TileableType,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        batch_iter = self._isolated_session.iter_fetch(
+            tileable, batch_size, batch_bytes, **kwargs
+        )
+        try:
+            while True:
+                fut = asyncio.run_coroutine_threadsafe(
+                    _next_batch(batch_iter), self._loop
+                )
+                has_batch, batch = fut.result()
+                if not has_batch:
+                    break
+                yield batch
+        finally:
+            asyncio.run_coroutine_threadsafe(batch_iter.aclose(), self._loop).result()
+
     @implements(AbstractSyncSession.fetch_infos)
     def fetch_infos(self, *tileables, fields, **kwargs) -> list:
         coro = _fetch_infos(
@@ -982,9 +1412,15 @@ class SyncSession(AbstractSyncSession):
         pass  # pragma: no cover
 
     def destroy(self):
+        # send decref requests pending in batches before destroying
+        try:
+            flush_decref().result(_DECREF_FLUSH_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            pass
         coro = self._isolated_session.destroy()
         asyncio.run_coroutine_threadsafe(coro, self._loop).result()
-        self.reset_default()
+        if AbstractSession._default is self._isolated_session:
+            self.reset_default()
 
     def stop_server(self, isolation=True):
         try:
@@ -1107,6 +1543,13 @@ async def _fetch(
     return data[0] if len(tileables) == 0 else data
 
 
+async def _next_batch(batch_iter: AsyncIterator[Any]) -> Tuple[bool, Any]:
+    try:
+        return True, await batch_iter.__anext__()
+    except StopAsyncIteration:
+        return False, None
+
+
 async def _fetch_infos(
     tileable: TileableType,
     *tileables: Tuple[TileableType, ...],
@@ -1149,6 +1592,61 @@ def fetch(
     return session.fetch(tileable, *tileables, **kwargs)
 
 
+def can_fetch_corner(tileable: TileableType, session: SyncSession = None) -> bool:
+    if session is None:
+        session = get_default_session()
+        if session is None:  # pragma: no cover
+            raise ValueError("No session found")
+    session = _ensure_sync(session)
+    return session.can_fetch_corner(tileable)
+
+
+def fetch_corner(
+    tileable: TileableType,
+    head_rows: int,
+    tail_rows: int,
+    session: SyncSession = None,
+    **kwargs,
+):
+    if session is None:
+        session = get_default_session()
+        if session is None:  # pragma: no cover
+            raise ValueError("No session found")
+    session = _ensure_sync(session)
+    return session.fetch_corner(tileable, head_rows, tail_rows, **kwargs)
+
+
+def fetch_to_file(
+    tileable: TileableType,
+    path: str,
+    session: SyncSession = None,
+    **kwargs,
+) -> None:
+    if session is None:
+        session = get_default_session()
+        if session is None:  # pragma: no cover
+            raise ValueError("No session found")
+    session = _ensure_sync(session)
+    session.fetch_to_file(tileable, path, **kwargs)
+
+
+def iter_fetch(
+    tileable: TileableType,
+    session: SyncSession = None,
+    batch_size: Optional[int] = None,
+    batch_bytes: Optional[int] = None,
+    **kwargs,
+) -> Iterator[Any]:
+    if session is None:
+        session = get_default_session()
+        if session is None:  # pragma: no cover
+            raise ValueError("No session found")
+    session = _ensure_sync(session)
+    return session.iter_fetch(
+        tileable, batch_size=batch_size, batch_bytes=batch_bytes, **kwargs
+    )
+
+
 def fetch_infos(
     tileable: TileableType,
     *tileables: Tuple[TileableType],
@@ -1237,6 +1735,11 @@ def new_session(
 
     register_session_schemes()
 
+    pool = kwargs.pop("pool", None)
+    if pool is not None:
+        # use sessions created in advance by maxframe_client.session.SessionPool
+        return pool.acquire(default=default)
+
     if isinstance(address, ODPS):
         address, odps_entry = None, address
 
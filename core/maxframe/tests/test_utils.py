@@ -23,6 +23,7 @@ import time
 from enum import Enum
 from functools import partial
 
+import mock
 import numpy as np
 import pandas as pd
 import pyarrow as pa
@@ -362,3 +363,53 @@ def test_arrow_type_from_string():
     _assert_arrow_type_convert(
         pa.struct([("key", pa.string()), ("value", pa.list_(pa.int64()))])
     )
+
+
+def test_serialize_serializable_frames():
+    arr = np.random.rand(1000, 10)
+    obj = {"arr": arr, "name": "test"}
+
+    frames = utils.serialize_serializable_frames(obj)
+    assert all(isinstance(frame, memoryview) for frame in frames)
+    assert b"".join(frames) == utils.serialize_serializable(obj)
+    # buffers are not copied
+    assert any(
+        np.shares_memory(np.frombuffer(frame, dtype=np.uint8), arr)
+        for frame in frames[1:]
+    )
+
+
+def test_deserialize_serializable_zero_copy():
+    arr = np.random.rand(1000, 10)
+    data = bytearray(utils.serialize_serializable({"arr": arr}))
+
+    result = utils.deserialize_serializable(memoryview(data))
+    np.testing.assert_array_equal(result["arr"], arr)
+    assert np.shares_memory(result["arr"], np.frombuffer(data, dtype=np.uint8))
+
+
+async def test_wait_http_response():
+    from tornado import httpclient
+    from tornado.simple_httpclient import HTTPTimeoutError
+
+    timeouts = []
+
+    async def fetch(self, url, request_timeout=None, **kwargs):
+        timeouts.append(request_timeout)
+        if len(timeouts) < 3:
+            raise HTTPTimeoutError("Timeout")
+        return "response"
+
+    with mock.patch.object(httpclient.AsyncHTTPClient, "fetch", new=fetch):
+        resp = await utils.wait_http_response("http://localhost", request_timeout=25)
+        assert resp == "response"
+        # every attempt is capped
+        assert all(0 < t <= 10 for t in timeouts)
+
+        timeouts.clear()
+        await utils.wait_http_response("http://localhost", request_timeout=5)
+        assert all(0 < t <= 5 for t in timeouts)
+
+        timeouts.clear()
+        await utils.wait_http_response("http://localhost")
+        assert timeouts == [None] * 3
@@ -262,32 +262,52 @@ def get_dtype(dtype: Union[np.dtype, pd.api.extensions.ExtensionDtype]):
         return np.dtype(dtype)
 
 
-def serialize_serializable(serializable, compress: bool = False):
+def _as_byte_view(buf: Any) -> memoryview:
+    view = memoryview(buf)
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    return view
+
+
+def serialize_serializable_frames(serializable) -> List[memoryview]:
+    """
+    Serialize an object into a list of frames without copying its buffers.
+    The first frame holds the length and content of the header, and the
+    following frames are buffers of the object. Frames can be written
+    one by one into HTTP bodies or volume files, and joining them gives
+    the result of `serialize_serializable`.
+    """
     from .serialization import serialize
 
-    bio = io.BytesIO()
     header, buffers = serialize(serializable)
-    buf_sizes = [getattr(buf, "nbytes", len(buf)) for buf in buffers]
-    header[0]["buf_sizes"] = buf_sizes
+    frames = [_as_byte_view(buf) for buf in buffers]
+    header[0]["buf_sizes"] = [frame.nbytes for frame in frames]
     s_header = msgpack.dumps(header)
-    bio.write(struct.pack("<Q", len(s_header)))
-    bio.write(s_header)
-    for buf in buffers:
-        bio.write(buf)
-    ser_graph = bio.getvalue()
+    return [memoryview(struct.pack("<Q", len(s_header)) + s_header)] + frames
+
 
+def serialize_serializable(serializable, compress: bool = False):
+    ser_graph = b"".join(serialize_serializable_frames(serializable))
     if compress:
         ser_graph = zlib.compress(ser_graph)
     return ser_graph
 
 
-def deserialize_serializable(ser_serializable: bytes):
+def deserialize_serializable(ser_serializable: Union[bytes, memoryview]):
+    """
+    Deserialize an object from data generated by `serialize_serializable`.
+    Buffers of the object are slices of the data without copying.
+    """
     from .serialization import deserialize
 
-    bio = io.BytesIO(ser_serializable)
-    s_header_length = struct.unpack("Q", bio.read(8))[0]
-    header2 = msgpack.loads(bio.read(s_header_length))
-    buffers2 = [bio.read(s) for s in header2[0]["buf_sizes"]]
+    view = _as_byte_view(ser_serializable)
+    s_header_length = struct.unpack("<Q", view[:8])[0]
+    pos = 8 + s_header_length
+    header2 = msgpack.loads(view[8:pos])
+    buffers2 = []
+    for size in header2[0]["buf_sizes"]:
+        buffers2.append(view[pos : pos + size])
+        pos += size
     return deserialize(header2, buffers2)
 
 
@@ -343,12 +363,20 @@ def build_session_volume_name(session_id: str) -> str:
     return f"mf_vol_{session_id.replace('-', '_')}"
 
 
+_HTTP_ATTEMPT_TIMEOUT = 10.0
+
+
 async def wait_http_response(
     url: str, *, request_timeout: TimeoutType = None, **kwargs
 ) -> httpclient.HTTPResponse:
     start_time = time.time()
     while request_timeout is None or time.time() - start_time < request_timeout:
-        timeout_left = min(10.0, time.time() - start_time) if request_timeout else None
+        # every attempt is limited by the time left of the whole request
+        timeout_left = (
+            min(_HTTP_ATTEMPT_TIMEOUT, request_timeout - (time.time() - start_time))
+            if request_timeout
+            else None
+        )
         try:
             return await httpclient.AsyncHTTPClient().fetch(
                 url, request_timeout=timeout_left, **kwargs
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import msgpack
 from tornado import httpclient
@@ -27,10 +27,12 @@ from maxframe.protocol import (
     ResultInfo,
     SessionInfo,
 )
+from maxframe.session import Profiling
 from maxframe.typing_ import TimeoutType
 from maxframe.utils import (
     format_timeout_params,
     serialize_serializable,
+    serialize_serializable_frames,
     wait_http_response,
 )
 
@@ -64,15 +66,28 @@ class FrameDriverClient:
         dag: TileableGraph,
         managed_input_infos: Dict[str, ResultInfo] = None,
         new_settings: Dict[str, Any] = None,
+        profiling: Optional[Profiling] = None,
     ) -> DagInfo:
+        profiling = profiling if profiling is not None else Profiling()
         req_url = f"{self._endpoint}/api/sessions/{session_id}/dags"
         req_body = ExecuteDagRequest(
             session_id, dag, managed_input_infos, new_settings=new_settings
         )
+        with profiling.stage("serialize") as stage_attrs:
+            frames = serialize_serializable_frames(ProtocolBody(body=req_body))
+            body_size = sum(frame.nbytes for frame in frames)
+            stage_attrs["bytes"] = body_size
+
+        async def body_producer(write):
+            # frames are sent one by one to avoid joining large buffers
+            for frame in frames:
+                await write(frame)
+
         resp = await httpclient.AsyncHTTPClient().fetch(
             req_url,
             method="POST",
-            body=serialize_serializable(ProtocolBody(body=req_body)),
+            headers={"Content-Length": str(body_size)},
+            body_producer=body_producer,
         )
         return DagInfo.from_json(msgpack.loads(resp.body))
 
@@ -0,0 +1,197 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+
+from maxframe.config import options
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR_NAME = "maxframe_fetch_cache"
+
+
+@dataclass
+class _CacheEntry:
+    path: str
+    size: int
+    tileable_key: str
+
+
+class FetchResultCache:
+    """
+    Local cache of fetched result tables. Tables are stored as Arrow IPC
+    files under `cache_dir` and read with memory mapping. Least recently
+    used entries are evicted when total size exceeds `max_size`.
+
+    Every cache instance owns a separate sub-directory which is removed
+    when the instance is garbage collected or the process exits.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int):
+        os.makedirs(cache_dir, exist_ok=True)
+        self._cache_dir = tempfile.mkdtemp(prefix="mf_fetch_", dir=cache_dir)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._total_size = 0
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self._cache_dir, ignore_errors=True
+        )
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def total_size(self) -> int:
+        return self._total_size
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def build_key(
+        table_name: str, partition_specs: Optional[List[str]], read_kw: dict
+    ) -> str:
+        key_items = (
+            table_name,
+            tuple(partition_specs or ()),
+            tuple(sorted((k, repr(v)) for k, v in read_kw.items())),
+        )
+        return hashlib.sha1(repr(key_items).encode()).hexdigest()
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:  # pragma: no cover
+            logger.debug("Failed to remove cache file %s", path)
+
+    def _pop_entry(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry.size
+        return entry
+
+    def get(self, key: str) -> Optional[pa.Table]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            with pa.memory_map(entry.path, "r") as source:
+                return pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowInvalid):
+            logger.warning("Failed to read fetch cache file %s", entry.path)
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._pop_entry(key)
+            return None
+
+    def put(self, key: str, tileable_key: str, table: pa.Table) -> None:
+        if table.nbytes > self._max_size:
+            return
+        path = os.path.join(self._cache_dir, key + ".arrow")
+        tmp_path = os.path.join(self._cache_dir, f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to write fetch cache file %s", path)
+            self._remove_file(tmp_path)
+            return
+
+        evicted = []
+        with self._lock:
+            # replaced file is already removed
+            self._pop_entry(key)
+            entry = _CacheEntry(path, os.path.getsize(path), tileable_key)
+            self._entries[key] = entry
+            self._total_size += entry.size
+            while self._total_size > self._max_size and len(self._entries) > 1:
+                _, evicted_entry = self._entries.popitem(last=False)
+                self._total_size -= evicted_entry.size
+                evicted.append(evicted_entry)
+        for evicted_entry in evicted:
+            self._remove_file(evicted_entry.path)
+
+    def invalidate(self, tileable_keys: Optional[List[str]] = None) -> None:
+        """Removes cached results of specified tileables or all results"""
+        key_set = set(tileable_keys) if tileable_keys is not None else None
+        with self._lock:
+            to_remove = [
+                key
+                for key, entry in self._entries.items()
+                if key_set is None or entry.tileable_key in key_set
+            ]
+            removed = [self._pop_entry(key) for key in to_remove]
+        for entry in removed:
+            self._remove_file(entry.path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+        self._finalizer()
+
+
+_cache_lock = threading.Lock()
+# caches are shared by sessions with the same cache settings
+_fetch_caches: Dict[Tuple[str, int], FetchResultCache] = dict()
+
+
+def get_fetch_cache() -> Optional[FetchResultCache]:
+    """
+    Get fetch cache configured by current options, None if the cache
+    is not enabled.
+    """
+    if not options.session.enable_fetch_cache:
+        return None
+    cache_dir = options.session.fetch_cache_dir or os.path.join(
+        tempfile.gettempdir(), _DEFAULT_CACHE_DIR_NAME
+    )
+    cache_args = (cache_dir, options.session.fetch_cache_size)
+    with _cache_lock:
+        try:
+            return _fetch_caches[cache_args]
+        except KeyError:
+            cache = _fetch_caches[cache_args] = FetchResultCache(*cache_args)
+            return cache
+
+
+def invalidate_fetch_cache(tileable_keys: Optional[List[str]] = None) -> None:
+    """Removes cached results of specified tileables in all caches"""
+    with _cache_lock:
+        caches = list(_fetch_caches.values())
+    for cache in caches:
+        cache.invalidate(tileable_keys)
@@ -12,26 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextlib
+import operator
 from abc import ABC, abstractmethod
-from numbers import Integral
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from numbers import Integral, Real
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 from odps import ODPS
 from odps.models import ExternalVolume
 
-from maxframe.core import OBJECT_TYPE
+from maxframe.config import options
+from maxframe.core import OBJECT_TYPE, enter_mode
 from maxframe.dataframe.core import DATAFRAME_TYPE
+from maxframe.io.filewriter import write_arrow_tables
 from maxframe.io.objects import get_object_io_handler
 from maxframe.io.odpsio import (
     ODPSTableIO,
     ODPSVolumeReader,
     TunnelTableIO,
+    arrow_to_export_table,
     arrow_to_pandas,
     build_dataframe_table_meta,
     odps_schema_to_pandas_dtypes,
+    pandas_to_export_table,
 )
+from maxframe.io.odpsio.metacache import get_meta_cache
 from maxframe.protocol import (
     DataFrameTableMeta,
     ODPSTableResultInfo,
@@ -43,6 +63,10 @@ from maxframe.tensor.core import TENSOR_TYPE
 from maxframe.typing_ import PandasObjectTypes, TileableType
 from maxframe.utils import ToThreadMixin, sync_pyodps_options
 
+from .fetch_cache import get_fetch_cache
+
+_DEFAULT_BATCH_BYTES = 50 * 1024**2
+
 _result_fetchers: Dict[ResultType, Type["ResultFetcher"]] = dict()
 
 
@@ -55,6 +79,152 @@ def get_fetcher_cls(result_type: ResultType) -> Type["ResultFetcher"]:
     return _result_fetchers[result_type]
 
 
+class RowFilter:
+    """
+    Filter on rows of result tables. Leaf filters compare a column with a
+    scalar, and filters can be combined with `&` and `|`. Columns are
+    referred by positions until remapped into table column names.
+    Comparisons are computed with arrow only when the arrow type of the
+    column matches the scalar, otherwise values are compared as pandas
+    objects.
+    """
+
+    __slots__ = "op", "args"
+
+    _compare_funcs = {
+        "eq": pc.equal,
+        "ne": pc.not_equal,
+        "gt": pc.greater,
+        "ge": pc.greater_equal,
+        "lt": pc.less,
+        "le": pc.less_equal,
+    }
+    _pandas_compare_funcs = {
+        "eq": operator.eq,
+        "ne": operator.ne,
+        "gt": operator.gt,
+        "ge": operator.ge,
+        "lt": operator.lt,
+        "le": operator.le,
+    }
+
+    def __init__(self, op: str, *args):
+        self.op = op
+        self.args = args
+
+    @classmethod
+    def compare(cls, op: str, column: Any, value: Any) -> "RowFilter":
+        if op not in cls._compare_funcs:  # pragma: no cover
+            raise ValueError(f"Does not support compare operator {op!r}")
+        return cls(op, column, value)
+
+    def __and__(self, other: "RowFilter") -> "RowFilter":
+        return RowFilter("and", self, other)
+
+    def __or__(self, other: "RowFilter") -> "RowFilter":
+        return RowFilter("or", self, other)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RowFilter):
+            return False
+        return (self.op, self.args) == (other.op, other.args)
+
+    def __hash__(self):
+        return hash((self.op, self.args))
+
+    def __repr__(self):
+        return f"RowFilter({self.op!r}, {', '.join(repr(a) for a in self.args)})"
+
+    @property
+    def columns(self) -> List[Any]:
+        if self.op in ("and", "or"):
+            return [col for arg in self.args for col in arg.columns]
+        return [self.args[0]]
+
+    def remap(self, mapping: Union[List[Any], Dict[Any, Any]]) -> "RowFilter":
+        """Replace columns of the filter with `mapping[column]`"""
+        if self.op in ("and", "or"):
+            return RowFilter(self.op, *(arg.remap(mapping) for arg in self.args))
+        column, value = self.args
+        return RowFilter(self.op, mapping[column], value)
+
+    def to_mask(self, data: Union[pa.Table, pa.RecordBatch]) -> Any:
+        if self.op == "and":
+            return pc.and_(*(arg.to_mask(data) for arg in self.args))
+        elif self.op == "or":
+            return pc.or_(*(arg.to_mask(data) for arg in self.args))
+        column, value = self.args
+        if isinstance(value, np.generic):
+            value = value.item()
+        col_data = data.column(data.schema.get_field_index(column))
+        if not self._is_arrow_comparable(col_data.type, value):
+            pd_mask = self._pandas_compare_funcs[self.op](col_data.to_pandas(), value)
+            return pa.array(np.asarray(pd_mask, dtype=bool), type=pa.bool_())
+        mask = self._compare_funcs[self.op](col_data, value)
+        # nulls are treated as NaN in pandas, which only satisfies `!=`
+        return pc.fill_null(mask, self.op == "ne")
+
+    @staticmethod
+    def _is_arrow_comparable(arrow_type: pa.DataType, value: Any) -> bool:
+        if isinstance(value, str):
+            return pa.types.is_string(arrow_type) or pa.types.is_large_string(
+                arrow_type
+            )
+        elif isinstance(value, bool):
+            return pa.types.is_boolean(arrow_type)
+        elif isinstance(value, Real):
+            return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+        return False
+
+
+def _select_arrow_columns(data: Any, columns: List[str]) -> Any:
+    arrays = [data.column(data.schema.get_field_index(col)) for col in columns]
+    return type(data).from_arrays(arrays, names=columns)
+
+
+def _arrow_to_fetched_pandas(
+    arrow_table: pa.Table, table_meta: DataFrameTableMeta
+) -> PandasObjectTypes:
+    # fetched tables are owned by fetchers, thus converted without copies
+    return arrow_to_pandas(
+        arrow_table,
+        table_meta,
+        self_destruct=True,
+        writable=options.session.writable_fetch_results,
+    )
+
+
+class _FilteredTableReader:
+    """Filters and projects record batches of table readers once read"""
+
+    def __init__(
+        self,
+        reader,
+        row_filter: Optional[RowFilter] = None,
+        columns: Optional[List[str]] = None,
+    ):
+        self._reader = reader
+        self._row_filter = row_filter
+        self._columns = columns
+
+    def _convert(self, data: Any) -> Any:
+        if self._row_filter is not None:
+            data = data.filter(self._row_filter.to_mask(data))
+        if self._columns is not None:
+            data = _select_arrow_columns(data, self._columns)
+        return data
+
+    def read(self) -> Optional[pa.RecordBatch]:
+        batch = self._reader.read()
+        return None if batch is None else self._convert(batch)
+
+    def read_all(self) -> pa.Table:
+        batches = list(iter(self.read, None))
+        if not batches:
+            return self._convert(self._reader.read_all())
+        return pa.Table.from_batches(batches)
+
+
 class ResultFetcher(ABC):
     result_type = None
 
@@ -78,6 +248,75 @@ class ResultFetcher(ABC):
     ) -> Any:
         raise NotImplementedError
 
+    async def iter_fetch(
+        self,
+        tileable: TileableType,
+        info: ResultInfo,
+        indexes: List[Union[None, Integral, slice]],
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Fetch data of the tileable as batches. Every batch holds `batch_size`
+        rows if specified, otherwise about `batch_bytes` bytes. The default
+        implementation fetches all data and split it.
+        """
+        data = await self.fetch(tileable, info, indexes)
+        if not batch_size or not hasattr(data, "iloc") or len(data) <= batch_size:
+            yield data
+            return
+        for start in range(0, len(data), batch_size):
+            yield data.iloc[start : start + batch_size]
+
+    async def fetch_to_file(
+        self,
+        tileable: TileableType,
+        info: ResultInfo,
+        indexes: List[Union[None, Integral, slice]],
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+    ) -> None:
+        """
+        Write data of the tileable into a local file. The default
+        implementation fetches all data as pandas object and write it.
+        """
+        data = await self.fetch(tileable, info, indexes)
+        write_arrow_tables(
+            [pandas_to_export_table(data, index=index)],
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+        )
+
+    async def fetch_corner(
+        self,
+        tileable: TileableType,
+        info: ResultInfo,
+        head_rows: int,
+        tail_rows: int,
+    ) -> Any:
+        """
+        Fetch first `head_rows` rows and last `tail_rows` rows of the tileable
+        as a single object. The default implementation fetches them separately,
+        or fetches all data when results cannot be concatenated by rows.
+        """
+        if isinstance(tileable, OBJECT_TYPE) or not getattr(tileable, "ndim", 0):
+            return await self.fetch(tileable, info, None)
+
+        head = await self.fetch(tileable, info, [slice(None, head_rows)])
+        tail = await self.fetch(tileable, info, [slice(-tail_rows, None)])
+        if isinstance(head, (pd.DataFrame, pd.Series)):
+            return pd.concat([head, tail], axis="index")
+        elif isinstance(head, pd.Index):
+            return head.append(tail)
+        elif isinstance(head, np.ndarray):
+            return np.concatenate([head, tail])
+        return await self.fetch(tileable, info, None)
+
 
 @register_fetcher
 class NullFetcher(ResultFetcher):
@@ -104,7 +343,7 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
     result_type = ResultType.ODPS_TABLE
 
     def _get_table_comment(self, table_name: str) -> Optional[str]:
-        table = self._odps_entry.get_table(table_name)
+        table = get_meta_cache(self._odps_entry).get_table(table_name)
         return getattr(table, "comment", None)
 
     async def update_tileable_meta(
@@ -121,7 +360,7 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
                 tileable.refresh_from_table_meta(info.table_meta)
             else:
                 # need to get meta directly from table
-                table = self._odps_entry.get_table(info.full_table_name)
+                table = get_meta_cache(self._odps_entry).get_table(info.full_table_name)
                 pd_dtypes = odps_schema_to_pandas_dtypes(table.table_schema).drop(
                     info.table_meta.table_index_column_names
                 )
@@ -130,16 +369,24 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
         if tileable.shape and any(pd.isna(x) for x in tileable.shape):
             part_specs = [None] if not info.partition_specs else info.partition_specs
 
+            meta_cache = get_meta_cache(self._odps_entry)
             with sync_pyodps_options():
-                table = self._odps_entry.get_table(info.full_table_name)
+                table = meta_cache.get_table(info.full_table_name)
                 if isinstance(tileable, DATAFRAME_TYPE) and tileable.dtypes is None:
                     dtypes = odps_schema_to_pandas_dtypes(table.table_schema)
                     tileable.refresh_from_dtypes(dtypes)
 
-                part_sessions = TunnelTableIO.create_download_sessions(
-                    self._odps_entry, info.full_table_name, part_specs
+                total_records = meta_cache.get_record_count(
+                    info.full_table_name, part_specs
                 )
-                total_records = sum(session.count for session in part_sessions.values())
+                if total_records is None:
+                    # download sessions are cached and reused by readers
+                    part_sessions = TunnelTableIO.create_download_sessions(
+                        self._odps_entry, info.full_table_name, part_specs
+                    )
+                    total_records = sum(
+                        session.count for session in part_sessions.values()
+                    )
 
             new_shape_list = list(tileable.shape)
             new_shape_list[0] = total_records
@@ -167,21 +414,58 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
             read_kw["stop"] = min(size, row_sel.stop)
         return read_kw
 
-    def _read_single_source(
+    @staticmethod
+    def _get_column_positions(
+        table_meta: DataFrameTableMeta, col_sel: Union[Integral, slice, List[int]]
+    ) -> List[int]:
+        if isinstance(col_sel, Integral):
+            return [col_sel]
+        elif isinstance(col_sel, slice):
+            return list(range(len(table_meta.table_column_names)))[col_sel]
+        elif isinstance(col_sel, list):
+            return col_sel
+        raise NotImplementedError(  # pragma: no cover
+            f"Does not support column index {col_sel!r}"
+        )
+
+    @classmethod
+    def _get_output_table_meta(
+        cls,
+        table_meta: DataFrameTableMeta,
+        indexes: List[Union[None, Integral, slice, list, RowFilter]],
+    ) -> DataFrameTableMeta:
+        """
+        Get meta of fetched data after columns are selected. Data with
+        selected columns are always fetched as DataFrames.
+        """
+        col_sel = indexes[1] if indexes and len(indexes) > 1 else None
+        if col_sel is None:
+            return table_meta
+        positions = cls._get_column_positions(table_meta, col_sel)
+        return DataFrameTableMeta(
+            table_name=table_meta.table_name,
+            type=table_meta.type,
+            table_column_names=[table_meta.table_column_names[p] for p in positions],
+            table_index_column_names=table_meta.table_index_column_names,
+            pd_column_dtypes=table_meta.pd_column_dtypes.iloc[positions],
+            pd_column_level_names=table_meta.pd_column_level_names,
+            pd_index_dtypes=table_meta.pd_index_dtypes,
+        )
+
+    def _get_read_kwargs(
         self,
         table_meta: DataFrameTableMeta,
-        info: ODPSTableResultInfo,
-        indexes: List[Union[None, Integral, slice]],
+        indexes: List[Union[None, Integral, slice, list, RowFilter]],
         shape: Tuple[Optional[int], ...],
-    ):
-        table_io = ODPSTableIO(self._odps_entry)
+    ) -> Tuple[dict, Optional[int]]:
         read_kw = {}
         row_step = None
         if indexes:
-            if len(indexes) < 2:
-                indexes += [None]
-            row_sel, col_sel = indexes
-            if isinstance(row_sel, slice):
+            row_sel, col_sel = (list(indexes) + [None])[:2]
+            if isinstance(row_sel, RowFilter):
+                # filters are applied on batches once read
+                read_kw["row_filter"] = row_sel.remap(table_meta.table_column_names)
+            elif isinstance(row_sel, slice):
                 row_step = row_sel.step
                 read_kw = self._align_selection_with_shape(row_sel, shape)
             elif isinstance(row_sel, int):
@@ -191,19 +475,66 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
             elif row_sel is not None:  # pragma: no cover
                 raise NotImplementedError(f"Does not support row index {row_sel!r}")
 
-            if isinstance(col_sel, (int, slice)):
-                data_cols = table_meta.table_column_names[col_sel]
-                if isinstance(col_sel, int):
-                    data_cols = [data_cols]
-                read_kw["columns"] = table_meta.table_index_column_names + data_cols
-            elif col_sel is not None:  # pragma: no cover
-                raise NotImplementedError(f"Does not support column index {row_sel!r}")
-
+            if col_sel is not None:
+                positions = self._get_column_positions(table_meta, col_sel)
+                data_cols = [table_meta.table_column_names[p] for p in positions]
+                out_cols = table_meta.table_index_column_names + data_cols
+                read_kw["columns"] = out_cols
+                if "row_filter" in read_kw:
+                    # columns only used in filters are read and dropped later
+                    filter_cols = read_kw["row_filter"].columns
+                    extra_cols = [c for c in filter_cols if c not in out_cols]
+                    if extra_cols:
+                        read_kw["columns"] = out_cols + list(dict.fromkeys(extra_cols))
+                        read_kw["output_columns"] = out_cols
+        return read_kw, row_step
+
+    @contextlib.contextmanager
+    def _open_reader(self, info: ODPSTableResultInfo, read_kw: dict):
+        read_kw = read_kw.copy()
+        row_filter = read_kw.pop("row_filter", None)
+        output_columns = read_kw.pop("output_columns", None)
+        table_io = ODPSTableIO(self._odps_entry)
         with table_io.open_reader(
-            info.full_table_name, info.partition_specs, **read_kw
+            info.full_table_name,
+            info.partition_specs,
+            concurrency=options.session.fetch_concurrency,
+            **read_kw,
         ) as reader:
+            if row_filter is not None or output_columns is not None:
+                reader = _FilteredTableReader(reader, row_filter, output_columns)
+            yield reader
+
+    def _read_table(
+        self, info: ODPSTableResultInfo, read_kw: dict, tileable_key: str = None
+    ) -> pa.Table:
+        cache = get_fetch_cache() if tileable_key is not None else None
+        if cache is not None:
+            cache_key = cache.build_key(
+                info.full_table_name, info.partition_specs, read_kw
+            )
+            result = cache.get(cache_key)
+            if result is not None:
+                return result
+
+        with self._open_reader(info, read_kw) as reader:
             result = reader.read_all()
-            reader_count = result.num_rows
+
+        if cache is not None:
+            cache.put(cache_key, tileable_key, result)
+        return result
+
+    def _read_single_source(
+        self,
+        table_meta: DataFrameTableMeta,
+        info: ODPSTableResultInfo,
+        indexes: List[Union[None, Integral, slice]],
+        shape: Tuple[Optional[int], ...],
+        tileable_key: str = None,
+    ):
+        read_kw, row_step = self._get_read_kwargs(table_meta, indexes, shape)
+        result = self._read_table(info, read_kw, tileable_key)
+        reader_count = result.num_rows
 
         if not row_step:
             return result
@@ -224,9 +555,179 @@ class ODPSTableFetcher(ToThreadMixin, ResultFetcher):
     ) -> PandasObjectTypes:
         table_meta = build_dataframe_table_meta(tileable)
         arrow_table: pa.Table = await self.to_thread(
-            self._read_single_source, table_meta, info, indexes, tileable.shape
+            self._read_single_source,
+            table_meta,
+            info,
+            indexes,
+            tileable.shape,
+            tileable.key,
         )
-        return arrow_to_pandas(arrow_table, table_meta)
+        out_meta = self._get_output_table_meta(table_meta, indexes)
+        return _arrow_to_fetched_pandas(arrow_table, out_meta)
+
+    @staticmethod
+    def _iter_table_batches(
+        reader, batch_size: Optional[int], batch_bytes: Optional[int]
+    ) -> Iterator[pa.Table]:
+        batch_bytes = batch_bytes or _DEFAULT_BATCH_BYTES
+        pending_batches = []
+        pending_rows = pending_bytes = 0
+        has_output = False
+        while True:
+            batch = reader.read()
+            if batch is None:
+                break
+            pending_batches.append(batch)
+            pending_rows += batch.num_rows
+            pending_bytes += batch.nbytes
+            if batch_size:
+                while pending_rows >= batch_size:
+                    pending = pa.Table.from_batches(pending_batches)
+                    yield pending.slice(0, batch_size)
+                    pending = pending.slice(batch_size)
+                    pending_batches = pending.to_batches()
+                    pending_rows, pending_bytes = pending.num_rows, pending.nbytes
+                    has_output = True
+            elif pending_bytes >= batch_bytes:
+                yield pa.Table.from_batches(pending_batches)
+                pending_batches = []
+                pending_rows = pending_bytes = 0
+                has_output = True
+        if pending_batches:
+            yield pa.Table.from_batches(pending_batches)
+        elif not has_output:
+            yield reader.read_all()
+
+    def _iter_pandas_batches(
+        self,
+        table_meta: DataFrameTableMeta,
+        info: ODPSTableResultInfo,
+        read_kw: dict,
+        batch_size: Optional[int],
+        batch_bytes: Optional[int],
+    ) -> Iterator[PandasObjectTypes]:
+        with self._open_reader(info, read_kw) as reader:
+            for arrow_table in self._iter_table_batches(
+                reader, batch_size, batch_bytes
+            ):
+                yield _arrow_to_fetched_pandas(arrow_table, table_meta)
+
+    def _write_table_to_file(
+        self,
+        table_meta: DataFrameTableMeta,
+        info: ODPSTableResultInfo,
+        read_kw: dict,
+        path: str,
+        index: bool,
+        **write_kw,
+    ) -> None:
+        with self._open_reader(info, read_kw) as reader:
+            # record batches are written once read without building pandas
+            tables = (
+                arrow_to_export_table(table, table_meta, index=index)
+                for table in self._iter_table_batches(reader, None, None)
+            )
+            write_arrow_tables(tables, path, **write_kw)
+
+    async def fetch_to_file(
+        self,
+        tileable: TileableType,
+        info: ODPSTableResultInfo,
+        indexes: List[Union[None, Integral, slice]],
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+    ) -> None:
+        with enter_mode(build=True):
+            table_meta = build_dataframe_table_meta(tileable)
+        read_kw, row_step = self._get_read_kwargs(table_meta, indexes, tileable.shape)
+        if row_step not in (None, 1):
+            # stepped rows are sliced after all data are read
+            return await super().fetch_to_file(
+                tileable,
+                info,
+                indexes,
+                path,
+                format=format,
+                partition_cols=partition_cols,
+                row_group_size=row_group_size,
+                index=index,
+            )
+        await self.to_thread(
+            self._write_table_to_file,
+            self._get_output_table_meta(table_meta, indexes),
+            info,
+            read_kw,
+            path,
+            index,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+        )
+
+    async def fetch_corner(
+        self,
+        tileable: TileableType,
+        info: ODPSTableResultInfo,
+        head_rows: int,
+        tail_rows: int,
+    ) -> PandasObjectTypes:
+        n_rows = tileable.shape[0]
+        if pd.isna(n_rows):
+            return await super().fetch_corner(tileable, info, head_rows, tail_rows)
+
+        # read both ranges with known shape in a single read session
+        ranges = [(0, min(head_rows, n_rows))]
+        tail_start = max(n_rows - tail_rows, head_rows)
+        if tail_start < n_rows:
+            ranges.append((tail_start, n_rows))
+
+        table_meta = build_dataframe_table_meta(tileable)
+        arrow_table: pa.Table = await self.to_thread(
+            self._read_table, info, {"ranges": ranges}, tileable.key
+        )
+        return _arrow_to_fetched_pandas(arrow_table, table_meta)
+
+    async def iter_fetch(
+        self,
+        tileable: TileableType,
+        info: ODPSTableResultInfo,
+        indexes: List[Union[None, Integral, slice]],
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+    ) -> AsyncIterator[PandasObjectTypes]:
+        with enter_mode(build=True):
+            table_meta = build_dataframe_table_meta(tileable)
+        read_kw, row_step = self._get_read_kwargs(table_meta, indexes, tileable.shape)
+        if row_step not in (None, 1):
+            # stepped rows are sliced after all data are read
+            async for batch in super().iter_fetch(
+                tileable, info, indexes, batch_size, batch_bytes
+            ):
+                yield batch
+            return
+
+        out_meta = self._get_output_table_meta(table_meta, indexes)
+        batch_iter = self._iter_pandas_batches(
+            out_meta, info, read_kw, batch_size, batch_bytes
+        )
+        # the next batch is read in background when current batch is consumed
+        next_batch = asyncio.ensure_future(self.to_thread(next, batch_iter, None))
+        try:
+            while True:
+                batch = await next_batch
+                if batch is None:
+                    break
+                next_batch = asyncio.ensure_future(
+                    self.to_thread(next, batch_iter, None)
+                )
+                yield batch
+        finally:
+            if not next_batch.done():
+                await asyncio.wait([next_batch])
+            await self.to_thread(batch_iter.close)
 
 
 @register_fetcher
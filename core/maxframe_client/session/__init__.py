@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .odps import MaxFrameRestSession
+from .pool import SessionPool
 
 
 def register_session_schemes(overwrite: bool = False):
@@ -16,7 +16,7 @@ import itertools
 import logging
 import warnings
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from weakref import WeakSet
 
 from maxframe.core import (
@@ -26,7 +26,7 @@ from maxframe.core import (
     build_fetch,
     enter_mode,
 )
-from maxframe.core.operator import Fetch
+from maxframe.core.operator import Fetch, SubmittedOperatorRef
 from maxframe.session import AbstractSession
 from maxframe.utils import copy_tileables
 
@@ -123,3 +123,49 @@ def gen_submit_tileable_graph(
         )
 
     return graph, to_execute_tileables
+
+
+@enter_mode(build=True, kernel=True)
+def replace_submitted_operators(
+    graph: TileableGraph,
+    submitted_op_keys: Set[str],
+    excluded: Optional[Set[TileableType]] = None,
+) -> List[str]:
+    """
+    Replace operators already submitted to the service with references
+    to avoid sending their definitions again. Tileables in the graph are
+    modified in place, thus the graph should be generated by
+    `gen_submit_tileable_graph`.
+
+    Parameters
+    ----------
+    graph : TileableGraph
+        Graph to submit
+    submitted_op_keys : Set[str]
+        Keys of operators already submitted in current session
+    excluded : Optional[Set[TileableType]]
+        Tileables whose operators shall not be replaced
+
+    Returns
+    -------
+    ref_op_keys : List[str]
+        Keys of replaced operators
+    """
+    excluded = excluded or set()
+    ref_op_keys = []
+    for tileable in graph:
+        op = tileable.op
+        if (
+            isinstance(op, (Fetch, SubmittedOperatorRef))
+            or tileable in excluded
+            or op.key not in submitted_op_keys
+        ):
+            continue
+        ref_op = SubmittedOperatorRef(_key=op.key, _output_types=op.output_types)
+        ref_op.inputs = op.inputs
+        ref_op.outputs = op.outputs
+        for out in ref_op.outputs:
+            if out is not None:
+                out._op = ref_op
+        ref_op_keys.append(op.key)
+    return ref_op_keys
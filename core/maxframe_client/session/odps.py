@@ -14,21 +14,29 @@
 
 import abc
 import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
 import copy
+import functools
+import inspect
 import logging
+import threading
 import time
 import weakref
-from numbers import Integral
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from numbers import Integral, Real
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 import numpy as np
 import pandas as pd
 from odps import ODPS
 from odps import options as odps_options
+from odps import types as odps_types
 from odps.console import in_ipython_frontend
 
-from maxframe.config import options
+from maxframe.config import option_context, options
 from maxframe.core import Entity, TileableGraph, build_fetch, enter_mode
 from maxframe.core.operator import Fetch
 from maxframe.dataframe import read_odps_table
@@ -47,9 +55,11 @@ from maxframe.io.odpsio import (
     pandas_to_arrow,
     pandas_to_odps_schema,
 )
+from maxframe.io.odpsio.metacache import invalidate_meta_cache
 from maxframe.protocol import (
     DagInfo,
     DagStatus,
+    DataFrameTableMeta,
     ODPSTableResultInfo,
     ODPSVolumeResultInfo,
     ResultInfo,
@@ -63,23 +73,273 @@ from maxframe.session import (
     Progress,
 )
 from maxframe.tensor.datasource import ArrayDataSource
-from maxframe.typing_ import TileableType
+from maxframe.typing_ import PandasObjectTypes, TileableType
 from maxframe.utils import (
     ToThreadMixin,
     build_session_volume_name,
     build_temp_table_name,
+    ceildiv,
+    estimate_pandas_size,
     get_default_table_properties,
     str_to_bool,
     sync_pyodps_options,
+    tokenize,
 )
 
 from ..clients.framedriver import FrameDriverClient
-from ..fetcher import get_fetcher_cls
+from ..fetch_cache import invalidate_fetch_cache
+from ..fetcher import RowFilter, get_fetcher_cls
 from .consts import RESTFUL_SESSION_INSECURE_SCHEME, RESTFUL_SESSION_SECURE_SCHEME
-from .graph import gen_submit_tileable_graph
+from .graph import gen_submit_tileable_graph, replace_submitted_operators
 
 logger = logging.getLogger(__name__)
 
+# portion of progress taken by uploading local data sources
+_UPLOAD_PROGRESS_PORTION = 0.1
+# uploaded temp tables are not reused when close to being reclaimed
+_UPLOAD_CACHE_EXPIRE_MARGIN = 3600
+# estimated size of items with object dtypes, for instance, strings
+_OBJECT_ITEM_SIZE = 64
+
+
+@dataclass
+class _UploadedSource:
+    session_id: str
+    tileable_key: str
+    # full table name for temp tables or object path for volume objects
+    location: str
+    expire_time: Optional[float] = None
+    # (session_id, tileable_key) of tileables reading the uploaded source
+    ref_keys: Set[Tuple[str, str]] = field(default_factory=set)
+    # referencing keys already decref-ed, whose decref requests are held
+    #  until the source is no longer referenced
+    held_keys: Set[Tuple[str, str]] = field(default_factory=set)
+
+
+class _UploadedSourceRegistry:
+    """
+    Registry of uploaded local data sources keyed by tokens of their contents.
+    Tileables reusing uploaded sources are counted as references, and the
+    decref of these tileables is held until all of them are decref-ed, thus
+    uploaded data will not be purged while still in use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._token_to_sources: Dict[str, _UploadedSource] = dict()
+        self._key_to_sources: Dict[Tuple[str, str], _UploadedSource] = dict()
+
+    def get(self, token: str) -> Optional[_UploadedSource]:
+        with self._lock:
+            source = self._token_to_sources.get(token)
+            if source is not None and (
+                source.expire_time is not None and source.expire_time < time.time()
+            ):
+                del self._token_to_sources[token]
+                source = None
+            return source
+
+    def _add_ref(self, source: _UploadedSource, session_id: str, key: str) -> None:
+        ref_key = (session_id, key)
+        source.ref_keys.add(ref_key)
+        source.held_keys.discard(ref_key)
+        self._key_to_sources[ref_key] = source
+
+    def put(self, token: str, source: _UploadedSource) -> None:
+        with self._lock:
+            self._token_to_sources[token] = source
+            self._add_ref(source, source.session_id, source.tileable_key)
+
+    def add_ref(self, source: _UploadedSource, session_id: str, key: str) -> None:
+        with self._lock:
+            self._add_ref(source, session_id, key)
+
+    def remove(self, token: str) -> None:
+        with self._lock:
+            self._token_to_sources.pop(token, None)
+
+    def _remove_source(self, source: _UploadedSource) -> None:
+        tokens = [t for t, s in self._token_to_sources.items() if s is source]
+        for token in tokens:
+            del self._token_to_sources[token]
+
+    def release(self, session_id: str, tileable_keys: List[str]) -> List[str]:
+        """
+        Removes references from specified tileables and returns keys whose
+        decref can be sent to the service. Decref of tileables referencing
+        uploaded sources is held until the last reference is removed.
+        """
+        released = []
+        with self._lock:
+            for key in tileable_keys:
+                ref_key = (session_id, key)
+                source = self._key_to_sources.get(ref_key)
+                if source is None:
+                    released.append(key)
+                    continue
+                if ref_key in source.held_keys:
+                    continue
+                source.ref_keys.discard(ref_key)
+                source.held_keys.add(ref_key)
+                if source.ref_keys:
+                    continue
+                # data of the source may be purged and cannot be reused.
+                #  held keys of other sessions are purged when these
+                #  sessions are deleted.
+                self._remove_source(source)
+                for held_key in source.held_keys:
+                    self._key_to_sources.pop(held_key, None)
+                released.extend(k for sid, k in source.held_keys if sid == session_id)
+                source.held_keys.clear()
+        return released
+
+    def invalidate(self, session_id: str) -> None:
+        """Removes sources uploaded and references made by a session"""
+        with self._lock:
+            to_remove = [
+                source
+                for source in self._token_to_sources.values()
+                if source.session_id == session_id
+            ]
+            for source in to_remove:
+                self._remove_source(source)
+            ref_keys = [k for k in self._key_to_sources if k[0] == session_id]
+            for ref_key in ref_keys:
+                source = self._key_to_sources.pop(ref_key)
+                source.ref_keys.discard(ref_key)
+                source.held_keys.discard(ref_key)
+
+
+_uploaded_sources = _UploadedSourceRegistry()
+
+
+def _estimate_fetch_size(
+    tileable: TileableType, indexes: Optional[List[Union[slice, Integral]]]
+) -> Optional[int]:
+    """Estimates size of fetched data, None if the size cannot be estimated"""
+    shape = getattr(tileable, "shape", None)
+    if not shape:
+        return 0
+    n_rows = shape[0]
+    row_sel = indexes[0] if indexes else None
+    if isinstance(row_sel, Integral):
+        n_rows = 1
+    elif isinstance(row_sel, slice) and not pd.isna(n_rows):
+        n_rows = len(range(*row_sel.indices(n_rows)))
+    if pd.isna(n_rows) or any(pd.isna(s) for s in shape[1:]):
+        return None
+
+    if isinstance(tileable, DATAFRAME_TYPE):
+        if tileable.dtypes is None:
+            return None
+        dtypes = list(tileable.dtypes)
+    else:
+        dtype = getattr(tileable, "dtype", None)
+        dtypes = [dtype] * int(np.prod(shape[1:]))
+
+    row_size = 0
+    for dtype in dtypes:
+        if isinstance(dtype, np.dtype) and dtype != np.dtype("O"):
+            row_size += dtype.itemsize
+        else:
+            row_size += _OBJECT_ITEM_SIZE
+    return int(n_rows * row_size)
+
+
+def _squeeze_fetched(
+    tileable: TileableType,
+    indexes: Optional[List[Union[slice, Integral]]],
+    data: Any,
+) -> Any:
+    """
+    Reduce dimensions of fetched data selected with integer indexes, as
+    rows and columns selected from DataFrames are fetched as DataFrames.
+    """
+    ndim = getattr(tileable, "ndim", None)
+    if not isinstance(data, (pd.DataFrame, pd.Series)) or ndim is None:
+        return data
+    row_sel, col_sel = (list(indexes or ()) + [None, None])[:2]
+    squeeze_row = isinstance(row_sel, Integral) and data.ndim > ndim
+    if isinstance(data, pd.DataFrame) and isinstance(col_sel, Integral):
+        data = data.iloc[0, 0] if squeeze_row else data.iloc[:, 0]
+    elif squeeze_row:
+        data = data.iloc[0]
+    return data
+
+
+def _is_filter_value_compatible(dtype: Any, value: Any) -> bool:
+    """
+    Check if comparisons between columns and the scalar can be pushed down.
+    Object columns not stored as arrow strings are compared as pandas
+    objects by fetchers.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return isinstance(value, (bool, np.bool_))
+    elif pd.api.types.is_numeric_dtype(dtype):
+        return isinstance(value, Real) and not isinstance(value, (bool, np.bool_))
+    elif pd.api.types.is_string_dtype(dtype):
+        return isinstance(value, str)
+    return False
+
+
+def _apply_session_settings(func):
+    """Applies settings of the session when calling the method"""
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def wrapped(self, *args, **kwargs):
+            agen = func(self, *args, **kwargs)
+            while True:
+                # settings are not applied when consumers handle items
+                with self._settings_context():
+                    try:
+                        item = await agen.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield item
+
+    else:
+
+        @functools.wraps(func)
+        async def wrapped(self, *args, **kwargs):
+            with self._settings_context():
+                return await func(self, *args, **kwargs)
+
+    return wrapped
+
+
+class _FetchMemoryBudget:
+    """
+    Limits total estimated size of data being fetched concurrently. Fetches
+    larger than the budget or with unknown sizes occupy the whole budget.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        self._limit = limit
+        self._used = 0
+        self._cond = asyncio.Condition()
+
+    def _normalize_size(self, size: Optional[int]) -> int:
+        if self._limit is None:
+            return 0
+        return self._limit if size is None else min(size, self._limit)
+
+    async def acquire(self, size: Optional[int]) -> int:
+        if self._limit is None:
+            return 0
+        size = self._normalize_size(size)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._used + size <= self._limit)
+            self._used += size
+        return size
+
+    async def release(self, size: int) -> None:
+        if self._limit is None:
+            return
+        async with self._cond:
+            self._used -= size
+            self._cond.notify_all()
+
 
 class MaxFrameServiceCaller(metaclass=abc.ABCMeta):
     def get_settings_to_upload(self) -> Dict[str, Any]:
@@ -146,6 +406,7 @@ class MaxFrameServiceCaller(metaclass=abc.ABCMeta):
         dag: TileableGraph,
         managed_input_infos: Dict[str, ResultInfo],
         new_settings: Dict[str, Any] = None,
+        profiling: Optional[Profiling] = None,
     ) -> DagInfo:
         raise NotImplementedError
 
@@ -153,6 +414,14 @@ class MaxFrameServiceCaller(metaclass=abc.ABCMeta):
     def get_dag_info(self, dag_id: str) -> DagInfo:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def wait_dag(self, dag_id: str, timeout: float) -> DagInfo:
+        """
+        Wait until the DAG terminates or timeout is reached on the service
+        side and return the latest DAG info.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def cancel_dag(self, dag_id: str) -> DagInfo:
         raise NotImplementedError
@@ -166,6 +435,9 @@ class MaxFrameServiceCaller(metaclass=abc.ABCMeta):
 
 
 class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
+    # blocking calls like DAG waits shall not block cancellation or submission
+    _thread_pool_size = 4
+
     _odps_entry: Optional[ODPS]
     _tileable_to_infos: Mapping[TileableType, ResultInfo]
 
@@ -197,6 +469,16 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
         self.timeout = timeout
         self._odps_entry = odps_entry or ODPS.from_global() or ODPS.from_environments()
         self._tileable_to_infos = weakref.WeakKeyDictionary()
+        # maps keys of uploaded tensor sources to paths in session volume
+        self._uploaded_volume_paths: Dict[str, str] = dict()
+        # maps keys of submitted tileables to keys of their operators
+        self._submitted_tileable_to_op_keys: Dict[str, str] = dict()
+        self._submitted_op_keys: Set[str] = set()
+        # keys of tileables and operators in DAGs not finished yet
+        self._dag_to_tileable_op_keys: Dict[str, Dict[str, str]] = dict()
+
+        # options applied whenever the session is used
+        self._session_settings = kwargs.pop("session_settings", None) or dict()
 
         self._caller = self._create_caller(odps_entry, address, **kwargs)
         self._last_settings = None
@@ -209,47 +491,118 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
     ) -> MaxFrameServiceCaller:
         raise NotImplementedError
 
+    def _settings_context(self):
+        if not self._session_settings:
+            return contextlib.nullcontext()
+        return option_context(self._session_settings)
+
+    @_apply_session_settings
     async def _init(self, _address: str):
         session_info = await self.ensure_async_call(self._caller.create_session)
         self._last_settings = copy.deepcopy(self._caller.get_settings_to_upload())
         self._session_id = session_info.session_id
         await self._show_logview_address()
 
+    def _write_pandas_data(self, full_table_name: str, data: PandasObjectTypes):
+        batch_size = options.session.upload_batch_size
+        batch_starts = list(range(0, len(data), batch_size))
+
+        def get_arrow_batch(batch_start: int):
+            if isinstance(data, pd.Index):
+                batch = data[batch_start : batch_start + batch_size]
+            else:
+                batch = data.iloc[batch_start : batch_start + batch_size]
+            arrow_batch, _ = pandas_to_arrow(batch)
+            return arrow_batch
+
+        table_client = ODPSTableIO(self._odps_entry)
+        concurrency = min(options.session.upload_concurrency, len(batch_starts))
+        if concurrency <= 1:
+            with table_client.open_writer(full_table_name) as writer:
+                for batch_start in batch_starts:
+                    writer.write(get_arrow_batch(batch_start))
+            return
+
+        # batches are grouped into contiguous blocks to keep row orders
+        #  as blocks are committed in the order of block ids
+        block_size = ceildiv(len(batch_starts), concurrency)
+        block_count = ceildiv(len(batch_starts), block_size)
+
+        def write_block(block_writer, block_id: int):
+            block_starts = batch_starts[
+                block_id * block_size : (block_id + 1) * block_size
+            ]
+            with block_writer.open_block(block_id) as writer:
+                for batch_start in block_starts:
+                    writer.write(get_arrow_batch(batch_start))
+
+        with table_client.open_multi_block_writer(full_table_name) as block_writer:
+            with concurrent.futures.ThreadPoolExecutor(
+                block_count, thread_name_prefix="UploadBlock"
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        write_block,
+                        block_writer,
+                        block_id,
+                    )
+                    for block_id in range(block_count)
+                ]
+                for fut in futures:
+                    fut.result()
+
+    def _get_source_token(self, t: TileableType, *extra_args) -> Optional[str]:
+        if not options.session.enable_upload_cache:
+            return None
+        return tokenize(
+            self._odps_entry.endpoint,
+            self._odps_entry.project,
+            *extra_args,
+            t.op.get_data(),
+        )
+
+    def _get_uploaded_source(
+        self, token: Optional[str], t: TileableType, check_table: bool = False
+    ) -> Optional[_UploadedSource]:
+        source = _uploaded_sources.get(token) if token is not None else None
+        if source is None:
+            return None
+        if check_table and not self._odps_entry.exist_table(source.location):
+            _uploaded_sources.remove(token)
+            return None
+        logger.debug("Reuse uploaded source %s for local source", source.location)
+        # uploaded data shall not be purged when the tileable is still alive
+        _uploaded_sources.add_ref(source, self.session_id, t.key)
+        return source
+
+    def _register_uploaded_table(
+        self, token: Optional[str], t: TileableType, full_table_name: str
+    ) -> None:
+        lifecycle = options.session.temp_table_lifecycle
+        if token is None or not lifecycle or lifecycle <= 0:
+            return
+        # lifecycle of tables are measured in days
+        expire_time = time.time() + lifecycle * 24 * 3600 - _UPLOAD_CACHE_EXPIRE_MARGIN
+        _uploaded_sources.put(
+            token,
+            _UploadedSource(self.session_id, t.key, full_table_name, expire_time),
+        )
+
     def _upload_and_get_table_read_tileable(
         self, t: TileableType
     ) -> Optional[TileableType]:
         table_schema, table_meta = pandas_to_odps_schema(t, unknown_as_string=True)
-        if self._odps_entry.exist_table(table_meta.table_name):
-            self._odps_entry.delete_table(
-                table_meta.table_name, hints=options.sql.settings
-            )
-        table_name = build_temp_table_name(self.session_id, t.key)
-        table_obj = self._odps_entry.create_table(
-            table_name,
-            table_schema,
-            lifecycle=options.session.temp_table_lifecycle,
-            hints=options.sql.settings,
-            if_not_exists=True,
-            table_properties=options.session.temp_table_properties
-            or get_default_table_properties(),
-        )
-
-        data = t.op.get_data()
-        batch_size = options.session.upload_batch_size
-
-        if len(data):
-            table_client = ODPSTableIO(self._odps_entry)
-            with table_client.open_writer(table_obj.full_table_name) as writer:
-                for batch_start in range(0, len(data), batch_size):
-                    if isinstance(data, pd.Index):
-                        batch = data[batch_start : batch_start + batch_size]
-                    else:
-                        batch = data.iloc[batch_start : batch_start + batch_size]
-                    arrow_batch, _ = pandas_to_arrow(batch)
-                    writer.write(arrow_batch)
+        token = self._get_source_token(t)
+        source = self._get_uploaded_source(token, t, check_table=True)
+        if source is not None:
+            full_table_name = source.location
+        else:
+            full_table_name = self._upload_pandas_table(t, table_schema, table_meta)
+            self._register_uploaded_table(token, t, full_table_name)
 
         read_tileable = read_odps_table(
-            table_obj.full_table_name,
+            full_table_name,
             columns=table_meta.table_column_names,
             index_col=table_meta.table_index_column_names,
             output_type=table_meta.type,
@@ -267,26 +620,71 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
         read_tileable.params = t.params
         return read_tileable.data
 
+    def _upload_pandas_table(
+        self,
+        t: TileableType,
+        table_schema: odps_types.OdpsSchema,
+        table_meta: DataFrameTableMeta,
+    ) -> str:
+        if self._odps_entry.exist_table(table_meta.table_name):
+            self._odps_entry.delete_table(
+                table_meta.table_name, hints=options.sql.settings
+            )
+            # metadata of dropped tables shall not be reused
+            invalidate_meta_cache(self._odps_entry, [table_meta.table_name])
+        table_name = build_temp_table_name(self.session_id, t.key)
+        table_obj = self._odps_entry.create_table(
+            table_name,
+            table_schema,
+            lifecycle=options.session.temp_table_lifecycle,
+            hints=options.sql.settings,
+            if_not_exists=True,
+            table_properties=options.session.temp_table_properties
+            or get_default_table_properties(),
+        )
+        invalidate_meta_cache(self._odps_entry, {table_name, table_obj.full_table_name})
+
+        data = t.op.get_data()
+        if len(data):
+            self._write_pandas_data(table_obj.full_table_name, data)
+        return table_obj.full_table_name
+
     def _upload_and_get_vol_read_tileable(
         self, t: TileableType
     ) -> Optional[TileableType]:
         vol_name = build_session_volume_name(self.session_id)
-        writer = ODPSVolumeWriter(
-            self._odps_entry,
-            vol_name,
-            t.key,
-            replace_internal_host=self._replace_internal_host,
-        )
-        io_handler = get_object_io_handler(t)
-        io_handler().write_object(writer, t, t.op.data)
+        token = self._get_source_token(t, vol_name)
+        source = self._get_uploaded_source(token, t)
+        if source is not None:
+            vol_path = source.location
+        else:
+            writer = ODPSVolumeWriter(
+                self._odps_entry,
+                vol_name,
+                t.key,
+                replace_internal_host=self._replace_internal_host,
+            )
+            io_handler = get_object_io_handler(t)
+            io_handler().write_object(writer, t, t.op.data)
+            vol_path = t.key
+            if token is not None:
+                _uploaded_sources.put(
+                    token, _UploadedSource(self.session_id, t.key, vol_path)
+                )
+        self._uploaded_volume_paths[t.key] = vol_path
         return build_fetch(t).data
 
+    @staticmethod
+    def _is_local_source(t: TileableType) -> bool:
+        return (
+            isinstance(t.op, (ArrayDataSource, PandasDataSourceOperator))
+            and t.op.get_data() is not None
+            and not t.inputs
+        )
+
+    @enter_mode(kernel=True, build=True)
     def _upload_and_get_read_tileable(self, t: TileableType) -> Optional[TileableType]:
-        if (
-            not isinstance(t.op, (ArrayDataSource, PandasDataSourceOperator))
-            or t.op.get_data() is None
-            or t.inputs
-        ):
+        if not self._is_local_source(t):
             return None
         with sync_pyodps_options():
             if isinstance(t.op, PandasDataSourceOperator):
@@ -294,18 +692,66 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
             else:
                 return self._upload_and_get_vol_read_tileable(t)
 
-    @enter_mode(kernel=True, build=True)
-    def _scan_and_replace_local_sources(
-        self, graph: TileableGraph
+    @staticmethod
+    def _estimate_source_size(t: TileableType) -> int:
+        data = t.op.get_data()
+        if isinstance(data, (pd.DataFrame, pd.Series, pd.Index)):
+            return max(estimate_pandas_size(data), 1)
+        return max(getattr(data, "nbytes", 0), 1)
+
+    async def _upload_local_sources(
+        self, sources: List[TileableType], progress: Progress, progress_portion: float
+    ) -> Dict[TileableType, TileableType]:
+        """Uploads local data sources concurrently and reports progress"""
+        source_sizes = [self._estimate_source_size(t) for t in sources]
+        total_size = sum(source_sizes)
+        uploaded_size = 0
+
+        loop = asyncio.get_running_loop()
+        pool = concurrent.futures.ThreadPoolExecutor(
+            options.session.upload_concurrency, thread_name_prefix="UploadSource"
+        )
+
+        async def upload(t: TileableType, size: int):
+            nonlocal uploaded_size
+
+            ctx = contextvars.copy_context()
+            replaced = await loop.run_in_executor(
+                pool, ctx.run, self._upload_and_get_read_tileable, t
+            )
+            uploaded_size += size
+            progress.value = progress_portion * uploaded_size / total_size
+            return t, replaced
+
+        try:
+            uploaded = await asyncio.gather(
+                *[upload(t, size) for t, size in zip(sources, source_sizes)]
+            )
+        finally:
+            pool.shutdown(wait=False)
+        return {t: replaced for t, replaced in uploaded}
+
+    async def _scan_and_replace_local_sources(
+        self,
+        graph: TileableGraph,
+        progress: Optional[Progress] = None,
+        progress_portion: float = 0.0,
     ) -> Dict[TileableType, TileableType]:
         """Replaces Pandas data sources with temp table sources in the graph"""
+        progress = progress if progress is not None else Progress()
+        sources = [t for t in graph if self._is_local_source(t)]
         replacements = dict()
-        for t in graph:
-            replaced = self._upload_and_get_read_tileable(t)
-            if replaced is None:
-                continue
-            replacements[t] = replaced
+        if sources:
+            replacements = await self._upload_local_sources(
+                sources, progress, progress_portion
+            )
+        self._replace_graph_sources(graph, replacements)
+        return replacements
 
+    @enter_mode(kernel=True, build=True)
+    def _replace_graph_sources(
+        self, graph: TileableGraph, replacements: Dict[TileableType, TileableType]
+    ) -> None:
         for src, replaced in replacements.items():
             successors = list(graph.successors(src))
             graph.remove_node(src)
@@ -319,7 +765,6 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
                 succ.op._set_inputs([replacements.get(t, t) for t in succ.inputs])
 
         graph.results = [replacements.get(t, t) for t in graph.results]
-        return replacements
 
     @enter_mode(kernel=True, build=True)
     def _get_input_infos(self, tileables: List[TileableType]) -> Dict[str, ResultInfo]:
@@ -334,7 +779,8 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
             else:
                 if isinstance(t.op, Fetch):
                     infos[key] = ODPSVolumeResultInfo(
-                        volume_name=vol_name, volume_path=t.key
+                        volume_name=vol_name,
+                        volume_path=self._uploaded_volume_paths.get(key, key),
                     )
                 elif t.inputs and isinstance(t.inputs[0].op, DataFrameReadODPSTable):
                     t = t.inputs[0]
@@ -364,16 +810,60 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
         self._last_settings = copy.deepcopy(new_settings)
         return update
 
+    @_apply_session_settings
     async def execute(self, *tileables, **kwargs) -> ExecutionInfo:
         tileables = [
             tileable.data if isinstance(tileable, Entity) else tileable
             for tileable in tileables
         ]
+        progress = Progress()
+        profiling = Profiling()
+
         tileable_to_copied = dict()
-        tileable_graph, to_execute_tileables = gen_submit_tileable_graph(
-            self, tileables, tileable_to_copied
+        with profiling.stage("build_graph") as stage_attrs:
+            tileable_graph, to_execute_tileables = gen_submit_tileable_graph(
+                self, tileables, tileable_to_copied
+            )
+            stage_attrs["n_nodes"] = len(tileable_graph)
+
+        # uploads and submission are done before returning, thus errors are
+        #  raised in place and DAGs are submitted in the order of calls
+        try:
+            dag_info = await self._submit_dag(
+                tileable_graph, tileable_to_copied, progress, profiling
+            )
+        except:  # noqa: E722  # nosec  # pylint: disable=bare-except
+            self._maybe_log_profiling(None, profiling)
+            raise
+
+        aio_task = asyncio.create_task(
+            self._run_and_log_profiling(
+                dag_info, to_execute_tileables, progress, profiling
+            )
+        )
+        return ExecutionInfo(
+            aio_task,
+            progress,
+            profiling,
+            asyncio.get_running_loop(),
+            to_execute_tileables,
         )
-        source_replacements = self._scan_and_replace_local_sources(tileable_graph)
+
+    async def _submit_dag(
+        self,
+        tileable_graph: TileableGraph,
+        tileable_to_copied: Dict[TileableType, TileableType],
+        progress: Progress,
+        profiling: Profiling,
+    ) -> DagInfo:
+        with profiling.stage("upload") as stage_attrs:
+            source_replacements = await self._scan_and_replace_local_sources(
+                tileable_graph, progress, _UPLOAD_PROGRESS_PORTION
+            )
+            stage_attrs["n_sources"] = len(source_replacements)
+            stage_attrs["bytes"] = sum(
+                self._estimate_source_size(t) for t in source_replacements
+            )
 
         # we need to manage uploaded data sources with refcounting mechanism
         # as nodes in tileable_graph are copied, we need to use original nodes
@@ -382,35 +872,91 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
             copied_to_tileable[replaced_src]._attach_session(self)
 
         replaced_infos = self._get_input_infos(list(source_replacements.values()))
-        dag_info = await self.ensure_async_call(
-            self._caller.submit_dag,
-            tileable_graph,
-            replaced_infos,
-            self._get_diff_settings(),
-        )
+
+        uploaded_sources = set(source_replacements.values())
+        tileable_to_op_keys = {
+            t.key: t.op.key
+            for t in tileable_graph
+            if not isinstance(t.op, Fetch) and t not in uploaded_sources
+        }
+        if options.session.enable_delta_submission:
+            ref_op_keys = replace_submitted_operators(
+                tileable_graph, self._submitted_op_keys, excluded=uploaded_sources
+            )
+            logger.debug("Referenced %d submitted operators", len(ref_op_keys))
+
+        with profiling.stage("submit") as stage_attrs:
+            dag_info = await self.ensure_async_call(
+                self._caller.submit_dag,
+                tileable_graph,
+                replaced_infos,
+                self._get_diff_settings(),
+                profiling=profiling,
+            )
+            stage_attrs["n_nodes"] = len(tileable_graph)
+        # operators are recorded as submitted only after the DAG succeeds
+        self._dag_to_tileable_op_keys[dag_info.dag_id] = tileable_to_op_keys
 
         await self._show_logview_address(dag_info.dag_id)
+        return dag_info
 
-        progress = Progress()
-        profiling = Profiling()
-        aio_task = asyncio.create_task(
-            self._run_in_background(dag_info, to_execute_tileables, progress)
-        )
-        return ExecutionInfo(
-            aio_task,
-            progress,
-            profiling,
-            asyncio.get_running_loop(),
-            to_execute_tileables,
-        )
+    async def _run_and_log_profiling(
+        self,
+        dag_info: DagInfo,
+        tileables: List,
+        progress: Progress,
+        profiling: Profiling,
+    ):
+        try:
+            await self._run_in_background(
+                dag_info,
+                tileables,
+                progress,
+                progress_offset=progress.value,
+                profiling=profiling,
+            )
+        finally:
+            self._maybe_log_profiling(dag_info.dag_id, profiling)
+
+    def _maybe_log_profiling(self, dag_id: Optional[str], profiling: Profiling):
+        if options.client.log_profiling and profiling.result:
+            self._log_profiling(dag_id, profiling)
+
+    def _log_profiling(self, dag_id: Optional[str], profiling: Profiling):
+        for record in profiling.result["stages"]:
+            logger.info(
+                "Stage %s of DAG %s in session %s took %.3f seconds",
+                record["name"],
+                dag_id,
+                self._session_id,
+                record["duration"],
+                extra={
+                    "maxframe_profiling": dict(
+                        record, session_id=self._session_id, dag_id=dag_id
+                    )
+                },
+            )
+
+    async def _wait_dag_info(self, dag_id: str, wait_timeout: float) -> DagInfo:
+        if not wait_timeout or wait_timeout <= 0:
+            return await self.ensure_async_call(self._caller.get_dag_info, dag_id)
+        return await self.ensure_async_call(self._caller.wait_dag, dag_id, wait_timeout)
 
     async def _run_in_background(
-        self, dag_info: DagInfo, tileables: List, progress: Progress
+        self,
+        dag_info: DagInfo,
+        tileables: List,
+        progress: Progress,
+        progress_offset: float = 0.0,
+        profiling: Optional[Profiling] = None,
     ):
+        profiling = profiling if profiling is not None else Profiling()
         start_time = time.time()
         session_id = dag_info.session_id
         dag_id = dag_info.dag_id
         server_no_response_time = None
+        wait_start_counter = time.perf_counter()
+        n_polls = 0
         with enter_mode(build=True, kernel=True):
             key_to_tileables = {t.key: t for t in tileables}
             timeout_val = 0.1
@@ -426,9 +972,15 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
                     if timeout_val <= 0:
                         raise TimeoutError("Running DAG timed out")
 
+                    wait_timeout = options.client.dag_wait_timeout
+                    if self.timeout and wait_timeout:
+                        wait_timeout = min(wait_timeout, self.timeout - elapsed_time)
+
+                    call_start_time = time.time()
+                    n_polls += 1
                     try:
-                        dag_info: DagInfo = await self.ensure_async_call(
-                            self._caller.get_dag_info, dag_id
+                        dag_info: DagInfo = await self._wait_dag_info(
+                            dag_id, wait_timeout
                         )
                         server_no_response_time = None
                     except (NoTaskServerResponseError, SessionAlreadyClosedError) as ex:
@@ -457,74 +1009,377 @@ class MaxFrameSession(ToThreadMixin, IsolatedAsyncSession):
                         raise SystemError(
                             f"Cannot find DAG with ID {dag_id} in session {session_id}"
                         )
-                    progress.value = dag_info.progress
+                    progress.value = progress_offset + (1 - progress_offset) * (
+                        dag_info.progress or 0.0
+                    )
                     if dag_info.status != DagStatus.RUNNING:
                         break
-                    await asyncio.sleep(timeout_val)
+                    # services not supporting blocking waits return immediately,
+                    #  thus we back off to avoid flooding the service with requests
+                    sleep_time = timeout_val - (time.time() - call_start_time)
+                    if sleep_time > 0:
+                        await asyncio.sleep(sleep_time)
             except asyncio.CancelledError:
                 dag_info = await self.ensure_async_call(self._caller.cancel_dag, dag_id)
                 if dag_info.status != DagStatus.CANCELLED:  # pragma: no cover
                     raise
             finally:
+                profiling.add_stage(
+                    "wait",
+                    start_time,
+                    time.perf_counter() - wait_start_counter,
+                    n_polls=n_polls,
+                )
+                tileable_to_op_keys = self._dag_to_tileable_op_keys.pop(dag_id, {})
                 if dag_info.status == DagStatus.SUCCEEDED:
                     progress.value = 1.0
+                    self._submitted_tileable_to_op_keys.update(tileable_to_op_keys)
+                    self._submitted_op_keys.update(tileable_to_op_keys.values())
                 elif dag_info.status == DagStatus.FAILED:
                     dag_info.error_info.reraise()
 
             if dag_info.status in (DagStatus.RUNNING, DagStatus.CANCELLED):
                 return
 
-            for key, result_info in dag_info.tileable_to_result_infos.items():
-                t = key_to_tileables[key]
-                fetcher = get_fetcher_cls(result_info.result_type)(self._odps_entry)
-                await fetcher.update_tileable_meta(t, result_info)
-                self._tileable_to_infos[t] = result_info
+            result_infos = dag_info.tileable_to_result_infos
+            with profiling.stage("update_meta", n_tileables=len(result_infos)):
+                for key, result_info in result_infos.items():
+                    t = key_to_tileables[key]
+                    fetcher = get_fetcher_cls(result_info.result_type)(self._odps_entry)
+                    await fetcher.update_tileable_meta(t, result_info)
+                    self._tileable_to_infos[t] = result_info
+
+    @staticmethod
+    def _parse_row_filter(
+        mask: TileableType, source: TileableType
+    ) -> Optional[RowFilter]:
+        """
+        Parse boolean mask built with comparisons between columns of `source`
+        and scalars into row filters, None if not supported.
+        """
+        from maxframe.dataframe import arithmetic as arith
+        from maxframe.dataframe.arithmetic.core import DataFrameBinOp
+        from maxframe.dataframe.indexing.getitem import DataFrameIndex
+
+        compare_ops = {
+            arith.DataFrameEqual: "eq",
+            arith.DataFrameNotEqual: "ne",
+            arith.DataFrameGreater: "gt",
+            arith.DataFrameGreaterEqual: "ge",
+            arith.DataFrameLess: "lt",
+            arith.DataFrameLessEqual: "le",
+        }
+
+        op = getattr(mask, "op", None)
+        if (
+            not isinstance(op, DataFrameBinOp)
+            or op.fill_value is not None
+            or op.level is not None
+        ):
+            return None
+        if type(op) in (arith.DataFrameAnd, arith.DataFrameOr):
+            lhs_filter = MaxFrameSession._parse_row_filter(op.lhs, source)
+            rhs_filter = MaxFrameSession._parse_row_filter(op.rhs, source)
+            if lhs_filter is None or rhs_filter is None:
+                return None
+            if isinstance(op, arith.DataFrameAnd):
+                return lhs_filter & rhs_filter
+            return lhs_filter | rhs_filter
+        if type(op) not in compare_ops or not pd.api.types.is_scalar(op.rhs):
+            return None
+
+        col_op = getattr(op.lhs, "op", None)
+        if (
+            not isinstance(col_op, DataFrameIndex)
+            or col_op.col_names is None
+            or isinstance(col_op.col_names, list)
+            or op.lhs.inputs[0].key != source.key
+        ):
+            return None
+        columns = source.dtypes.index
+        if not columns.is_unique:
+            return None
+        position = columns.get_loc(col_op.col_names)
+        if not _is_filter_value_compatible(source.dtypes.iloc[position], op.rhs):
+            return None
+        return RowFilter.compare(compare_ops[type(op)], position, op.rhs)
+
+    @staticmethod
+    def _compose_columns(
+        mapping: Union[Integral, List[int]],
+        col_sel: Union[None, Integral, slice, List[int]],
+    ) -> Union[Integral, List[int]]:
+        # mapping holds positions in input for columns of current tileable
+        if col_sel is None:
+            return mapping
+        elif isinstance(mapping, Integral):  # pragma: no cover
+            raise ValueError("Cannot select columns from series")
+        elif isinstance(col_sel, Integral):
+            return mapping[col_sel]
+        elif isinstance(col_sel, slice):
+            return mapping[col_sel]
+        return [mapping[pos] for pos in col_sel]
 
     def _get_data_tileable_and_indexes(
         self, tileable: TileableType
-    ) -> Tuple[TileableType, List[Union[slice, Integral]]]:
+    ) -> Tuple[TileableType, List[Union[slice, Integral, list, RowFilter]]]:
+        """
+        Resolve executed tileable and selections on it. Slices, label-based
+        column projections and comparison filters on executed DataFrames are
+        resolved into `[row_sel, col_sel]`, where `row_sel` can be a slice,
+        an integer or a `RowFilter`, and `col_sel` can be a slice, an integer
+        or a list of column positions.
+        """
+        from maxframe.dataframe.indexing.getitem import DataFrameIndex
         from maxframe.dataframe.indexing.iloc import (
             DataFrameIlocGetItem,
             SeriesIlocGetItem,
         )
         from maxframe.tensor.indexing import TensorIndex
 
-        slice_op_types = TensorIndex, DataFrameIlocGetItem, SeriesIlocGetItem
-
         if isinstance(tileable, Entity):
             tileable = tileable.data
 
+        def raise_unsupported():
+            raise ValueError(f"Cannot fetch unexecuted tileable: {tileable!r}")
+
         indexes = None
+        row_sel = col_sel = None
         while tileable not in self._tileable_to_infos:
+            op = tileable.op
             # if tileable's op is slice, try to check input
-            if isinstance(tileable.op, slice_op_types):
-                indexes = tileable.op.indexes
+            if isinstance(op, TensorIndex):
+                indexes = op.indexes
                 tileable = tileable.inputs[0]
                 if not all(isinstance(index, (slice, Integral)) for index in indexes):
                     raise ValueError("Only support fetch data slices")
+                continue
+
+            if not isinstance(op, (DataFrameIlocGetItem, SeriesIlocGetItem)) and (
+                not isinstance(op, DataFrameIndex)
+                or not isinstance(tileable.inputs[0], DATAFRAME_TYPE)
+            ):
+                raise_unsupported()
+
+            input_tileable = tileable.inputs[0]
+            mapping = None
+            if isinstance(op, (DataFrameIlocGetItem, SeriesIlocGetItem)):
+                if not all(
+                    isinstance(index, (slice, Integral)) for index in op.indexes
+                ):
+                    raise ValueError("Only support fetch data slices")
+                op_row_sel, op_col_sel = (list(op.indexes) + [None])[:2]
+                if op_row_sel != slice(None):
+                    # rows can only be sliced once without filters
+                    if row_sel is not None:
+                        raise_unsupported()
+                    row_sel = op_row_sel
+                if op_col_sel is not None and op_col_sel != slice(None):
+                    mapping = list(range(len(input_tileable.dtypes)))[op_col_sel]
+            elif op.col_names is not None:
+                columns = input_tileable.dtypes.index
+                if not columns.is_unique:
+                    raise_unsupported()
+                if isinstance(op.col_names, list):
+                    mapping = [columns.get_loc(col) for col in op.col_names]
+                else:
+                    mapping = columns.get_loc(op.col_names)
             else:
-                raise ValueError(f"Cannot fetch unexecuted tileable: {tileable!r}")
+                # rows sliced after filters cannot be pushed down
+                row_filter = self._parse_row_filter(op.mask, input_tileable)
+                if row_filter is None or not (
+                    row_sel is None or isinstance(row_sel, RowFilter)
+                ):
+                    raise_unsupported()
+                row_sel = row_filter if row_sel is None else row_filter & row_sel
+
+            if mapping is not None:
+                col_sel = self._compose_columns(mapping, col_sel)
+                if isinstance(row_sel, RowFilter):
+                    row_sel = row_sel.remap(mapping)
+            tileable = input_tileable
+            indexes = [row_sel, col_sel]
 
         return tileable, indexes
 
+    @staticmethod
+    def _get_fetch_key(
+        data_tileable: TileableType, indexes: Optional[List[Union[slice, Integral]]]
+    ) -> tuple:
+        index_key = tuple(
+            (
+                (idx.start, idx.stop, idx.step)
+                if isinstance(idx, slice)
+                else tuple(idx)
+                if isinstance(idx, list)
+                else idx
+            )
+            for idx in indexes or ()
+        )
+        return data_tileable.key, index_key
+
+    @_apply_session_settings
     async def fetch(self, *tileables, **kwargs) -> list:
-        results = []
         tileables = [
             tileable.data if isinstance(tileable, Entity) else tileable
             for tileable in tileables
         ]
+        semaphore = asyncio.Semaphore(options.session.fetch_tileable_concurrency)
+        budget = _FetchMemoryBudget(options.session.fetch_memory_budget)
+
+        async def fetch_one(data_tileable, indexes):
+            info = self._tileable_to_infos[data_tileable]
+            fetcher = get_fetcher_cls(info.result_type)(self._odps_entry)
+            size = await budget.acquire(_estimate_fetch_size(data_tileable, indexes))
+            try:
+                async with semaphore:
+                    return await fetcher.fetch(data_tileable, info, indexes)
+            finally:
+                await budget.release(size)
+
         with enter_mode(build=True):
+            # tileables resolved into the same data are fetched only once
+            fetch_keys = []
+            fetch_indexes = []
+            key_to_args = dict()
             for tileable in tileables:
                 data_tileable, indexes = self._get_data_tileable_and_indexes(tileable)
-                info = self._tileable_to_infos[data_tileable]
-                fetcher = get_fetcher_cls(info.result_type)(self._odps_entry)
-                results.append(await fetcher.fetch(data_tileable, info, indexes))
+                fetch_key = self._get_fetch_key(data_tileable, indexes)
+                fetch_keys.append(fetch_key)
+                fetch_indexes.append(indexes)
+                key_to_args.setdefault(fetch_key, (data_tileable, indexes))
+
+            tasks = [
+                asyncio.create_task(fetch_one(*args)) for args in key_to_args.values()
+            ]
+            try:
+                fetched = await asyncio.gather(*tasks)
+            except BaseException:
+                # stop fetching other tileables once any of them fails
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        key_to_result = dict(zip(key_to_args.keys(), fetched))
+        results = []
+        returned_keys = set()
+        for tileable, fetch_key, tileable_indexes in zip(
+            tileables, fetch_keys, fetch_indexes
+        ):
+            result = key_to_result[fetch_key]
+            if fetch_key in returned_keys and callable(getattr(result, "copy", None)):
+                # avoid sharing objects between duplicated tileables
+                result = result.copy()
+            returned_keys.add(fetch_key)
+            results.append(_squeeze_fetched(tileable, tileable_indexes, result))
         return results
 
-    async def decref(self, *tileable_keys):
-        return await self.ensure_async_call(self._caller.decref, list(tileable_keys))
+    @_apply_session_settings
+    async def fetch_to_file(
+        self,
+        tileable: TileableType,
+        path: str,
+        format: str = "parquet",
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+        index: bool = True,
+        **kwargs,
+    ) -> None:
+        if isinstance(tileable, Entity):
+            tileable = tileable.data
+        with enter_mode(build=True):
+            data_tileable, indexes = self._get_data_tileable_and_indexes(tileable)
+        info = self._tileable_to_infos[data_tileable]
+        fetcher = get_fetcher_cls(info.result_type)(self._odps_entry)
+        await fetcher.fetch_to_file(
+            data_tileable,
+            info,
+            indexes,
+            path,
+            format=format,
+            partition_cols=partition_cols,
+            row_group_size=row_group_size,
+            index=index,
+        )
+
+    @_apply_session_settings
+    async def iter_fetch(
+        self,
+        tileable: TileableType,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        if isinstance(tileable, Entity):
+            tileable = tileable.data
+        with enter_mode(build=True):
+            data_tileable, indexes = self._get_data_tileable_and_indexes(tileable)
+        info = self._tileable_to_infos[data_tileable]
+        fetcher = get_fetcher_cls(info.result_type)(self._odps_entry)
+        async for batch in fetcher.iter_fetch(
+            data_tileable, info, indexes, batch_size, batch_bytes
+        ):
+            yield _squeeze_fetched(tileable, indexes, batch)
 
+    async def can_fetch_corner(self, tileable: TileableType) -> bool:
+        if isinstance(tileable, Entity):
+            tileable = tileable.data
+        with enter_mode(build=True):
+            try:
+                data_tileable, indexes = self._get_data_tileable_and_indexes(tileable)
+            except ValueError:
+                return False
+        return indexes is None and data_tileable in self._tileable_to_infos
+
+    @_apply_session_settings
+    async def fetch_corner(
+        self, tileable: TileableType, head_rows: int, tail_rows: int, **kwargs
+    ) -> Any:
+        if isinstance(tileable, Entity):
+            tileable = tileable.data
+        with enter_mode(build=True):
+            data_tileable, indexes = self._get_data_tileable_and_indexes(tileable)
+            if indexes is not None:
+                raise NotImplementedError("Cannot fetch corner of sliced tileables")
+            info = self._tileable_to_infos[data_tileable]
+            fetcher = get_fetcher_cls(info.result_type)(self._odps_entry)
+            return await fetcher.fetch_corner(data_tileable, info, head_rows, tail_rows)
+
+    def _get_result_table_names(
+        self, tileable_keys: Optional[List[str]] = None
+    ) -> List[str]:
+        key_set = set(tileable_keys) if tileable_keys is not None else None
+        return [
+            info.full_table_name
+            for t, info in list(self._tileable_to_infos.items())
+            if isinstance(info, ODPSTableResultInfo)
+            and (key_set is None or t.key in key_set)
+        ]
+
+    @_apply_session_settings
+    async def decref(self, *tileable_keys):
+        tileable_keys = list(tileable_keys)
+        invalidate_fetch_cache(tileable_keys)
+        invalidate_meta_cache(
+            self._odps_entry, self._get_result_table_names(tileable_keys)
+        )
+        for key in tileable_keys:
+            self._uploaded_volume_paths.pop(key, None)
+            # operators may be purged by the service with their outputs
+            op_key = self._submitted_tileable_to_op_keys.pop(key, None)
+            self._submitted_op_keys.discard(op_key)
+        # uploaded sources still referenced by other tileables are kept
+        released_keys = _uploaded_sources.release(self.session_id, tileable_keys)
+        if not released_keys:
+            return
+        return await self.ensure_async_call(self._caller.decref, released_keys)
+
+    @_apply_session_settings
     async def destroy(self):
+        _uploaded_sources.invalidate(self.session_id)
+        invalidate_fetch_cache([t.key for t in list(self._tileable_to_infos.keys())])
+        invalidate_meta_cache(self._odps_entry, self._get_result_table_names())
         await self.ensure_async_call(self._caller.delete_session)
         await super().destroy()
 
@@ -614,14 +1469,22 @@ class MaxFrameRestCaller(MaxFrameServiceCaller):
         dag: TileableGraph,
         managed_input_infos: Dict[str, ResultInfo] = None,
         new_settings: Dict[str, Any] = None,
+        profiling: Optional[Profiling] = None,
     ) -> DagInfo:
         return await self._client.submit_dag(
-            self._session_id, dag, managed_input_infos, new_settings=new_settings
+            self._session_id,
+            dag,
+            managed_input_infos,
+            new_settings=new_settings,
+            profiling=profiling,
         )
 
     async def get_dag_info(self, dag_id: str) -> DagInfo:
         return await self._client.get_dag_info(self._session_id, dag_id)
 
+    async def wait_dag(self, dag_id: str, timeout: float) -> DagInfo:
+        return await self._client.wait_dag(self._session_id, dag_id, timeout)
+
     async def cancel_dag(self, dag_id: str) -> DagInfo:
         return await self._client.cancel_dag(self._session_id, dag_id)
 
@@ -0,0 +1,241 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from odps import ODPS
+
+from maxframe.config import option_context, options
+from maxframe.session import SyncSession, new_session
+
+logger = logging.getLogger(__name__)
+
+# idle sessions are reaped before being closed by the service
+_IDLE_REAP_RATIO = 0.9
+# seconds to wait before retrying when creating sessions fails
+_CREATE_RETRY_INTERVAL = 10
+_MAINTAIN_INTERVAL = 5
+
+
+class SessionPool:
+    """
+    Pool of MaxFrame sessions created in advance in background, thus
+    startup latency of sessions can be hidden. Sessions can be acquired
+    with `SessionPool.acquire` or `new_session(pool=pool)`.
+
+    Parameters
+    ----------
+    address : Union[str, ODPS], optional
+        Address of the service, the same as `new_session`.
+    odps_entry : ODPS, optional
+        ODPS entry to create sessions.
+    size : int
+        Number of sessions kept ready in the pool.
+    settings : dict, optional
+        Options applied when creating and using sessions.
+    kwargs
+        Other arguments passed to `new_session`.
+    """
+
+    def __init__(
+        self,
+        address: Union[str, ODPS] = None,
+        odps_entry: Optional[ODPS] = None,
+        size: int = 1,
+        settings: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        if size <= 0:
+            raise ValueError("Size of session pool should be positive")
+        self._address = address
+        self._odps_entry = odps_entry
+        self._size = size
+        self._settings = settings or dict()
+        self._kwargs = kwargs
+        # options when creating pools are also applied to sessions
+        self._context = contextvars.copy_context()
+        with option_context(self._settings):
+            self._max_idle_seconds = options.session.max_idle_seconds
+
+        self._lock = threading.Condition()
+        self._idle_sessions: Deque[Tuple[SyncSession, float]] = deque()
+        self._n_creating = 0
+        self._retry_time = 0
+        self._closed = False
+
+        self._create_pool = concurrent.futures.ThreadPoolExecutor(
+            size, thread_name_prefix="SessionPoolCreate"
+        )
+        self._refill()
+        self._maintain_thread = threading.Thread(
+            target=self._maintain_thread_body, name="SessionPoolMaintain"
+        )
+        self._maintain_thread.daemon = True
+        self._maintain_thread.start()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def n_idle(self) -> int:
+        return len(self._idle_sessions)
+
+    def _create_session(self) -> SyncSession:
+        def create():
+            with option_context(self._settings):
+                # settings are also applied whenever sessions are used
+                return new_session(
+                    self._address,
+                    odps_entry=self._odps_entry,
+                    default=False,
+                    session_settings=self._settings,
+                    **self._kwargs,
+                )
+
+        return self._context.copy().run(create)
+
+    def _create_idle_session(self):
+        try:
+            session = self._create_session()
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Failed to create session in pool: %s", ex)
+            session = None
+
+        destroy = False
+        with self._lock:
+            self._n_creating -= 1
+            if session is None:
+                self._retry_time = time.time() + _CREATE_RETRY_INTERVAL
+            elif self._closed:
+                destroy = True
+            else:
+                self._idle_sessions.append((session, time.time()))
+            self._lock.notify_all()
+        if destroy:
+            self._destroy_session(session)
+
+    @staticmethod
+    def _destroy_session(session: SyncSession):
+        try:
+            session.destroy()
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Failed to destroy session %s: %s", session.session_id, ex)
+
+    def _is_session_expired(self, idle_since: float) -> bool:
+        if not self._max_idle_seconds or self._max_idle_seconds <= 0:
+            return False
+        idle_seconds = time.time() - idle_since
+        return idle_seconds > self._max_idle_seconds * _IDLE_REAP_RATIO
+
+    def _reap_idle_sessions(self):
+        with self._lock:
+            expired = [s for s, t in self._idle_sessions if self._is_session_expired(t)]
+            self._idle_sessions = deque(
+                (s, t)
+                for s, t in self._idle_sessions
+                if not self._is_session_expired(t)
+            )
+        for session in expired:
+            logger.info("Reaping idle session %s in pool", session.session_id)
+            self._destroy_session(session)
+
+    def _refill(self):
+        with self._lock:
+            if self._closed or time.time() < self._retry_time:
+                return
+            n_to_create = self._size - len(self._idle_sessions) - self._n_creating
+            self._n_creating += max(n_to_create, 0)
+        for _ in range(n_to_create):
+            self._create_pool.submit(self._create_idle_session)
+
+    def _maintain_thread_body(self):
+        while not self._closed:
+            self._reap_idle_sessions()
+            self._refill()
+            with self._lock:
+                if not self._closed:
+                    self._lock.wait(_MAINTAIN_INTERVAL)
+
+    def _pop_idle_session(self, timeout: Optional[float]) -> Optional[SyncSession]:
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._lock:
+            # wake up the maintain thread to refill
+            self._lock.notify_all()
+            while not self._idle_sessions and self._n_creating:
+                wait_time = deadline - time.time() if deadline is not None else None
+                if wait_time is not None and wait_time <= 0:
+                    break
+                self._lock.wait(wait_time)
+            if not self._idle_sessions:
+                return None
+            session, idle_since = self._idle_sessions.popleft()
+            self._lock.notify_all()
+
+        if self._is_session_expired(idle_since) or session._isolated_session.closed:
+            self._destroy_session(session)
+            return self._pop_idle_session(0)
+        return session
+
+    def acquire(self, default: bool = True, timeout: Optional[float] = None):
+        """
+        Get a ready session from the pool. A new session is created if
+        no ready sessions are available.
+
+        Parameters
+        ----------
+        default : bool
+            If True, the session will be set as the default session.
+        timeout : float, optional
+            Seconds to wait for sessions being created in the pool before
+            creating a new session, None means waiting until creation finishes.
+
+        Returns
+        -------
+        session : SyncSession
+        """
+        if self._closed:
+            raise RuntimeError("Session pool already closed")
+        session = self._pop_idle_session(timeout)
+        if session is None:
+            session = self._create_session()
+        if default:
+            session.as_default()
+        return session
+
+    def close(self):
+        """
+        Close the pool and destroy all idle sessions.
+        """
+        with self._lock:
+            self._closed = True
+            sessions = [s for s, _ in self._idle_sessions]
+            self._idle_sessions.clear()
+            self._lock.notify_all()
+        self._maintain_thread.join()
+        self._create_pool.shutdown(wait=True)
+        for session in sessions:
+            self._destroy_session(session)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
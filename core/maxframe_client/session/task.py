@@ -16,6 +16,7 @@ import base64
 import json
 import logging
 import time
+import uuid
 from typing import Any, Dict, List, Optional, Type, Union
 
 import msgpack
@@ -27,8 +28,17 @@ from odps.models import Instance, MaxFrameTask
 from maxframe.config import options
 from maxframe.core import TileableGraph
 from maxframe.errors import NoTaskServerResponseError, SessionAlreadyClosedError
+from maxframe.io.odpsio import ODPSVolumeWriter
+from maxframe.lib.compression import compress_bytes
 from maxframe.protocol import DagInfo, JsonSerializable, ResultInfo, SessionInfo
-from maxframe.utils import deserialize_serializable, serialize_serializable, to_str
+from maxframe.session import Profiling
+from maxframe.utils import (
+    build_session_volume_name,
+    deserialize_serializable,
+    serialize_serializable,
+    serialize_serializable_frames,
+    to_str,
+)
 
 try:
     from maxframe import __version__ as mf_version
@@ -55,6 +65,9 @@ from .odps import MaxFrameServiceCaller, MaxFrameSession
 
 logger = logging.getLogger(__name__)
 
+# directory in session volume to stage serialized DAGs
+_DAG_VOLUME_DIR = "submitted_dags"
+
 
 class MaxFrameInstanceCaller(MaxFrameServiceCaller):
     _instance: Optional[Instance]
@@ -84,6 +97,7 @@ class MaxFrameInstanceCaller(MaxFrameServiceCaller):
         self._running_cluster = running_cluster
         self._major_version = major_version
         self._output_format = output_format or MAXFRAME_OUTPUT_MSGPACK_FORMAT
+        self._replace_internal_host = kwargs.get("replace_internal_host", True)
         self._deleted = False
 
         if nested_instance_id is None:
@@ -223,22 +237,60 @@ class MaxFrameInstanceCaller(MaxFrameServiceCaller):
         dag: TileableGraph,
         managed_input_infos: Optional[Dict[str, ResultInfo]] = None,
         new_settings: Dict[str, Any] = None,
+        profiling: Optional[Profiling] = None,
     ) -> DagInfo:
         new_settings_value = {
             "odps.maxframe.settings": json.dumps(new_settings),
         }
         req_data = {
             "protocol": MAXFRAME_DEFAULT_PROTOCOL,
-            "dag": base64.b64encode(serialize_serializable(dag)).decode(),
             "managed_input_infos": base64.b64encode(
                 serialize_serializable(managed_input_infos)
             ).decode(),
             "new_settings": json.dumps(new_settings_value),
             "output_format": self._output_format,
         }
+        profiling = profiling if profiling is not None else Profiling()
+        with profiling.stage("serialize") as stage_attrs:
+            dag_frames = serialize_serializable_frames(dag)
+            stage_attrs["bytes"] = sum(frame.nbytes for frame in dag_frames)
+        req_data.update(self._build_dag_req_data(dag_frames))
         res = self._put_task_info(MAXFRAME_TASK_SUBMIT_DAG_METHOD, req_data)
         return self._deserial_task_info_result(res, DagInfo)
 
+    def _build_dag_req_data(self, dag_frames: List[memoryview]) -> Dict[str, Any]:
+        """
+        Encode serialized DAG frames for task info calls. The DAG is compressed
+        if `client.dag_compression` is specified, and staged in the volume
+        of the session when its size exceeds `client.dag_volume_threshold`.
+        Uncompressed frames are written into the volume without joining.
+        """
+        req_data = dict()
+        compression = options.client.dag_compression
+        if compression:
+            dag_frames = [memoryview(compress_bytes(b"".join(dag_frames), compression))]
+            req_data["dag_compression"] = compression
+
+        dag_size = sum(frame.nbytes for frame in dag_frames)
+        volume_threshold = options.client.dag_volume_threshold
+        if volume_threshold is None or dag_size <= volume_threshold:
+            req_data["dag"] = base64.b64encode(b"".join(dag_frames)).decode()
+            return req_data
+
+        file_name = uuid.uuid4().hex
+        writer = ODPSVolumeWriter(
+            self._odps_entry,
+            build_session_volume_name(self._instance.id),
+            _DAG_VOLUME_DIR,
+            replace_internal_host=self._replace_internal_host,
+        )
+        writer.write_file(file_name, (frame for frame in dag_frames))
+        logger.debug(
+            "Staged DAG of %d bytes as %s/%s", dag_size, _DAG_VOLUME_DIR, file_name
+        )
+        req_data["dag_volume_path"] = f"{_DAG_VOLUME_DIR}/{file_name}"
+        return req_data
+
     def get_dag_info(self, dag_id: str) -> DagInfo:
         req_data = {
             "protocol": MAXFRAME_DEFAULT_PROTOCOL,
@@ -248,6 +300,17 @@ class MaxFrameInstanceCaller(MaxFrameServiceCaller):
         res = self._put_task_info(MAXFRAME_TASK_GET_DAG_INFO_METHOD, req_data)
         return self._deserial_task_info_result(res, DagInfo)
 
+    def wait_dag(self, dag_id: str, timeout: float) -> DagInfo:
+        req_data = {
+            "protocol": MAXFRAME_DEFAULT_PROTOCOL,
+            "dag_id": dag_id,
+            "wait": True,
+            "timeout": timeout,
+            "output_format": self._output_format,
+        }
+        res = self._put_task_info(MAXFRAME_TASK_GET_DAG_INFO_METHOD, req_data)
+        return self._deserial_task_info_result(res, DagInfo)
+
     def cancel_dag(self, dag_id: str) -> DagInfo:
         req_data = {
             "protocol": MAXFRAME_DEFAULT_PROTOCOL,
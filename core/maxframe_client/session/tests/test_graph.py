@@ -0,0 +1,58 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+
+import maxframe.dataframe as md
+from maxframe.core.operator import Fetch, SubmittedOperatorRef
+from maxframe.utils import serialize_serializable
+
+from ..graph import gen_submit_tileable_graph, replace_submitted_operators
+
+
+def test_replace_submitted_operators():
+    session = object()
+    pd_df = pd.DataFrame(np.random.rand(10, 3), columns=list("ABC"))
+    df = md.DataFrame(pd_df)
+    df2 = df + 1
+    df3 = df2 * 2
+
+    graph, _ = gen_submit_tileable_graph(session, [df3.data])
+    assert replace_submitted_operators(graph, set()) == []
+    submitted_op_keys = {t.op.key for t in graph if not isinstance(t.op, Fetch)}
+
+    df4 = df2 - 1
+    tileable_to_copied = dict()
+    graph, _ = gen_submit_tileable_graph(session, [df4.data], tileable_to_copied)
+    copied_src = tileable_to_copied[df.data]
+    ref_op_keys = replace_submitted_operators(
+        graph, submitted_op_keys, excluded={copied_src}
+    )
+    assert ref_op_keys == [df2.op.key]
+
+    copied_df2 = tileable_to_copied[df2.data]
+    assert isinstance(copied_df2.op, SubmittedOperatorRef)
+    assert copied_df2.op.key == df2.op.key
+    assert copied_df2.op.inputs == [copied_src]
+    assert copied_df2.op.outputs == [copied_df2]
+    assert copied_df2.shape == df2.shape
+    pd.testing.assert_series_equal(copied_df2.dtypes, df2.dtypes)
+    assert not isinstance(copied_src.op, SubmittedOperatorRef)
+    assert not isinstance(tileable_to_copied[df4.data].op, SubmittedOperatorRef)
+
+    # original tileables are not modified
+    assert not isinstance(df2.op, SubmittedOperatorRef)
+
+    assert serialize_serializable(graph)
@@ -0,0 +1,136 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import mock
+import numpy as np
+import pytest
+
+import maxframe.tensor as mt
+from maxframe.config import options
+
+from ...tests.local_framedriver import (
+    LocalFrameDriver,
+    local_storage,
+    new_local_odps_entry,
+)
+from .. import pool as pool_mod
+from ..pool import SessionPool
+
+
+class MockSession:
+    def __init__(self, session_id: str, settings: dict):
+        self.session_id = session_id
+        self.settings = settings
+        self.destroyed = False
+        self.is_default = False
+        self._isolated_session = mock.Mock(closed=False)
+
+    def destroy(self):
+        self.destroyed = True
+
+    def as_default(self):
+        self.is_default = True
+        return self
+
+
+@pytest.fixture
+def mock_new_session():
+    created = []
+    lock = threading.Lock()
+
+    def new_session(address=None, odps_entry=None, default=True, **kwargs):
+        assert default is False
+        time.sleep(0.1)
+        with lock:
+            session = MockSession(
+                f"session_{len(created)}",
+                {"quota_name": options.session.quota_name, **kwargs},
+            )
+            created.append(session)
+        return session
+
+    with mock.patch.object(pool_mod, "new_session", new=new_session):
+        yield created
+
+
+def test_session_pool(mock_new_session):
+    created = mock_new_session
+    with SessionPool(
+        size=2, settings={"session.quota_name": "test_quota"}, extra_arg=1
+    ) as pool:
+        session = pool.acquire()
+        assert session.is_default
+        assert session.settings == {
+            "quota_name": "test_quota",
+            "session_settings": {"session.quota_name": "test_quota"},
+            "extra_arg": 1,
+        }
+
+        session2 = pool.acquire(default=False)
+        assert not session2.is_default
+        assert session2 is not session
+
+        # pool is refilled in background
+        start_time = time.time()
+        while pool.n_idle < 2 and time.time() - start_time < 5:
+            time.sleep(0.05)
+        assert pool.n_idle == 2
+        assert len(created) == 4
+
+        # closed sessions are not handed out
+        idle_sessions = [s for s, _ in pool._idle_sessions]
+        idle_sessions[0]._isolated_session.closed = True
+        session3 = pool.acquire(timeout=5)
+        assert session3 is idle_sessions[1]
+        assert idle_sessions[0].destroyed
+
+    assert all(s.destroyed for s in created if s not in (session, session2, session3))
+    assert not any(s.destroyed for s in (session, session2, session3))
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+
+def test_session_pool_reap_idle(mock_new_session):
+    created = mock_new_session
+    with mock.patch.object(pool_mod, "_MAINTAIN_INTERVAL", 0.1):
+        with SessionPool(size=1, settings={"session.max_idle_seconds": 0.5}) as pool:
+            time.sleep(1.5)
+            # expired sessions are reaped and refilled
+            assert len(created) > 1
+            assert created[0].destroyed
+            assert not pool.acquire().destroyed
+
+
+def test_session_pool_with_service(tmp_path):
+    settings = {"session.quota_name": "pool_quota"}
+    with LocalFrameDriver() as driver, local_storage(str(tmp_path)):
+        with SessionPool(
+            driver.address, odps_entry=new_local_odps_entry(), settings=settings
+        ) as pool:
+            session = pool.acquire(default=False, timeout=10)
+        try:
+            isolated_session = session._isolated_session
+            assert isolated_session._last_settings["session.quota_name"] == "pool_quota"
+
+            # settings of the pool are applied when the session is used,
+            #  otherwise quota is regarded as changed and an error is raised
+            assert options.session.quota_name is None
+            (mt.tensor(np.arange(10)) + 1).execute(session=session)
+            assert driver.request_counts["submit_dag"] == 1
+        finally:
+            session.destroy()
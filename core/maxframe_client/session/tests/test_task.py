@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
 import json
 import os
 
@@ -23,8 +24,17 @@ from odps import options as odps_options
 
 from maxframe import options
 from maxframe.config import option_context
-
-from ...session.consts import MAXFRAME_OUTPUT_JSON_FORMAT
+from maxframe.core import TileableGraph
+from maxframe.lib.compression import decompress_bytes
+from maxframe.protocol import DagInfo, DagStatus
+from maxframe.session import Profiling
+from maxframe.utils import build_session_volume_name, serialize_serializable
+
+from ...session.consts import (
+    MAXFRAME_OUTPUT_JSON_FORMAT,
+    MAXFRAME_TASK_GET_DAG_INFO_METHOD,
+    MAXFRAME_TASK_SUBMIT_DAG_METHOD,
+)
 from ...session.task import MaxFrameInstanceCaller, MaxFrameTask, MaxFrameTaskSession
 
 expected_file_dir = os.path.join(os.path.dirname(__file__), "expected-data")
@@ -113,3 +123,97 @@ async def test_session_quota_flag_valid():
                 mf_task_session._get_diff_settings()
             options.sql.settings["odps.task.wlm.quota"] = "session_quota"
             mf_task_session._get_diff_settings()
+
+
+def test_maxframe_instance_caller_wait_dag():
+    caller = MaxFrameInstanceCaller(
+        odps_entry=ODPS.from_environments(),
+        task_name="task_test",
+        output_format=MAXFRAME_OUTPUT_JSON_FORMAT,
+    )
+    dag_info = DagInfo(
+        session_id="session_id",
+        dag_id="dag_id",
+        status=DagStatus.SUCCEEDED,
+        progress=1.0,
+    )
+
+    def mock_put_task_info(self, method_name: str, json_data: dict):
+        assert method_name == MAXFRAME_TASK_GET_DAG_INFO_METHOD
+        assert json_data["dag_id"] == "dag_id"
+        assert json_data["wait"] is True
+        assert json_data["timeout"] == 5
+        result = json.dumps(dag_info.to_json()).encode()
+        return json.dumps({"result": base64.b64encode(result).decode()})
+
+    with mock.patch(
+        "maxframe_client.session.task.MaxFrameInstanceCaller._put_task_info",
+        new=mock_put_task_info,
+    ):
+        info = caller.wait_dag("dag_id", 5)
+    assert info.dag_id == "dag_id"
+    assert info.status == DagStatus.SUCCEEDED
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+@pytest.mark.parametrize("volume_threshold", [None, 0])
+def test_maxframe_instance_caller_submit_dag(compression, volume_threshold):
+    if compression:
+        pytest.importorskip({"lz4": "lz4", "zstd": "zstandard"}[compression])
+
+    caller = MaxFrameInstanceCaller(
+        odps_entry=ODPS.from_environments(),
+        task_name="task_test",
+        output_format=MAXFRAME_OUTPUT_JSON_FORMAT,
+    )
+    caller._instance = mock.MagicMock(id="instance_id")
+    dag = TileableGraph()
+    dag_info = DagInfo(
+        session_id="session_id", dag_id="dag_id", status=DagStatus.RUNNING
+    )
+    vol_name = build_session_volume_name("instance_id")
+    staged = dict()
+
+    class MockVolumeWriter:
+        def __init__(self, odps_entry, volume_name, volume_dir, **kwargs):
+            self._volume_name = volume_name
+            self._volume_dir = volume_dir
+
+        def write_file(self, file_name, data):
+            if not isinstance(data, bytes):
+                data = b"".join(data)
+            staged[f"{self._volume_name}/{self._volume_dir}/{file_name}"] = data
+
+    def mock_put_task_info(self, method_name: str, json_data: dict):
+        assert method_name == MAXFRAME_TASK_SUBMIT_DAG_METHOD
+        assert json_data.get("dag_compression") == compression
+        if volume_threshold is None:
+            assert "dag_volume_path" not in json_data
+            data = base64.b64decode(json_data["dag"])
+        else:
+            assert "dag" not in json_data
+            data = staged[f"{vol_name}/{json_data['dag_volume_path']}"]
+        if compression:
+            data = decompress_bytes(data, compression)
+        assert data == serialize_serializable(dag)
+
+        result = json.dumps(dag_info.to_json()).encode()
+        return json.dumps({"result": base64.b64encode(result).decode()})
+
+    with mock.patch(
+        "maxframe_client.session.task.MaxFrameInstanceCaller._put_task_info",
+        new=mock_put_task_info,
+    ), mock.patch(
+        "maxframe_client.session.task.ODPSVolumeWriter", new=MockVolumeWriter
+    ), option_context(
+        {
+            "client.dag_compression": compression,
+            "client.dag_volume_threshold": volume_threshold,
+        }
+    ):
+        profiling = Profiling()
+        info = caller.submit_dag(dag, {}, {}, profiling=profiling)
+    assert info.dag_id == "dag_id"
+    assert len(staged) == (0 if volume_threshold is None else 1)
+    assert [stage["name"] for stage in profiling.result["stages"]] == ["serialize"]
+    assert profiling.result["stages"][0]["bytes"] == len(serialize_serializable(dag))
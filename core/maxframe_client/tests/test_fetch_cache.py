@@ -0,0 +1,98 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pyarrow as pa
+
+from maxframe.config import option_context
+
+from ..fetch_cache import FetchResultCache, get_fetch_cache, invalidate_fetch_cache
+
+
+def _gen_table(n_rows: int) -> pa.Table:
+    return pa.table({"a": np.arange(n_rows), "b": np.random.rand(n_rows)})
+
+
+def test_fetch_result_cache(tmp_path):
+    table = _gen_table(1000)
+    cache = FetchResultCache(str(tmp_path), 10 * table.nbytes)
+    try:
+        key1 = cache.build_key("table1", None, {"start": 0, "stop": 1000})
+        key2 = cache.build_key("table1", None, {"stop": 1000, "start": 0})
+        assert key1 == key2
+        assert key1 != cache.build_key("table1", ["pt=1"], {"start": 0})
+        assert cache.get(key1) is None
+
+        cache.put(key1, "tileable1", table)
+        assert len(cache) == 1
+        assert cache.get(key1).equals(table)
+        # file may be removed outside
+        os.unlink(os.path.join(cache.cache_dir, key1 + ".arrow"))
+        assert cache.get(key1) is None
+        assert len(cache) == 0 and cache.total_size == 0
+
+        # least recently used items are evicted
+        keys = [cache.build_key(f"table{i}", None, {}) for i in range(12)]
+        for idx, key in enumerate(keys[:9]):
+            cache.put(key, f"tileable{idx}", table)
+        assert cache.get(keys[0]) is not None
+        for idx, key in enumerate(keys[9:]):
+            cache.put(key, f"tileable{idx + 9}", table)
+        assert cache.total_size <= cache.max_size
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[-1]) is not None
+        assert len(os.listdir(cache.cache_dir)) == len(cache)
+
+        # tables larger than the cache is not stored
+        cache.put(keys[0], "tileable0", _gen_table(20000))
+        assert cache.get(keys[0]).equals(table)
+
+        cache.invalidate(["tileable0", "tileable11"])
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) is None
+        cache.invalidate()
+        assert len(cache) == 0
+        assert not os.listdir(cache.cache_dir)
+    finally:
+        cache.close()
+    assert not os.path.exists(cache.cache_dir)
+
+
+def test_get_fetch_cache(tmp_path):
+    assert get_fetch_cache() is None
+    with option_context(
+        {
+            "session.enable_fetch_cache": True,
+            "session.fetch_cache_dir": str(tmp_path),
+        }
+    ):
+        cache = get_fetch_cache()
+        assert cache is get_fetch_cache()
+        assert os.path.dirname(cache.cache_dir) == str(tmp_path)
+        table = pa.table({"a": [1, 2, 3]})
+        cache.put("key", "tileable_key", table)
+        with option_context({"session.fetch_cache_size": 1024}):
+            new_cache = get_fetch_cache()
+            assert new_cache is not cache and new_cache.max_size == 1024
+            new_cache.put("key", "tileable_key", table)
+        # caches with different settings do not affect each other
+        assert get_fetch_cache() is cache
+        assert cache.get("key") == table
+
+        invalidate_fetch_cache(["tileable_key"])
+        assert cache.get("key") is None
+        assert new_cache.get("key") is None
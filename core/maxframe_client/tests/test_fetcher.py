@@ -14,6 +14,7 @@
 
 import uuid
 
+import mock
 import numpy as np
 import pandas as pd
 import pyarrow as pa
@@ -21,12 +22,15 @@ import pytest
 from odps import ODPS
 
 import maxframe.dataframe as md
+import maxframe.tensor as mt
 from maxframe.config import options
-from maxframe.io.odpsio import ODPSTableIO
+from maxframe.core import ObjectData
+from maxframe.io.odpsio import ODPSTableIO, pandas_to_arrow
 from maxframe.protocol import ODPSTableResultInfo, ResultType
 from maxframe.tests.utils import tn
 
-from ..fetcher import ODPSTableFetcher
+from ..fetcher import ODPSTableFetcher, ResultFetcher, RowFilter
+from .local_framedriver import LocalTableIO, local_storage
 
 
 @pytest.fixture
@@ -105,3 +109,130 @@ async def test_table_fetcher(switch_table_io):
     pd.testing.assert_frame_equal(raw_data.iloc[-1:-6:-1, :1], fetched)
 
     odps_entry.delete_table(table_name, if_exists=True)
+
+
+async def test_table_fetcher_iter_fetch(tmp_path):
+    data = pd.DataFrame(np.random.rand(1000, 3), columns=list("abc"))
+    tileable = md.read_pandas(data)
+    with local_storage(str(tmp_path)):
+        table_name = "mf_test_iter_fetch_table"
+        table_io = LocalTableIO(None, str(tmp_path))
+        with table_io.open_writer(table_name) as writer:
+            for start in range(0, 1000, 128):
+                writer.write(pandas_to_arrow(data.iloc[start : start + 128])[0])
+
+        fetcher = ODPSTableFetcher(None)
+        result_info = ODPSTableResultInfo(
+            ResultType.ODPS_TABLE, full_table_name=table_name
+        )
+
+        batches = [
+            b
+            async for b in fetcher.iter_fetch(
+                tileable, result_info, [None, None], batch_size=300
+            )
+        ]
+        assert [len(b) for b in batches] == [300, 300, 300, 100]
+        pd.testing.assert_frame_equal(pd.concat(batches), data)
+
+        batch_bytes = 128 * 4 * 8 * 2
+        batches = [
+            b
+            async for b in fetcher.iter_fetch(
+                tileable, result_info, [None, None], batch_bytes=batch_bytes
+            )
+        ]
+        assert [len(b) for b in batches] == [256] * 3 + [232]
+        pd.testing.assert_frame_equal(pd.concat(batches), data)
+
+        batches = [
+            b
+            async for b in fetcher.iter_fetch(
+                tileable, result_info, [slice(10, 500, 3), None], batch_size=100
+            )
+        ]
+        pd.testing.assert_frame_equal(pd.concat(batches), data.iloc[10:500:3])
+
+        # closing iterators early shall not block
+        batch_iter = fetcher.iter_fetch(
+            tileable, result_info, [slice(100, None), None], batch_size=10
+        )
+        pd.testing.assert_frame_equal(await batch_iter.__anext__(), data.iloc[100:110])
+        await batch_iter.aclose()
+
+
+class _InMemoryFetcher(ResultFetcher):
+    def __init__(self, data):
+        super().__init__(None)
+        self._data = data
+
+    async def update_tileable_meta(self, tileable, info):
+        return
+
+    async def fetch(self, tileable, info, indexes):
+        if not indexes:
+            return self._data
+        return self._data[indexes[0]]
+
+
+@pytest.mark.parametrize(
+    "tileable, data",
+    [
+        (md.Series(np.arange(20)), pd.Series(np.arange(20))),
+        (md.Index(np.arange(20)), pd.Index(np.arange(20))),
+        (mt.arange(20), np.arange(20)),
+        (ObjectData(), {"a": 1}),
+    ],
+)
+async def test_default_fetch_corner(tileable, data):
+    fetcher = _InMemoryFetcher(data)
+    if hasattr(tileable, "data"):
+        tileable = tileable.data
+    corner = await fetcher.fetch_corner(tileable, None, 3, 2)
+    if isinstance(data, dict):
+        assert corner == data
+    elif isinstance(data, np.ndarray):
+        np.testing.assert_array_equal(corner, [0, 1, 2, 18, 19])
+    else:
+        assert list(corner) == [0, 1, 2, 18, 19]
+
+
+def test_row_filter():
+    table = pa.table({"a": [1.0, None, 3.0, 4.0], "b": ["x", "y", None, "x"]})
+
+    row_filter = RowFilter.compare("gt", 0, np.float64(1.5)) | RowFilter.compare(
+        "ne", 1, "x"
+    )
+    assert row_filter.columns == [0, 1]
+    assert row_filter == RowFilter.compare("gt", 0, 1.5) | RowFilter.compare(
+        "ne", 1, "x"
+    )
+    assert len({row_filter, row_filter.remap([0, 1])}) == 1
+
+    row_filter = row_filter.remap(["a", "b"])
+    assert row_filter.columns == ["a", "b"]
+    # nulls only satisfy `!=` as NaN in pandas
+    assert table.filter(row_filter.to_mask(table))["a"].to_pylist() == [None, 3.0, 4.0]
+
+    row_filter = RowFilter.compare("le", "a", 3) & RowFilter.compare("eq", "b", "x")
+    assert table.filter(row_filter.to_mask(table))["a"].to_pylist() == [1.0]
+
+    # columns not stored as strings are compared as pandas objects
+    table = pa.table(
+        {
+            "s": pa.array(["x", "y", None], type=pa.large_string()),
+            "c": pa.array([b"x", b"y", None]),
+            "l": pa.array([[1], [2], None]),
+        }
+    )
+    # arrow compute functions shall not be called
+    compare_funcs = {
+        op: mock.Mock(side_effect=AssertionError) for op in RowFilter._compare_funcs
+    }
+    with mock.patch.object(RowFilter, "_compare_funcs", compare_funcs):
+        row_filter = RowFilter.compare("eq", "c", "x")
+        assert table.filter(row_filter.to_mask(table))["s"].to_pylist() == []
+        row_filter = RowFilter.compare("ne", "l", "x")
+        assert table.filter(row_filter.to_mask(table.to_batches()[0])).num_rows == 3
+    row_filter = RowFilter.compare("eq", "s", "x")
+    assert table.filter(row_filter.to_mask(table))["c"].to_pylist() == [b"x"]
@@ -0,0 +1,472 @@
+# Copyright 1999-2025 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+
+import mock
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import maxframe.dataframe as md
+import maxframe.tensor as mt
+from maxframe.config import option_context
+from maxframe.dataframe.utils import fetch_corner_data
+from maxframe.io.odpsio import pandas_to_odps_schema
+from maxframe.io.odpsio.metacache import get_meta_cache
+from maxframe.session import SyncSession, new_session
+
+from ..fetch_cache import get_fetch_cache
+from ..fetcher import ODPSTableFetcher
+from ..session.odps import MaxFrameSession
+from .local_framedriver import (
+    LocalFrameDriver,
+    LocalTableIO,
+    local_storage,
+    new_local_odps_entry,
+)
+
+
+@pytest.fixture
+def local_service(tmp_path):
+    with LocalFrameDriver(dag_delay=0.2) as driver, local_storage(str(tmp_path)):
+        session = new_session(
+            driver.address, odps_entry=new_local_odps_entry(), default=False
+        )
+        try:
+            yield driver, session, str(tmp_path)
+        finally:
+            session.destroy()
+
+
+def test_local_framedriver_execute_and_fetch(local_service):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(20, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(20, 4), columns=list("abcd"))
+    driver.stage_dataframe_result(df, expected, root_dir)
+
+    df.execute(session=session)
+    assert driver.request_counts["submit_dag"] == 1
+    assert driver.request_counts["wait_dag"] >= 1
+    assert driver.request_bytes["submit_dag"] > 0
+
+    pd.testing.assert_frame_equal(df.fetch(session=session), expected)
+    pd.testing.assert_frame_equal(
+        df.iloc[2:15:3].fetch(session=session), expected.iloc[2:15:3]
+    )
+    pd.testing.assert_frame_equal(
+        df.iloc[10::-2].fetch(session=session), expected.iloc[10::-2]
+    )
+
+
+def test_local_framedriver_upload_sources(local_service):
+    _driver, session, root_dir = local_service
+
+    t = mt.tensor(np.arange(10)) + 1
+    t.execute(session=session)
+
+    vol_root = os.path.join(root_dir, "volumes")
+    (vol_name,) = os.listdir(vol_root)
+    assert os.listdir(os.path.join(vol_root, vol_name))
+
+
+def test_local_framedriver_upload_error(local_service):
+    driver, session, _root_dir = local_service
+
+    t = mt.tensor(np.arange(10)) + 1
+    with mock.patch.object(
+        MaxFrameSession,
+        "_upload_and_get_vol_read_tileable",
+        side_effect=SystemError("upload failed"),
+    ):
+        # upload errors are raised before execution info is returned
+        with pytest.raises(SystemError, match="upload failed"):
+            t.execute(session=session, wait=False)
+    assert "submit_dag" not in driver.request_counts
+
+    t.execute(session=session)
+    assert driver.request_counts["submit_dag"] == 1
+
+
+def test_local_framedriver_reuse_uploaded_sources(local_service):
+    driver, session, root_dir = local_service
+
+    data = np.arange(10)
+    t1 = mt.tensor(data)
+    # identical data with different keys
+    t2 = mt.tensor(data.copy(), chunk_size=5)
+    assert t1.key != t2.key
+
+    (t1 + 1).execute(session=session)
+    (t2 * 2).execute(session=session)
+    vol_root = os.path.join(root_dir, "volumes")
+    (vol_name,) = os.listdir(vol_root)
+    assert os.listdir(os.path.join(vol_root, vol_name)) == [t1.key]
+
+    # decref of the uploading tileable is held as t2 still reuses the data
+    session.decref(t1.key)
+    assert not driver.is_decref_requested(t1.key)
+    (t2 - 1).execute(session=session)
+    assert driver.request_counts["submit_dag"] == 3
+
+    session.decref(t2.key)
+    assert driver.is_decref_requested(t1.key)
+    assert driver.is_decref_requested(t2.key)
+
+
+def test_local_framedriver_reupload_table_meta(local_service):
+    driver, session, root_dir = local_service
+    isolated_session = session._isolated_session
+    odps_entry = isolated_session._odps_entry
+    tables = dict()
+
+    def create_table(name, schema, **_):
+        table = mock.Mock(full_table_name=f"local_project.{name}", table_schema=schema)
+        tables[name] = tables[table.full_table_name] = table
+        return table
+
+    def delete_table(name, **_):
+        table = tables.pop(name)
+        tables.pop(table.full_table_name, None)
+
+    t = md.DataFrame(pd.DataFrame({"a": [1.0, 2.0]})).data
+    with mock.patch.object(
+        odps_entry, "exist_table", side_effect=lambda name: name in tables
+    ), mock.patch.object(
+        odps_entry, "create_table", side_effect=create_table
+    ), mock.patch.object(
+        odps_entry, "delete_table", side_effect=delete_table
+    ), mock.patch.object(
+        odps_entry, "get_table", side_effect=lambda name: tables[name]
+    ), mock.patch.object(
+        MaxFrameSession, "_write_pandas_data"
+    ):
+        meta_cache = get_meta_cache(odps_entry)
+        schema, table_meta = pandas_to_odps_schema(t, unknown_as_string=True)
+        table_name = isolated_session._upload_pandas_table(t, schema, table_meta)
+        assert meta_cache.get_table(table_name).table_schema is schema
+
+        # table re-created with a different schema
+        new_schema, _ = pandas_to_odps_schema(
+            md.DataFrame(pd.DataFrame({"a": ["x"]})).data, unknown_as_string=True
+        )
+        table_meta.table_name = table_name
+        assert (
+            isolated_session._upload_pandas_table(t, new_schema, table_meta)
+            == table_name
+        )
+        assert meta_cache.get_table(table_name).table_schema is new_schema
+
+
+def test_local_framedriver_delta_submission(local_service):
+    driver, session, root_dir = local_service
+    isolated_session = session._isolated_session
+
+    df = md.DataFrame(mt.random.rand(20, 4), columns=list("abcd")) + 1
+    with option_context({"session.enable_delta_submission": True}):
+        # operators of cancelled DAGs are not recorded as submitted
+        info = df.execute(session=session, wait=False)
+
+        async def cancel_and_wait():
+            info.aio_task.cancel()
+            await asyncio.wait([info.aio_task])
+
+        asyncio.run_coroutine_threadsafe(cancel_and_wait(), info.loop).result()
+        assert driver.request_counts["cancel_dag"] == 1
+        assert not isolated_session._submitted_op_keys
+
+        df2 = md.DataFrame(mt.random.rand(20, 4), columns=list("abcd")) * 2
+        expected = pd.DataFrame(np.random.rand(20, 4), columns=list("abcd"))
+        driver.stage_dataframe_result(df2, expected, root_dir)
+        df2.execute(session=session)
+        assert df2.key in isolated_session._submitted_tileable_to_op_keys
+        assert df.key not in isolated_session._submitted_tileable_to_op_keys
+
+
+def test_local_framedriver_iterbatch(local_service):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    driver.stage_dataframe_result(df, expected, root_dir)
+    df.execute(session=session)
+
+    batches = list(df.iterbatch(batch_size=30, session=session))
+    assert [len(b) for b in batches] == [30, 30, 30, 10]
+    pd.testing.assert_frame_equal(pd.concat(batches), expected)
+
+    # batches are streamed when fetching with batch sizes
+    with mock.patch.object(
+        SyncSession, "iter_fetch", autospec=True, side_effect=SyncSession.iter_fetch
+    ) as iter_fetch:
+        pd.testing.assert_frame_equal(df.fetch(session=session), expected)
+        assert iter_fetch.call_count == 0
+        pd.testing.assert_frame_equal(
+            df.fetch(batch_size=30, session=session), expected
+        )
+        assert iter_fetch.call_count == 1
+
+
+def test_local_framedriver_fetch_cache(local_service, tmp_path_factory):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    result_info = driver.stage_dataframe_result(df, expected, root_dir)
+    df.execute(session=session)
+
+    cache_dir = str(tmp_path_factory.mktemp("fetch_cache"))
+    with option_context(
+        {"session.enable_fetch_cache": True, "session.fetch_cache_dir": cache_dir}
+    ):
+        cache = get_fetch_cache()
+        pd.testing.assert_frame_equal(df.fetch(session=session), expected)
+        pd.testing.assert_frame_equal(
+            df.iloc[10:20].fetch(session=session), expected.iloc[10:20]
+        )
+        assert len(cache) == 2
+
+        # cached results are used even if the table is removed
+        table_dir = os.path.join(root_dir, "tables", result_info.full_table_name)
+        shutil.rmtree(table_dir)
+        pd.testing.assert_frame_equal(df.fetch(session=session), expected)
+        pd.testing.assert_frame_equal(
+            df.iloc[10:20].fetch(session=session), expected.iloc[10:20]
+        )
+
+        session.decref(df.key)
+        assert len(cache) == 0
+
+
+def test_local_framedriver_repr(local_service):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(1000, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(1000, 4), columns=list("abcd"))
+    driver.stage_dataframe_result(df, expected, root_dir)
+    df.execute(session=session)
+
+    with mock.patch.object(
+        LocalTableIO,
+        "open_reader",
+        autospec=True,
+        side_effect=LocalTableIO.open_reader,
+    ) as open_reader:
+        assert repr(df) == repr(expected)
+        assert open_reader.call_count == 1
+        # head and tail rows are read with one reader
+        assert len(open_reader.call_args[1]["ranges"]) == 2
+
+        # corner data is memoized without referencing sessions
+        assert str(df) == str(expected)
+        df._repr_html_()
+        assert open_reader.call_count == 1
+        assert df.data._corner_data[0] == session.session_id
+
+        with pd.option_context("display.max_rows", 20, "display.min_rows", 4):
+            assert repr(df) == repr(expected)
+        assert open_reader.call_count == 2
+
+        # executing again drops memoized data
+        driver.stage_dataframe_result(df, expected, root_dir)
+        df.execute(session=session)
+        assert repr(df) == repr(expected)
+        assert open_reader.call_count == 3
+
+    # corners of projected tileables are fetched as head and tail
+    projected = df[["a", "c"]]
+    assert session.can_fetch_corner(df)
+    assert not session.can_fetch_corner(projected)
+    with mock.patch.object(MaxFrameSession, "fetch_corner", side_effect=AssertionError):
+        corner_data = fetch_corner_data(projected, session=session)
+    expected_projected = expected[["a", "c"]]
+    pd.testing.assert_frame_equal(
+        corner_data, pd.concat([expected_projected[:6], expected_projected[-6:]])
+    )
+
+
+@pytest.mark.parametrize("memory_budget", [1024, None])
+def test_local_framedriver_fetch_multiple(local_service, memory_budget):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    driver.stage_dataframe_result(df, expected, root_dir)
+    s = df["a"] + 1
+    expected_s = pd.Series(np.random.rand(100), name="a")
+    driver.stage_dataframe_result(s, expected_s, root_dir)
+    session.execute(df, s)
+
+    with mock.patch.object(
+        LocalTableIO,
+        "open_reader",
+        autospec=True,
+        side_effect=LocalTableIO.open_reader,
+    ) as open_reader, option_context(
+        {
+            "session.fetch_tileable_concurrency": 2,
+            "session.fetch_memory_budget": memory_budget,
+        }
+    ):
+        results = session.fetch(df, s, df.iloc[10:20], df, df.iloc[10:20])
+        # duplicated tileables are fetched only once
+        assert open_reader.call_count == 3
+
+    pd.testing.assert_frame_equal(results[0], expected)
+    pd.testing.assert_series_equal(results[1], expected_s)
+    pd.testing.assert_frame_equal(results[2], expected.iloc[10:20])
+    pd.testing.assert_frame_equal(results[3], expected)
+    pd.testing.assert_frame_equal(results[4], expected.iloc[10:20])
+    assert results[0] is not results[3]
+
+
+def test_local_framedriver_fetch_multiple_error(local_service):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    driver.stage_dataframe_result(df, expected, root_dir)
+    session.execute(df)
+
+    cancelled_indexes = []
+
+    async def fetch_or_fail(self, tileable, info, indexes):
+        if indexes is not None:
+            raise SystemError("Fetch failed")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled_indexes.append(indexes)
+            raise
+
+    with mock.patch.object(ODPSTableFetcher, "fetch", new=fetch_or_fail):
+        with pytest.raises(SystemError):
+            session.fetch(df, df.iloc[10:20])
+    # fetching other tileables is cancelled once one of them fails
+    assert cancelled_indexes == [None]
+
+
+def test_local_framedriver_fetch_to_file(local_service, tmp_path_factory):
+    driver, session, root_dir = local_service
+    out_dir = tmp_path_factory.mktemp("fetch_to_file")
+
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    expected["e"] = [f"k{i % 3}" for i in range(100)]
+    expected.index.name = "idx"
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    df["e"] = df["a"].astype(str)
+    df = df.rename_axis("idx")
+    driver.stage_dataframe_result(df, expected, root_dir)
+    df.execute(session=session)
+
+    with mock.patch(
+        "maxframe_client.fetcher.arrow_to_pandas", side_effect=AssertionError
+    ):
+        path = str(out_dir / "data.parquet")
+        df.fetch_to_file(path, row_group_size=30, session=session)
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_row_groups == 4
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(path), expected.reset_index(), check_dtype=False
+        )
+
+        path = str(out_dir / "data.csv")
+        df.iloc[10:20].fetch_to_file(path, format="csv", index=False, session=session)
+        pd.testing.assert_frame_equal(
+            pd.read_csv(path), expected.iloc[10:20].reset_index(drop=True)
+        )
+
+        path = str(out_dir / "partitioned")
+        df.fetch_to_file(path, format="arrow", partition_cols=["e"], session=session)
+        assert sorted(os.listdir(path)) == ["e=k0", "e=k1", "e=k2"]
+
+    # stepped slices are fetched as a whole
+    path = str(out_dir / "stepped.arrow")
+    df.iloc[::3].fetch_to_file(path, format="arrow", session=session)
+    with pa.memory_map(path) as source:
+        result = pa.ipc.open_file(source).read_all().to_pandas()
+    pd.testing.assert_frame_equal(result, expected.iloc[::3].reset_index())
+
+    with pytest.raises(ValueError):
+        df.fetch_to_file(str(out_dir / "data.json"), format="json", session=session)
+
+
+def test_local_framedriver_fetch_pushdown(local_service):
+    driver, session, root_dir = local_service
+
+    df = md.DataFrame(mt.random.rand(100, 4), columns=list("abcd")) + 1
+    expected = pd.DataFrame(np.random.rand(100, 4), columns=list("abcd"))
+    expected.iloc[::7, 0] = np.nan
+    driver.stage_dataframe_result(df, expected, root_dir)
+    df.execute(session=session)
+
+    with mock.patch.object(
+        LocalTableIO,
+        "open_reader",
+        autospec=True,
+        side_effect=LocalTableIO.open_reader,
+    ) as open_reader:
+        pd.testing.assert_frame_equal(
+            df[["c", "a"]].fetch(session=session), expected[["c", "a"]]
+        )
+        assert open_reader.call_args[1]["columns"] == ["_idx_0", "c", "a"]
+
+        pd.testing.assert_series_equal(
+            df["b"].iloc[10:20].fetch(session=session), expected["b"].iloc[10:20]
+        )
+        assert open_reader.call_args[1]["columns"] == ["_idx_0", "b"]
+        assert open_reader.call_args[1]["stop"] == 20
+
+        pd.testing.assert_frame_equal(
+            df[df["a"] != 0.5].fetch(session=session),
+            expected[expected["a"] != 0.5],
+        )
+        filtered = df[(df["a"] > 0.3) & (df["b"] <= 0.6) | (df["c"] == 1)]
+        expected_filtered = expected[
+            (expected["a"] > 0.3) & (expected["b"] <= 0.6) | (expected["c"] == 1)
+        ]
+        pd.testing.assert_frame_equal(
+            filtered[["d"]].fetch(session=session), expected_filtered[["d"]]
+        )
+        # columns only used in filters are also read
+        assert open_reader.call_args[1]["columns"] == ["_idx_0", "d", "a", "b", "c"]
+
+        sub_df, expected_sub = df[["b", "c"]], expected[["b", "c"]]
+        pd.testing.assert_series_equal(
+            sub_df[sub_df["c"] < 0.5]["b"].fetch(session=session),
+            expected_sub[expected_sub["c"] < 0.5]["b"],
+        )
+        # rows selected by integers are squeezed
+        pd.testing.assert_series_equal(
+            df.iloc[5].fetch(session=session), expected.iloc[5]
+        )
+        pd.testing.assert_series_equal(
+            df.iloc[5, 1:3].fetch(session=session), expected.iloc[5, 1:3]
+        )
+        assert df["b"].iloc[5].fetch(session=session) == expected["b"].iloc[5]
+        assert driver.request_counts["submit_dag"] == 1
+
+    # rows sliced after filtering cannot be pushed down
+    with pytest.raises(ValueError):
+        df[df["a"] > 0.5].iloc[:3].fetch(session=session)
+    with pytest.raises(ValueError):
+        df[df["a"] > df["b"]].fetch(session=session)
+    # comparisons between incompatible types cannot be pushed down
+    with pytest.raises(ValueError):
+        df[df["a"] == "x"].fetch(session=session)
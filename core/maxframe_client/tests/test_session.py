@@ -30,7 +30,7 @@ from maxframe.errors import NoTaskServerResponseError
 from maxframe.lib.aio import stop_isolation
 from maxframe.protocol import ResultInfo
 from maxframe.serialization import RemoteException
-from maxframe.session import new_session
+from maxframe.session import Profiling, new_session
 from maxframe.tests.utils import ensure_table_deleted, tn
 from maxframe.utils import build_temp_table_name
 from maxframe_framedriver.app.tests.test_framedriver_webapp import (  # noqa: F401
@@ -38,7 +38,7 @@ from maxframe_framedriver.app.tests.test_framedriver_webapp import (  # noqa: F4
 )
 
 from ..clients.framedriver import FrameDriverClient
-from ..session.odps import MaxFrameRestCaller
+from ..session.odps import MaxFrameRestCaller, MaxFrameSession
 
 pytestmark = pytest.mark.maxframe_engine(["MCSQL", "SPE"])
 
@@ -87,22 +87,23 @@ def test_simple_run_dataframe(start_mock_session):
         dag: TileableGraph,
         managed_input_infos: Dict[str, ResultInfo] = None,
         new_settings: Dict[str, Any] = None,
+        profiling: Profiling = None,
     ):
         assert len(dag) == 2
         return await original_submit_dag(
-            self, session_id, dag, managed_input_infos, new_settings
+            self, session_id, dag, managed_input_infos, new_settings, profiling
         )
 
     no_task_server_raised = False
-    original_get_dag_info = MaxFrameRestCaller.get_dag_info
+    original_wait_dag = MaxFrameRestCaller.wait_dag
 
-    async def patched_get_dag_info(self, dag_id: str):
+    async def patched_wait_dag(self, dag_id: str, timeout: float):
         nonlocal no_task_server_raised
 
         if not no_task_server_raised:
             no_task_server_raised = True
             raise NoTaskServerResponseError
-        return await original_get_dag_info(self, dag_id)
+        return await original_wait_dag(self, dag_id, timeout)
 
     df["H"] = "extra_content"
 
@@ -110,12 +111,13 @@ def test_simple_run_dataframe(start_mock_session):
         "maxframe_client.clients.framedriver.FrameDriverClient.submit_dag",
         new=patched_submit_dag,
     ), mock.patch(
-        "maxframe_client.session.odps.MaxFrameRestCaller.get_dag_info",
-        new=patched_get_dag_info,
+        "maxframe_client.session.odps.MaxFrameRestCaller.wait_dag",
+        new=patched_wait_dag,
     ):
         result = df.execute().fetch()
         assert len(result) == 1000
         assert len(result.columns) == 8
+    assert no_task_server_raised
 
     corner_top, corner_bottom = ExecutableTuple([df.iloc[:10], df.iloc[-10:]]).fetch()
     assert len(corner_top) == len(corner_bottom) == 10
@@ -212,6 +214,71 @@ def test_run_dataframe_with_pd_source(start_mock_session):
         )
 
 
+def test_run_dataframe_with_identical_pd_sources(start_mock_session):
+    odps_entry = ODPS.from_environments()
+
+    pd_df = pd.DataFrame(np.random.rand(1000, 5), columns=list("ABCDE"))
+    df1 = md.DataFrame(pd_df)
+    src_key = df1.key
+
+    try:
+        with mock.patch.object(
+            MaxFrameSession,
+            "_write_pandas_data",
+            side_effect=MaxFrameSession._write_pandas_data,
+            autospec=True,
+        ) as write_mock:
+            pd.testing.assert_frame_equal((df1 + 1).execute().fetch(), pd_df + 1)
+            assert write_mock.call_count == 1
+
+            # identical data is not uploaded again
+            df2 = md.DataFrame(pd_df.copy())
+            pd.testing.assert_frame_equal((df2 * 2).execute().fetch(), pd_df * 2)
+            assert write_mock.call_count == 1
+
+            # uploaded data is kept when df2 still reuses it
+            del df1
+            time.sleep(5)
+            pd.testing.assert_frame_equal((df2 + 3).execute().fetch(), pd_df + 3)
+            assert write_mock.call_count == 1
+
+            # uploaded data is purged after all decref-ed and cannot be reused
+            del df2
+            time.sleep(5)
+            df3 = md.DataFrame(pd_df)
+            pd.testing.assert_frame_equal((df3 - 1).execute().fetch(), pd_df - 1)
+            assert write_mock.call_count == 2
+    finally:
+        odps_entry.delete_table(
+            build_temp_table_name(start_mock_session, src_key), if_exists=True
+        )
+
+
+def test_execution_profiling(start_mock_session):
+    pd_df = pd.DataFrame(np.random.rand(1000, 5), columns=list("ABCDE"))
+    df = md.DataFrame(pd_df) + 1
+
+    with option_context({"client.log_profiling": True}):
+        info = df.execute(wait=False)
+        info.result()
+
+    stages = info.profiling_result()["stages"]
+    stage_names = [stage["name"] for stage in stages]
+    assert stage_names == [
+        "build_graph",
+        "upload",
+        "serialize",
+        "submit",
+        "wait",
+        "update_meta",
+    ]
+    assert all(stage["duration"] >= 0 for stage in stages)
+    name_to_stage = {stage["name"]: stage for stage in stages}
+    assert name_to_stage["upload"]["n_sources"] == 1
+    assert name_to_stage["serialize"]["bytes"] > 0
+    assert name_to_stage["wait"]["n_polls"] >= 1
+
+
 def test_run_dataframe_from_to_odps_table(start_mock_session):
     odps_entry = ODPS.from_environments()
 